@@ -1,5 +1,6 @@
-from imports import *
+from core_imports import *
 from constants import *
+from db_connection import *
 
 class AVITDScraper:
     """
@@ -8,7 +9,6 @@ class AVITDScraper:
 
     def __init__(self):
         self.url = "https://aviewinthedark.net/"
-        self.connection = sqlite3.connect(DB_PATH)
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
         }
@@ -99,7 +99,7 @@ class AVITDScraper:
         scrape_timestamp = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
 
         try:
-            with sqlite3.connect(DB_PATH) as conn:
+            with db_writer() as conn:
                 cursor = conn.cursor()
 
                 if table == "guilds":
@@ -147,14 +147,7 @@ class AVITDScraper:
                         ("Peacekeepers Mission 3", "Emerald", "33rd", next_update, scrape_timestamp),
                     ])
 
-                conn.commit()
                 logging.info(f"Database updated for {table}.")
 
         except sqlite3.Error as e:
             logging.error(f"Database operation for {table} failed: {e}")
-
-    def close_connection(self):
-        """Close the SQLite connection if it's open."""
-        if self.connection:
-            self.connection.close()
-            logging.debug("AVITDScraper database connection closed.")
\ No newline at end of file
@@ -0,0 +1,289 @@
+"""
+Coordinate decoder benchmark.
+
+Compares MapModel.extract_coordinates, now backed by the table-driven decode_coordinates,
+against the per-zoom if-chains it replaced, on a corpus of page snapshots. Every snapshot must
+decode to identical coordinates and the new method must not be slower. Exits with code 1 otherwise.
+Both methods run with the application's logging setup, as they do in the map. The bare decoder
+timings are printed for reference.
+
+Pages without coordinate inputs made the old method raise TypeError at zoom 5 and 7; the new one
+returns None for the missing coordinates instead. Those pages are counted but not compared.
+
+The default corpus covers every corner and edge case of the city limits plus interior positions
+at zoom levels 3, 5 and 7. Saved game pages can be added with --pages DIR (*.html files).
+
+Run from anywhere:
+    python benchmarks/bench_coordinate_decoder.py [--pages DIR] [--repeat N]
+"""
+
+import argparse
+import glob
+import os
+import sys
+import timeit
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+os.chdir(REPO_ROOT)  # Logs and DB_PATH are relative to the repository root
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from map_model import *
+from bootstrap import bootstrap
+
+ZOOM_LEVELS = (3, 5, 7)
+
+
+class LegacyDecoder:
+    """The extract_coordinates method as it was before the table-driven decoder, kept verbatim as the reference."""
+
+    def __init__(self, zoom_level: int) -> None:
+        self.zoom_level = zoom_level
+
+    def extract_coordinates(self, snapshot):
+        """
+        Work out the character's coordinates from a page snapshot.
+
+        Args:
+            snapshot (PageSnapshot): Analysed game page.
+
+        Returns:
+            tuple: (x, y) of the character, or (None, None) if the page has no coordinate inputs.
+        """
+        # Intersection label (like "Aardvark and 1st")
+        text = snapshot.intersect
+
+        # Number of city limit cells
+        city_limit_count = snapshot.cityblocks
+
+        # First x/y (center of grid) and the largest x/y on the page
+        first_x, first_y = snapshot.first_x, snapshot.first_y
+        last_x, last_y = snapshot.last_x, snapshot.last_y
+
+        logging.debug(f"First detected coordinate: x={first_x}, y={first_y}")
+        logging.debug(f"Last detected coordinate: x={last_x}, y={last_y}")
+
+        if city_limit_count:
+            logging.debug(f"Found {city_limit_count} city limit blocks.")
+
+            if self.zoom_level == 3:
+                if text == "Aardvark and 1st" and city_limit_count == 5:
+                    logging.debug("Top-left corner detected with full border row: Aardvark and 1st")
+                    return -1, -1
+
+                if text == "Zestless and 1st" and city_limit_count == 5:
+                    logging.debug("Top-right corner detected: Zestless and 1st")
+                    return 198, -1
+
+                if text == "Aardvark and 100th" and city_limit_count == 5:
+                    logging.debug("Bottom-left corner detected: Aardvark and 100th")
+                    return -1, 198
+
+                if text == "Zestless and 100th" and city_limit_count == 5:
+                    logging.debug("Bottom-right corner detected: Zestless and 100th")
+                    return 198, 198
+
+                # Adjust for Aardvark and NCL
+                if city_limit_count == 3 and first_y == 0 and first_x == 0 and last_x == 2 and last_y == 1:
+                    logging.debug(f"Detected Cell 0,1.")
+                    return 0, -1
+
+                # Adjust for WCL and 1st (0,1)
+                if city_limit_count == 3 and first_y == 0 and first_x == 0:
+                    logging.debug(f"Detected Cell 0,1.")
+                    return -1, 0
+
+                # Adjust for ON Zestless and 1st (198,1)
+                if city_limit_count == 3 and first_x == 198 and first_y == 0:
+                    logging.debug("Detected special case: on Zestless and 1st")
+                    return first_x, first_y
+
+                # Adjust for Northern Edge (Y=0)
+                if city_limit_count == 3 and first_y == 0:
+                    logging.debug(f"Detected Northern City Limit at y={first_y}")
+                    return first_x, -1
+
+                # Adjust for Western Edge (X=0)
+                if city_limit_count == 3 and first_x == 0:
+                    logging.debug(f"Detected Western City Limit at x={first_x}")
+                    return -1, first_y
+
+                # If no adjustments, return detected values
+                return first_x, first_y
+
+            if self.zoom_level == 5:
+                if text == "Aardvark and 1st" and city_limit_count == 5:
+                    logging.debug("Top-left corner detected with full border row: Aardvark and 1st")
+                    return -2, -2
+
+                if text == "Zestless and 1st" and city_limit_count == 5:
+                    logging.debug("Top-right corner detected: Zestless and 1st")
+                    return 197, -2
+
+                if text == "Aardvark and 100th" and city_limit_count == 5:
+                    logging.debug("Bottom-left corner detected: Aardvark and 100th")
+                    return -2, 197
+
+                if text == "Zestless and 100th" and city_limit_count == 5:
+                    logging.debug("Bottom-right corner detected: Zestless and 100th")
+                    return 197, 197
+
+                # Adjust for Aardvark and NCL (1,0)
+                if city_limit_count == 3 and first_y == 0 and first_x == 0 and last_x == 2 and last_y == 1:
+                    logging.debug(f"Detected Cell 1,0.")
+                    return -1, -2
+
+                # Adjust for WCL and 1st (0,1)
+                if city_limit_count == 3 and first_y == 0 and first_x == 0:
+                    logging.debug(f"Detected Cell 0,1.")
+                    return -2, -1
+
+                # Adjust for ON Zestless and 1st (198,1)
+                if city_limit_count == 3 and first_x == 198 and first_y == 0:
+                    logging.debug("Detected special case: on Zestless and 1st")
+                    return first_x - 1, first_y - 1
+
+                # Adjust for Northern Edge (Y=0)
+                if city_limit_count == 3 and first_y == 0:
+                    logging.debug(f"Detected Northern City Limit at y={first_y}")
+                    return first_x - 1, -2
+
+                # Adjust for Western Edge (X=0)
+                if city_limit_count == 3 and first_x == 0:
+                    logging.debug(f"Detected Western City Limit at x={first_x}")
+                    return -2, first_y - 1
+
+                return first_x - 1, first_y - 1
+
+            if self.zoom_level == 7:
+                if text == "Aardvark and 1st" and city_limit_count == 5:
+                    logging.debug("Top-left corner detected with full border row: Aardvark and 1st")
+                    return -3, -3
+
+                if text == "Zestless and 1st" and city_limit_count == 5:
+                    logging.debug("Top-right corner detected: Zestless and 1st")
+                    return 196, -3
+
+                if text == "Aardvark and 100th" and city_limit_count == 5:
+                    logging.debug("Bottom-left corner detected: Aardvark and 100th")
+                    return -3, 196
+
+                if text == "Zestless and 100th" and city_limit_count == 5:
+                    logging.debug("Bottom-right corner detected: Zestless and 100th")
+                    return 196, 196
+
+                # Adjust for Aardvark and NCL (1,0)
+                if city_limit_count == 3 and first_y == 0 and first_x == 0 and last_x == 2 and last_y == 1:
+                    logging.debug(f"Detected Cell 1,0.")
+                    return -2, -3
+
+                # Adjust for WCL and 1st (0,1)
+                if city_limit_count == 3 and first_y == 0 and first_x == 0:
+                    logging.debug(f"Detected Cell 0,1.")
+                    return -3, -2
+
+                # Adjust for ON Zestless and 1st (198,1)
+                if city_limit_count == 3 and first_x == 198 and first_y == 0:
+                    logging.debug("Detected special case: on Zestless and 1st")
+                    return first_x - 2, first_y - 2
+
+                # Adjust for Northern Edge (Y=0)
+                if city_limit_count == 3 and first_y == 0:
+                    logging.debug(f"Detected Northern City Limit at y={first_y}")
+                    return first_x - 2, -3
+
+                # Adjust for Western Edge (X=0)
+                if city_limit_count == 3 and first_x == 0:
+                    logging.debug(f"Detected Western City Limit at x={first_x}")
+                    return -3, first_y - 2
+
+                return first_x - 2, first_y - 2
+
+        logging.debug(f"Safe Fallback: x={first_x}, y={first_y}")
+        return first_x, first_y
+
+
+class TableDecoder:
+    """Minimal stand-in for MapModel carrying only the state extract_coordinates reads."""
+
+    extract_coordinates = MapModel.extract_coordinates
+
+    def __init__(self, zoom_level: int) -> None:
+        self.zoom_level = zoom_level
+
+
+def build_corpus(pages_dir: str | None) -> list:
+    """Snapshots covering every decoding rule, plus any saved pages."""
+    corpus = []
+    corners = ["Aardvark and 1st", "Zestless and 1st", "Aardvark and 100th", "Zestless and 100th"]
+    grids = [
+        (0, 0, 2, 1), (0, 0, 1, 2), (198, 0, 199, 1), (57, 0, 59, 1),
+        (0, 83, 1, 85), (120, 44, 122, 46), (1, 1, 3, 3), (199, 199, 200, 200), (None, None, None, None),
+    ]
+    for intersect in corners + ["Nickel and 55th", ""]:
+        for cityblocks in (0, 3, 5, 7):
+            for first_x, first_y, last_x, last_y in grids:
+                corpus.append(PageSnapshot(intersect=intersect, cityblocks=cityblocks, first_x=first_x,
+                                           first_y=first_y, last_x=last_x, last_y=last_y))
+
+    if pages_dir:
+        for path in sorted(glob.glob(os.path.join(pages_dir, "*.html"))):
+            with open(path, encoding="utf-8") as page_file:
+                corpus.append(PageSnapshot.from_html(page_file.read()))
+
+    return corpus
+
+
+def time_calls(decoders: dict, cases: list, repeat: int, decode) -> float:
+    """Best-of-five seconds per call of decode(decoder, snapshot) over all cases."""
+    def run():
+        for snapshot, zoom_level in cases:
+            decode(decoders[zoom_level], snapshot)
+
+    return min(timeit.repeat(run, number=repeat, repeat=5)) / (len(cases) * repeat)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", help="Directory of saved game pages (*.html) to add to the corpus")
+    parser.add_argument("--repeat", type=int, default=20, help="Passes over the corpus per timing run")
+    args = parser.parse_args()
+
+    bootstrap()  # File logging, as in the app
+    legacy = {zoom_level: LegacyDecoder(zoom_level) for zoom_level in ZOOM_LEVELS}
+    table = {zoom_level: TableDecoder(zoom_level) for zoom_level in ZOOM_LEVELS}
+
+    corpus = build_corpus(args.pages)
+    cases, legacy_errors, mismatches = [], 0, []
+    for snapshot in corpus:
+        for zoom_level in ZOOM_LEVELS:
+            try:
+                expected = legacy[zoom_level].extract_coordinates(snapshot)
+            except TypeError:
+                legacy_errors += 1
+                continue
+            cases.append((snapshot, zoom_level))
+            result = table[zoom_level].extract_coordinates(snapshot)
+            if result != expected:
+                mismatches.append((snapshot, zoom_level, result, expected))
+
+    for snapshot, zoom_level, result, expected in mismatches[:10]:
+        print(f"MISMATCH zoom {zoom_level}: {snapshot} -> {result}, expected {expected}")
+
+    legacy_time = time_calls(legacy, cases, args.repeat, lambda decoder, snapshot: decoder.extract_coordinates(snapshot))
+    table_time = time_calls(table, cases, args.repeat, lambda decoder, snapshot: decoder.extract_coordinates(snapshot))
+    decoder_time = time_calls({zoom_level: zoom_level for zoom_level in ZOOM_LEVELS}, cases, args.repeat * 10,
+                              lambda zoom_level, snapshot: decode_coordinates(snapshot, zoom_level))
+
+    print(f"Corpus: {len(corpus)} snapshots x {len(ZOOM_LEVELS)} zoom levels = {len(cases)} cases "
+          f"({legacy_errors} skipped where the old method raised)")
+    print(f"Old extract_coordinates: {legacy_time * 1e6:.2f} us/call")
+    print(f"New extract_coordinates: {table_time * 1e6:.2f} us/call")
+    print(f"decode_coordinates only: {decoder_time * 1e6:.2f} us/call")
+    print(f"Identical results: {'yes' if not mismatches else f'NO ({len(mismatches)} mismatches)'}")
+
+    sys.exit(0 if not mismatches and table_time <= legacy_time else 1)
+
+
+if __name__ == "__main__":
+    main()
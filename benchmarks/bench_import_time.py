@@ -0,0 +1,146 @@
+"""
+Import-time budget benchmark.
+
+Imports each module in a fresh interpreter under `python -X importtime` and checks that:
+- the import stays within its time budget (best of --runs, cumulative import time of the module)
+- modules meant for tools and workers do not pull in Qt widgets or Qt WebEngine
+- importing creates no files, so directories, logging and the database are left to bootstrap()
+
+Each import runs in an empty temporary directory so any file it creates shows up. Exits with code
+1 if a budget or check fails, and prints the slowest imports below each failing module.
+
+Run from anywhere:
+    python benchmarks/bench_import_time.py [--runs N] [--scale X] [module ...]
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Cumulative import time allowed per module, in milliseconds
+IMPORT_BUDGET_MS = {
+    "core_imports": 600,
+    "db_connection": 650,
+    "write_behind": 650,
+    "settings_store": 650,
+    "http_cache": 650,
+    "scraper": 650,
+    "scrape_worker": 650,
+    "scrape_scheduler": 900,
+    "avitd_scraper": 650,
+    "street_index": 650,
+    "nearest_grid": 650,
+    "transit_router": 650,
+    "page_extractor": 650,
+    "coordinate_decoder": 650,
+    "seed_data": 650,
+    "database": 900,
+    "bootstrap": 900,
+    "minimap_atlas": 900,
+    "map_model": 900,
+    "minimap_renderer": 900,
+    "frame_scheduler": 650,
+    "minimap_render_worker": 900,
+    "imports": 2000,
+    "rbc_community_map": 2500,
+}
+
+# Modules that must stay importable without the GUI stack
+GUI_MODULES = ("PySide6.QtWidgets", "PySide6.QtWebEngineCore", "PySide6.QtWebEngineWidgets")
+GUI_FREE_MODULES = {
+    "core_imports", "db_connection", "write_behind", "settings_store", "http_cache", "scraper", "avitd_scraper",
+    "street_index", "nearest_grid", "transit_router", "page_extractor", "coordinate_decoder",
+    "seed_data", "database", "scrape_worker", "scrape_scheduler", "bootstrap",
+    "minimap_atlas", "map_model", "minimap_renderer", "frame_scheduler",
+    "minimap_render_worker",
+}
+
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)")
+
+
+def measure(module: str) -> dict:
+    """
+    Import a module once in a fresh interpreter.
+
+    Returns:
+        dict: "ok", "error", "cumulative_ms", "imported" (module -> (self_ms, cumulative_ms)) and
+        "created" (files left in the working directory).
+    """
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT, QT_QPA_PLATFORM="offscreen")
+    with tempfile.TemporaryDirectory() as workdir:
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=workdir, env=env, capture_output=True, text=True
+        )
+        created = sorted(os.listdir(workdir))
+
+    imported = {}
+    errors = []
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, _, name = match.groups()
+            imported[name] = (int(self_us) / 1000, int(cumulative_us) / 1000)
+        elif not line.startswith("import time:"):
+            errors.append(line)
+
+    return {
+        "ok": result.returncode == 0,
+        "error": "\n".join(errors[-3:]),
+        "cumulative_ms": imported.get(module, (0.0, 0.0))[1],
+        "imported": imported,
+        "created": created,
+    }
+
+
+def check(module: str, runs: int, scale: float) -> bool:
+    """Measure a module, print its line of the report and return True if it passed every check."""
+    best = None
+    for _ in range(runs):
+        result = measure(module)
+        if not result["ok"]:
+            print(f"{module:>20}: import failed\n{result['error']}")
+            return False
+        if best is None or result["cumulative_ms"] < best["cumulative_ms"]:
+            best = result
+
+    budget = IMPORT_BUDGET_MS.get(module, 0) * scale
+    problems = []
+    if budget and best["cumulative_ms"] > budget:
+        problems.append("over budget")
+    if module in GUI_FREE_MODULES:
+        gui = [name for name in GUI_MODULES if name in best["imported"]]
+        if gui:
+            problems.append(f"imports {', '.join(gui)}")
+    if best["created"]:
+        problems.append(f"created {', '.join(best['created'])} on import")
+
+    budget_text = f"{budget:.0f} ms" if budget else "none"
+    print(f"{module:>20}: {best['cumulative_ms']:8.1f} ms (budget {budget_text}, {len(best['imported'])} modules)"
+          f"  [{'; '.join(problems) or 'OK'}]")
+
+    if problems:
+        slowest = sorted(best["imported"].items(), key=lambda item: item[1][0], reverse=True)[:8]
+        for name, (self_ms, cumulative_ms) in slowest:
+            print(f"{'':>22}{self_ms:8.1f} ms self {cumulative_ms:8.1f} ms cumulative  {name}")
+    return not problems
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("modules", nargs="*", help="Modules to check (default: every module with a budget)")
+    parser.add_argument("--runs", type=int, default=5, help="Imports per module; the fastest one counts")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiply every budget, e.g. for slow machines")
+    args = parser.parse_args()
+
+    results = [check(module, args.runs, args.scale) for module in args.modules or IMPORT_BUDGET_MS]
+    sys.exit(0 if all(results) else 1)
+
+
+if __name__ == "__main__":
+    main()
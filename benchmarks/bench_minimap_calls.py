@@ -0,0 +1,114 @@
+"""
+Minimap regression benchmark.
+
+Counts how often the find_nearest_* helpers run while MinimapRenderer draws a single frame and
+times the frame. The overlay stage used to sit inside the places-of-interest loop, which repeated every nearest
+search once per POI on each repaint. This script fails (exit code 1) if the call count per frame
+exceeds the budget again.
+
+Run from anywhere:
+    python benchmarks/bench_minimap_calls.py [--frames N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+os.chdir(REPO_ROOT)  # DB_PATH and the grid cache are relative to the repository root
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from map_model import *
+from minimap_renderer import *
+from bootstrap import bootstrap
+
+# Nearest searches allowed per frame: one each for the tavern, bank and transit lines. Compass routes
+# are drawn from the planned path and must not add any.
+NEAREST_CALL_BUDGET = {
+    "no destination": 3,
+    "direct route": 3,
+    "transit route": 3,
+}
+
+
+class MinimapBench(MapModel):
+    """MapModel that counts its nearest-location searches."""
+
+    nearest_calls = 0
+
+    def find_nearest_tavern(self, x, y):
+        self.nearest_calls += 1
+        return super().find_nearest_tavern(x, y)
+
+    def find_nearest_bank(self, x, y):
+        self.nearest_calls += 1
+        return super().find_nearest_bank(x, y)
+
+    def find_nearest_transit(self, x, y):
+        self.nearest_calls += 1
+        return super().find_nearest_transit(x, y)
+
+
+def configure(bench: MinimapBench, scenario: str) -> None:
+    """Set destination and selected route state for a scenario."""
+    bench.destination = None
+    bench.selected_route_label = None
+    bench.selected_route_path = None
+    if scenario == "no destination":
+        return
+
+    bench.destination = (150, 150)
+    current = (bench.column_start + bench.zoom_level // 2, bench.row_start + bench.zoom_level // 2)
+    if scenario == "direct route":
+        bench.selected_route_label = "Direct Route"
+        bench.selected_route_path = [current, bench.destination]
+    else:
+        bench.selected_route_label = "Transit Route"
+        bench.selected_route_path = list(bench.transit_router.best_transit_route(current, bench.destination)[1])
+
+
+def run(frames: int) -> bool:
+    """Run every scenario and print call counts and timings. Returns True if within budget."""
+    bench = MinimapBench.from_database(zoom_level=5)
+    renderer = MinimapRenderer(bench)
+    within_budget = True
+
+    for scenario, budget in NEAREST_CALL_BUDGET.items():
+        configure(bench, scenario)
+        worst_calls = 0
+        elapsed = 0.0
+
+        for frame in range(frames):
+            # Walk diagonally across the city so the atlas has to page tiles in and out
+            bench.column_start = bench.row_start = (frame * 7) % 200
+            if bench.selected_route_path:
+                bench.selected_route_path[0] = (bench.column_start + bench.zoom_level // 2,
+                                                bench.row_start + bench.zoom_level // 2)
+            bench.nearest_calls = 0
+            start = time.perf_counter()
+            renderer.render()
+            elapsed += time.perf_counter() - start
+            worst_calls = max(worst_calls, bench.nearest_calls)
+
+        status = "OK" if worst_calls <= budget else "OVER BUDGET"
+        print(f"{scenario:>15}: {worst_calls} find_nearest_* calls/frame (budget {budget}), "
+              f"{elapsed / frames * 1000:.2f} ms/frame  [{status}]")
+        within_budget = within_budget and worst_calls <= budget
+
+    return within_budget
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=200, help="Frames to draw per scenario")
+    args = parser.parse_args()
+
+    app = PySide6.QtGui.QGuiApplication.instance() or PySide6.QtGui.QGuiApplication(sys.argv)
+    bootstrap()
+    sys.exit(0 if run(args.frames) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+"""
+Headless minimap benchmark suite.
+
+Drives MapModel and MinimapRenderer under Qt's offscreen platform, without the web view or a game
+login, and reports per-call latency percentiles for:
+- frame    MinimapRenderer.render(), the work behind draw_minimap, mostly on the render thread
+- snapshot MinimapRenderer.snapshot(), all draw_minimap leaves on the GUI thread
+- info     MapModel.info_frame_text(), the work behind update_info_frame
+- compass  MapModel.get_compass_routes() to a fixed destination
+- page     parse_page_extract, PageSnapshot.from_extract and extract_coordinates on the page extract
+           a game page at the position would produce
+
+Every zoom level is measured across a sweep of positions: the four corners, the centre and the
+densest clusters of taverns, transits, shops, guilds, user buildings and places of interest. At each
+position the view steps around a small square, so the atlas pages tiles in and out as it does while
+walking.
+
+Results are compared with the checked-in baseline in benchmarks/baselines/minimap_render.json. The
+run fails (exit code 1) if a p50 or p90 is more than --tolerance times its baseline. Timings depend
+on the machine, so refresh the baseline with --update-baseline after an intended change, on the
+machine the baseline is kept for.
+
+Run from anywhere:
+    python benchmarks/bench_minimap_render.py [--steps N] [--tolerance X] [--update-baseline]
+"""
+
+import argparse
+import gc
+import json
+import math
+import os
+import platform
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+os.chdir(REPO_ROOT)  # DB_PATH and the grid caches are relative to the repository root
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from map_model import *
+from minimap_renderer import *
+from bootstrap import bootstrap
+
+BASELINE_PATH = os.path.join(REPO_ROOT, "benchmarks", "baselines", "minimap_render.json")
+
+ZOOM_LEVELS = (3, 5, 7)
+OPERATIONS = ("frame", "snapshot", "info", "compass", "page")
+PERCENTILES = (50, 90, 99)
+CHECKED_PERCENTILES = ("p50", "p90")  # p99 and max are reported but too noisy to fail on
+MIN_SLACK_MS = 0.05  # Sub-millisecond operations may always exceed their baseline by this much
+
+FIXED_POSITIONS = {
+    "corner NW": (0, 0),
+    "corner NE": (200, 0),
+    "corner SW": (0, 200),
+    "corner SE": (200, 200),
+    "centre": (100, 100),
+}
+DENSE_POSITIONS = 3  # Densest location clusters added to the sweep
+DENSE_RADIUS = 3  # Half the edge of the window a cluster is counted in (7x7 cells, the widest zoom)
+DESTINATION = (150, 60)
+
+# Square walked around each position, one step per sample
+WALK = ((0, 0), (1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1), (0, -1), (1, -1))
+
+
+def dense_positions(model: MapModel) -> dict:
+    """Find the cells with the most labelled locations around them, at least 2 windows apart."""
+    cells = []
+    for coordinates in (model.taverns_coordinates, model.transits_coordinates, model.shops_coordinates,
+                        model.guilds_coordinates, model.user_buildings_coordinates,
+                        model.places_of_interest_coordinates):
+        cells.extend(cell for cell in coordinates.values() if None not in cell)
+
+    def density(cell):
+        return sum(1 for other in cells
+                   if max(abs(other[0] - cell[0]), abs(other[1] - cell[1])) <= DENSE_RADIUS)
+
+    picked = {}
+    for cell in sorted(set(cells), key=density, reverse=True):
+        if all(max(abs(cell[0] - x), abs(cell[1] - y)) > 4 * DENSE_RADIUS for x, y in picked.values()):
+            picked[f"dense {len(picked) + 1} ({density(cell)} labels)"] = cell
+        if len(picked) == DENSE_POSITIONS:
+            break
+    return picked
+
+
+def page_extract(x: int, y: int) -> str:
+    """The JSON PAGE_EXTRACTOR_JS returns for a game page centred on (x, y), away from the city limits."""
+    return json.dumps({
+        "intersect": "",
+        "cityblocks": 0,
+        "first_x": x,
+        "first_y": y,
+        "last_x": x + 1,
+        "last_y": y + 1,
+        "coin_text": "<td>You have 250 coins</td>",
+    })
+
+
+def move_to(model: MapModel, x: int, y: int) -> None:
+    """Centre the minimap on (x, y) and plan the compass route from there, as the app does on a page load."""
+    model.column_start = x - model.zoom_level // 2
+    model.row_start = y - model.zoom_level // 2
+    model.selected_route_label = None
+    model.selected_route_path = model.select_compass_route(*model.get_compass_routes())[2]
+
+
+def timed(samples: dict, key: tuple, call) -> object:
+    start = time.perf_counter()
+    result = call()
+    samples.setdefault(key, []).append((time.perf_counter() - start) * 1000)
+    return result
+
+
+def measure(model: MapModel, renderer: MinimapRenderer, positions: dict, steps: int) -> dict:
+    """
+    Sample every operation at every zoom level and position.
+
+    Returns:
+        dict: (operation, zoom_level) -> list of latencies in milliseconds.
+    """
+    samples = {}
+    model.destination = DESTINATION
+    for zoom_level in ZOOM_LEVELS:
+        model.zoom_level = zoom_level
+        renderer.atlas.invalidate()
+        for x, y in positions.values():
+            for step in range(steps):
+                dx, dy = WALK[step % len(WALK)]
+                move_to(model, x + dx, y + dy)
+                timed(samples, ("frame", zoom_level), renderer.render)
+                timed(samples, ("snapshot", zoom_level), renderer.snapshot)
+                timed(samples, ("info", zoom_level), model.info_frame_text)
+                timed(samples, ("compass", zoom_level), model.get_compass_routes)
+
+                extract = page_extract(x + dx, y + dy)
+                decoded = timed(samples, ("page", zoom_level), lambda: model.extract_coordinates(
+                    PageSnapshot.from_extract(parse_page_extract(extract))))
+                if decoded != (x + dx, y + dy):
+                    raise AssertionError(f"Page at {(x + dx, y + dy)} decoded to {decoded}")
+    return samples
+
+
+def summarize(latencies: list) -> dict:
+    """Nearest-rank percentiles and the maximum of a list of latencies."""
+    ordered = sorted(latencies)
+    summary = {f"p{p}": ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)] for p in PERCENTILES}
+    summary["max"] = ordered[-1]
+    return summary
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--steps", type=int, default=27, help="Samples per operation, zoom level and position")
+    parser.add_argument("--tolerance", type=float, default=1.5, help="Allowed slowdown against the baseline")
+    parser.add_argument("--update-baseline", action="store_true", help="Write the results as the new baseline")
+    args = parser.parse_args()
+
+    app = PySide6.QtGui.QGuiApplication.instance() or PySide6.QtGui.QGuiApplication(sys.argv)
+    if not bootstrap():
+        print("Database initialization failed; see the log.")
+        sys.exit(1)
+
+    model = MapModel.from_database()
+    renderer = MinimapRenderer(model)
+    positions = {**FIXED_POSITIONS, **dense_positions(model)}
+    print("Positions: " + ", ".join(f"{name} {cell}" for name, cell in positions.items()))
+
+    gc.collect()
+    samples = measure(model, renderer, positions, args.steps)
+    results = {f"{operation} zoom {zoom_level}": summarize(samples[operation, zoom_level])
+               for operation in OPERATIONS for zoom_level in ZOOM_LEVELS}
+
+    baseline = {}
+    if os.path.exists(BASELINE_PATH) and not args.update_baseline:
+        with open(BASELINE_PATH, encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)["results"]
+
+    failed = []
+    print(f"{'':>17} {'p50':>8} {'p90':>8} {'p99':>8} {'max':>8}   (ms, {len(samples['frame', 3])} samples each)")
+    for name, summary in results.items():
+        expected = baseline.get(name)
+        status = ""
+        if expected:
+            slow = [p for p in CHECKED_PERCENTILES
+                    if summary[p] > max(expected[p] * args.tolerance, expected[p] + MIN_SLACK_MS)]
+            status = f"baseline p50 {expected['p50']:.3f}  " + (f"SLOWER ({', '.join(slow)})" if slow else "OK")
+            if slow:
+                failed.append(name)
+        print(f"{name:>17} {summary['p50']:8.3f} {summary['p90']:8.3f} {summary['p99']:8.3f} {summary['max']:8.3f}   {status}")
+
+    if args.update_baseline:
+        os.makedirs(os.path.dirname(BASELINE_PATH), exist_ok=True)
+        with open(BASELINE_PATH, "w", encoding="utf-8") as baseline_file:
+            json.dump({
+                "machine": f"{platform.platform()}, {platform.processor() or platform.machine()}",
+                "python": platform.python_version(),
+                "steps": args.steps,
+                "results": {name: {key: round(value, 4) for key, value in summary.items()}
+                            for name, summary in results.items()},
+            }, baseline_file, indent=2)
+            baseline_file.write("\n")
+        print(f"Baseline written to {os.path.relpath(BASELINE_PATH, REPO_ROOT)}")
+    elif not baseline:
+        print("No baseline to compare with; run with --update-baseline to create one.")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+Game page parser benchmark.
+
+Replays a corpus of saved game pages through the parsers the map runs on every page load:
+PageSnapshot.from_html, decode_coordinates at zoom levels 3, 5 and 7, and coin_updates. Every
+page must decode to its expected coordinates and coin updates, or the run fails (exit code 1).
+Throughput is reported in pages per second, with per-page latency percentiles for the whole
+pipeline and for each parser, and the slowest pages.
+
+The corpus lives in benchmarks/fixtures/game_pages: one sanitised blood.pl page per *.html file,
+and expected.json mapping each file name to
+    "coordinates"  zoom level -> [x, y] the page decodes to
+    "coins"        CoinUpdate fields, in order, for every coin change the page reports
+It covers every city-limit corner and edge, interior positions, bank and transit screens and each
+coin message in COIN_PATTERNS, including a drink message split by <br>. To add a page, save it
+from the game, replace character names with placeholders (Vampire, Stranger), drop anything
+session related, and add its entry to expected.json.
+
+Run from anywhere:
+    python benchmarks/bench_page_parsers.py [--pages DIR] [--repeat N]
+"""
+
+import argparse
+import dataclasses
+import json
+import math
+import os
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+os.chdir(REPO_ROOT)  # Logs and DB_PATH are relative to the repository root
+
+from page_extractor import *
+from coordinate_decoder import *
+from bootstrap import bootstrap
+
+PAGES_DIR = os.path.join(REPO_ROOT, "benchmarks", "fixtures", "game_pages")
+ZOOM_LEVELS = (3, 5, 7)
+STAGES = ("parse", "decode", "coins")
+PERCENTILES = (50, 90, 99)
+
+
+def load_corpus(pages_dir: str) -> list:
+    """(file name, html, expectations) for every page listed in expected.json."""
+    with open(os.path.join(pages_dir, "expected.json"), encoding="utf-8") as expected_file:
+        expected = json.load(expected_file)
+
+    corpus = []
+    for name, expectations in expected.items():
+        with open(os.path.join(pages_dir, name), encoding="utf-8") as page_file:
+            corpus.append((name, page_file.read(), expectations))
+    return corpus
+
+
+def replay(html: str) -> tuple:
+    """
+    Run one page through every parser, timing each.
+
+    Returns:
+        tuple: (coordinates by zoom level, coin updates, {stage: milliseconds}).
+    """
+    start = time.perf_counter()
+    snapshot = PageSnapshot.from_html(html)
+    parsed = time.perf_counter()
+    coordinates = {zoom_level: decode_coordinates(snapshot, zoom_level) for zoom_level in ZOOM_LEVELS}
+    decoded = time.perf_counter()
+    updates = coin_updates(snapshot)
+    finished = time.perf_counter()
+    return coordinates, updates, {
+        "parse": (parsed - start) * 1000,
+        "decode": (decoded - parsed) * 1000,
+        "coins": (finished - decoded) * 1000,
+    }
+
+
+def check(name: str, coordinates: dict, updates: list, expectations: dict) -> list:
+    """Describe every way a replayed page differs from its expectations."""
+    problems = []
+    for zoom_level, expected in expectations.get("coordinates", {}).items():
+        result = coordinates.get(int(zoom_level))
+        if result is None or list(result) != expected:
+            problems.append(f"{name} zoom {zoom_level}: coordinates {result}, expected {tuple(expected)}")
+
+    result = [dataclasses.asdict(update) for update in updates]
+    if result != expectations.get("coins", []):
+        problems.append(f"{name}: coin updates {result}, expected {expectations.get('coins', [])}")
+    return problems
+
+
+def percentile(ordered: list, p: int) -> float:
+    """Nearest-rank percentile of a sorted list."""
+    return ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", default=PAGES_DIR, help="Directory with *.html pages and expected.json")
+    parser.add_argument("--repeat", type=int, default=50, help="Passes over the corpus")
+    args = parser.parse_args()
+
+    bootstrap()  # File logging, as in the app
+    corpus = load_corpus(args.pages)
+
+    problems = []
+    for name, html, expectations in corpus:
+        coordinates, updates, _ = replay(html)
+        problems.extend(check(name, coordinates, updates, expectations))
+
+    samples = {stage: [] for stage in STAGES + ("page",)}
+    by_page = {name: [] for name, _, _ in corpus}
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        for name, html, _ in corpus:
+            _, _, timings = replay(html)
+            for stage, elapsed in timings.items():
+                samples[stage].append(elapsed)
+            total = sum(timings.values())
+            samples["page"].append(total)
+            by_page[name].append(total)
+    elapsed = time.perf_counter() - start
+
+    pages = len(corpus) * args.repeat
+    print(f"Corpus: {len(corpus)} pages from {os.path.relpath(args.pages, REPO_ROOT)}, {args.repeat} passes")
+    print(f"Throughput: {pages / elapsed:,.0f} pages/s")
+    print(f"{'':>8} " + " ".join(f"{f'p{p}':>8}" for p in PERCENTILES) + f" {'max':>8}   (ms per page)")
+    for stage in ("page",) + STAGES:
+        ordered = sorted(samples[stage])
+        print(f"{stage:>8} " + " ".join(f"{percentile(ordered, p):8.3f}" for p in PERCENTILES) + f" {ordered[-1]:8.3f}")
+
+    slowest = sorted(by_page, key=lambda name: sorted(by_page[name])[len(by_page[name]) // 2], reverse=True)[:3]
+    print("Slowest pages (p50): " + ", ".join(
+        f"{name} {sorted(by_page[name])[len(by_page[name]) // 2]:.3f} ms" for name in slowest))
+
+    for problem in problems:
+        print(f"MISMATCH {problem}")
+    print(f"Expected results: {'yes' if not problems else f'NO ({len(problems)} mismatches)'}")
+
+    sys.exit(1 if problems else 0)
+
+
+if __name__ == "__main__":
+    main()
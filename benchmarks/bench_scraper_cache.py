@@ -0,0 +1,228 @@
+"""
+Scraper conditional request check.
+
+Serves stand-ins for the AVITD page, the Terrible API and the Discord bot from a local
+http.server.ThreadingHTTPServer and points a Scraper at them, with its HttpCache in a temporary
+directory and a freshly seeded scratch database, so neither the app's data nor the real sources
+are touched. Every resource is sent with an ETag and a Last-Modified header, and requests whose
+If-None-Match (or, without it, If-Modified-Since) matches are answered 304 without a body.
+
+Three scrapes are run and checked; if any check fails the run fails (exit code 1):
+- first    unconditional requests, guilds and shops parsed and written
+- repeat   every request conditional and answered 304, no source changed, scrape() returns {}
+           and the database is not written
+- changed  one Discord shop moves: its new body is parsed and the move is written, while the
+           unchanged sources still answer 304
+The latency of each scrape is reported.
+
+Run from anywhere:
+    python benchmarks/bench_scraper_cache.py
+"""
+
+import argparse
+import hashlib
+import http.server
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from email.utils import formatdate
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+WORK_DIR = tempfile.mkdtemp(prefix="rbc_scraper_cache_")
+os.chdir(WORK_DIR)  # DB_PATH and the logs are relative, so the scrape writes to a scratch database
+
+from scraper import *
+from bootstrap import bootstrap
+
+AVITD_PAGE = """<html><body>
+<div class="next_change">Guilds move in 2 days, 3h 4m 5s</div>
+<div class="next_change">Shops move in 1 day, 2h 3m 4s</div>
+<img alt="the guilds"><table>
+<tr class="odd"><td>Bench Guild 1</td><td>SE of Emerald and 40th</td></tr>
+<tr class="even"><td>Bench Guild 2</td><td>SE of Unicorn and 12th</td></tr>
+</table>
+<img alt="the shops"><table>
+<tr class="odd"><td>Bench Shop</td><td>SE of Pilchard and 50th</td></tr>
+</table>
+</body></html>"""
+
+TERRIBLE_LOCATIONS = [
+    {"building_name": "Bench Guild 3", "building_type": "guild", "guild_level": None,
+     "street_number": "Ruby", "street_name": "70th", "is_active": True},
+]
+
+DISCORD_LOCATIONS = {
+    "guilds": {},
+    "shops": {"Bench Discord Shop": {"column": "Gum", "row": "30th"}},
+}
+MOVED_SHOP = ("Bench Discord Shop", "Nettle", "31st")
+
+
+class SourceServer(http.server.ThreadingHTTPServer):
+    """Serves a fixed body per path with validators and records how each request was answered."""
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), SourceHandler)
+        self.resources = {}  # path -> (body, content type, ETag, Last-Modified)
+        self.requests = []  # (path, conditional, status) of every request, in order
+        self.lock = threading.Lock()
+
+    def url(self, path: str) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}{path}"
+
+    def publish(self, path: str, body: str, content_type: str) -> None:
+        """Serve a new version of a resource, with fresh validators."""
+        content = body.encode("utf-8")
+        with self.lock:
+            self.resources[path] = (content, content_type, f'"{hashlib.sha256(content).hexdigest()[:16]}"',
+                                    formatdate(time.time(), usegmt=True))
+
+    def take_requests(self) -> list:
+        with self.lock:
+            requests_seen, self.requests = self.requests, []
+        return requests_seen
+
+
+class SourceHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive, like the sources the pooled session talks to
+
+    def do_GET(self) -> None:
+        with self.server.lock:
+            resource = self.server.resources.get(self.path)
+        if resource is None:
+            self.send_error(404)
+            return
+
+        content, content_type, etag, last_modified = resource
+        if "If-None-Match" in self.headers:
+            not_modified = self.headers["If-None-Match"] == etag
+        else:
+            not_modified = self.headers.get("If-Modified-Since") == last_modified
+        conditional = "If-None-Match" in self.headers or "If-Modified-Since" in self.headers
+        with self.server.lock:
+            self.server.requests.append((self.path, conditional, 304 if not_modified else 200))
+
+        self.send_response(304 if not_modified else 200)
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", last_modified)
+        if not_modified:
+            self.end_headers()
+            return
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args) -> None:
+        pass  # Requests are checked, not logged
+
+
+def total_changes() -> int:
+    """Rows changed through the shared write connection so far."""
+    with db_writer() as conn:
+        return conn.total_changes
+
+
+def timed_scrape(scraper: Scraper) -> tuple:
+    """(scrape() result, rows written, milliseconds) of one scrape."""
+    before = total_changes()
+    start = time.perf_counter()
+    result = scraper.scrape()
+    elapsed = (time.perf_counter() - start) * 1000
+    return result, total_changes() - before, elapsed
+
+
+def run_checks(server: SourceServer, scraper: Scraper) -> tuple:
+    """Run the three scrapes. Returns ({case: milliseconds}, list of failed checks)."""
+    problems = []
+    timings = {}
+
+    def check(case, condition, message):
+        if not condition:
+            problems.append(f"{case}: {message}")
+
+    result, written, timings["first"] = timed_scrape(scraper)
+    seen = server.take_requests()
+    check("first", len(seen) == 3 and not any(conditional for _, conditional, _ in seen),
+          f"expected 3 unconditional requests, got {seen}")
+    check("first", set(result) == {"guilds", "shops"} and written > 0,
+          f"expected guilds and shops to be written, got {sorted(result)} with {written} rows")
+
+    result, written, timings["repeat"] = timed_scrape(scraper)
+    seen = server.take_requests()
+    check("repeat", len(seen) == 3 and all(conditional and status == 304 for _, conditional, status in seen),
+          f"expected 3 conditional requests answered 304, got {seen}")
+    check("repeat", not any(scraper.changed.values()), f"expected no changed source, got {scraper.changed}")
+    check("repeat", result == {} and written == 0, f"expected {{}} and no write, got {result} with {written} rows")
+
+    name, column, row = MOVED_SHOP
+    moved = {**DISCORD_LOCATIONS, "shops": {name: {"column": column, "row": row}}}
+    server.publish("/discord", json.dumps(moved), "application/json")
+    result, written, timings["changed"] = timed_scrape(scraper)
+    seen = server.take_requests()
+    statuses = {path: status for path, _, status in seen}
+    check("changed", statuses == {"/avitd": 304, "/terrible": 304, "/discord": 200},
+          f"expected only /discord to be sent again, got {seen}")
+    check("changed", scraper.changed == {"AVITD": False, "Terrible": False, "Discord": True},
+          f"expected only Discord to change, got {scraper.changed}")
+    check("changed", list(result) == ["shops"] and written > 0,
+          f"expected shops to be written, got {sorted(result)} with {written} rows")
+    stored = db_reader().execute("SELECT `Column`, `Row` FROM shops WHERE Name = ?", (name,)).fetchone()
+    check("changed", stored == (column, row), f"expected {name} at {(column, row)}, got {stored}")
+    return timings, problems
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--keep", action="store_true", help="Keep the scratch directory for inspection")
+    args = parser.parse_args()
+
+    server = SourceServer()
+    threading.Thread(target=server.serve_forever, name="SourceServer", daemon=True).start()
+    scraper = None
+    try:
+        if not bootstrap():
+            print("Database initialization failed; see the log.")
+            sys.exit(1)
+
+        server.publish("/avitd", AVITD_PAGE, "text/html; charset=utf-8")
+        server.publish("/terrible", json.dumps(TERRIBLE_LOCATIONS), "application/json")
+        server.publish("/discord", json.dumps(DISCORD_LOCATIONS), "application/json")
+
+        scraper = Scraper()
+        scraper.avitd_url = server.url("/avitd")
+        scraper.terrible_url = server.url("/terrible")
+        scraper.discord_bot_url = server.url("/discord")
+        scraper.http_cache = HttpCache(cache_dir=os.path.join(WORK_DIR, "http_cache"))
+
+        timings, problems = run_checks(server, scraper)
+    finally:
+        if scraper is not None:
+            scraper.close()
+        server.shutdown()
+        server.server_close()
+        close_db_connections()
+        if args.keep:
+            print(f"Scratch directory: {WORK_DIR}")
+        else:
+            logging.shutdown()
+            shutil.rmtree(WORK_DIR, ignore_errors=True)
+
+    for case, elapsed in timings.items():
+        print(f"{case:>8} scrape {elapsed:8.1f} ms")
+    for problem in problems:
+        print(f"FAILED {problem}")
+    print(f"Conditional requests: {'ok' if not problems else f'NO ({len(problems)} failed checks)'}")
+
+    sys.exit(1 if problems else 0)
+
+
+if __name__ == "__main__":
+    main()
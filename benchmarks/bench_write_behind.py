@@ -0,0 +1,145 @@
+"""
+Write-behind queue durability check.
+
+Drives a WriteBehindQueue against a scratch database in a temporary directory and checks that
+queued writes survive the failures the app meets in practice. If any check fails the run fails
+(exit code 1):
+- locked   another connection holds the write lock for longer than the busy timeout while a
+           relative coin update (pocket = pocket + ?) is queued: the batch is retried, the update
+           is applied exactly once and flush() reports success
+- bad      a write that violates a constraint is dropped on its own: the rest of its batch is
+           committed and flush() reports the loss
+- commit   the COMMIT of a writer() block fails (a deferred foreign key is violated): the block is
+           rolled back, the write connection is left outside a transaction and the next batch
+           commits only its own write
+The time each case takes to flush is reported.
+
+Run from anywhere:
+    python benchmarks/bench_write_behind.py [--lock-seconds S]
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from write_behind import *
+
+BUSY_TIMEOUT = 5.0  # sqlite3.connect default, which open_connection keeps
+START_POCKET = 100
+GAIN = 10
+
+
+def hold_write_lock(db_path: str, seconds: float, locked: threading.Event) -> None:
+    """Hold the database write lock from a second connection, as another app instance would."""
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        locked.set()
+        time.sleep(seconds)
+        conn.rollback()
+    finally:
+        conn.close()
+
+
+def pocket(manager: ConnectionManager) -> int:
+    return manager.reader().execute("SELECT pocket FROM coins WHERE character_id = 1").fetchone()[0]
+
+
+def run_checks(manager: ConnectionManager, lock_seconds: float) -> tuple:
+    """Run every case. Returns ({case: seconds}, list of failed checks)."""
+    problems = []
+    timings = {}
+
+    def check(case, condition, message):
+        if not condition:
+            problems.append(f"{case}: {message}")
+
+    queue = WriteBehindQueue(manager)
+
+    locked = threading.Event()
+    holder = threading.Thread(target=hold_write_lock, args=(manager.db_path, lock_seconds, locked))
+    holder.start()
+    locked.wait()
+    start = time.perf_counter()
+    queue.execute("UPDATE coins SET pocket = pocket + ? WHERE character_id = 1", (GAIN,))
+    flushed = queue.flush()
+    timings["locked"] = time.perf_counter() - start
+    holder.join()
+    check("locked", flushed, "flush() reported a lost write")
+    check("locked", pocket(manager) == START_POCKET + GAIN,
+          f"expected pocket {START_POCKET + GAIN}, got {pocket(manager)}")
+    check("locked", timings["locked"] >= lock_seconds - 0.5,
+          f"flush() returned after {timings['locked']:.1f}s, before the lock was released")
+
+    start = time.perf_counter()
+    queue.execute("INSERT INTO coins (character_id, pocket) VALUES (1, 0)")  # Duplicate key
+    queue.execute("UPDATE coins SET pocket = pocket + ? WHERE character_id = 1", (GAIN,))
+    flushed = queue.flush()
+    timings["bad"] = time.perf_counter() - start
+    check("bad", not flushed, "flush() did not report the dropped write")
+    check("bad", pocket(manager) == START_POCKET + 2 * GAIN,
+          f"expected pocket {START_POCKET + 2 * GAIN}, got {pocket(manager)}")
+
+    start = time.perf_counter()
+    try:
+        with manager.writer() as conn:
+            conn.execute("PRAGMA foreign_keys = ON")  # Outside the transaction, which starts with the UPDATE
+            conn.execute("UPDATE coins SET pocket = pocket + ? WHERE character_id = 1", (GAIN,))
+            conn.execute("INSERT INTO coin_log (character_id) VALUES (2)")  # No such character
+        check("commit", False, "the commit did not fail")
+    except sqlite3.IntegrityError:
+        pass
+    try:
+        with manager.writer() as conn:
+            left_open = conn.in_transaction
+    except sqlite3.Error:
+        left_open = True  # The next block committed the failed block's statements
+    check("commit", not left_open, "the write connection was left in a transaction")
+    queue.execute("UPDATE coins SET pocket = pocket + ? WHERE character_id = 1", (GAIN,))
+    flushed = queue.flush()
+    timings["commit"] = time.perf_counter() - start
+    check("commit", flushed, "flush() reported a lost write")
+    check("commit", pocket(manager) == START_POCKET + 3 * GAIN,
+          f"expected pocket {START_POCKET + 3 * GAIN}, got {pocket(manager)}")
+
+    check("close", queue.close(), "close() reported a lost write")
+    return timings, problems
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lock-seconds", type=float, default=BUSY_TIMEOUT + 2,
+                        help="How long the second connection holds the write lock")
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="rbc_write_behind_")
+    manager = ConnectionManager(os.path.join(work_dir, "write_behind.db"))
+    try:
+        with manager.writer() as conn:
+            conn.execute("CREATE TABLE coins (character_id INTEGER PRIMARY KEY, pocket INTEGER NOT NULL)")
+            conn.execute("INSERT INTO coins (character_id, pocket) VALUES (1, ?)", (START_POCKET,))
+            conn.execute("CREATE TABLE coin_log (character_id INTEGER REFERENCES coins (character_id) "
+                         "DEFERRABLE INITIALLY DEFERRED)")
+        timings, problems = run_checks(manager, args.lock_seconds)
+    finally:
+        manager.close()
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    for case, elapsed in timings.items():
+        print(f"{case:>8} flush {elapsed:6.2f} s")
+    for problem in problems:
+        print(f"FAILED {problem}")
+    print(f"Queued writes durable: {'yes' if not problems else f'NO ({len(problems)} failed checks)'}")
+
+    sys.exit(1 if problems else 0)
+
+
+if __name__ == "__main__":
+    main()
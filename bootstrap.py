@@ -0,0 +1,48 @@
+from core_imports import *
+from constants import *
+from directories import *
+from logging_setup import *
+from database import *
+from settings_store import *
+
+# -----------------------
+# Application Bootstrap
+# -----------------------
+
+_bootstrap_lock = threading.Lock()
+_bootstrap_result = None  # None until bootstrap() has run, then its return value
+
+
+def bootstrap() -> bool:
+    """
+    Prepare everything the app needs before its first window is created.
+
+    Creates the required directories, sets up file logging at the saved log level and creates,
+    migrates and seeds the database. Importing a module does none of this, so the app, tools and
+    benchmarks call this once before reading map data. Later calls return the first result
+    without doing the work again.
+
+    Returns:
+        bool: True if the database is ready. On False the app can still start with fallback data.
+    """
+    global _bootstrap_result
+    with _bootstrap_lock:
+        if _bootstrap_result is not None:
+            return _bootstrap_result
+
+        if not ensure_directories_exist():
+            logging.warning("Some directories could not be created. Application may encounter issues.")
+
+        # A fresh install has no settings table yet, so only read the saved level from an existing database
+        log_level = get_logging_level_from_db(DEFAULT_LOG_LEVEL) if os.path.exists(DB_PATH) else DEFAULT_LOG_LEVEL
+        if not setup_logging(log_level=log_level):
+            print("Logging setup failed. Continuing without file logging.", file=sys.stderr)
+            logging.basicConfig(level=DEFAULT_LOG_LEVEL, format=LOG_FORMAT, stream=sys.stderr)  # Fallback to console
+        logging.info(f"Launching app version {VERSION_NUMBER}")
+
+        _bootstrap_result = initialize_database(DB_PATH)
+        if _bootstrap_result:
+            app_settings().load()  # Pick up settings added by migrations and seed data
+        else:
+            logging.warning("Database initialization failed. Application may encounter issues.")
+        return _bootstrap_result
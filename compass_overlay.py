@@ -5,21 +5,25 @@ class CompassOverlay(QDialog):
     """
     A floating compass window that shows both Direct and Transit routes to a destination,
     sorted by AP cost. Color-coded: Green = Direct, Purple = Transit.
+    Alternative transit routes are listed as "Transit Route 2", "Transit Route 3", ...
     """
 
-    def __init__(self, direct_route_info, transit_route_info, parent=None):
+    ROW_HEIGHT = 45  # Extra window height per alternative route
+
+    def __init__(self, direct_route_info, transit_route_info, parent=None, alternative_routes=()):
         """
         Args:
-            direct_route_info (tuple): (int ap_cost, str description)
-            transit_route_info (tuple): (int ap_cost, str description)
+            direct_route_info (tuple): (int ap_cost, str description, list path)
+            transit_route_info (tuple): (int ap_cost, str description, list path)
+            alternative_routes (iterable): Further transit routes in the same format, cheapest first.
         """
         super().__init__(parent)
         self.setWindowTitle("Compass Routes")
-        self.setFixedSize(200, 150)
         self.setWindowFlags(self.windowFlags() | Qt.WindowStaysOnTopHint)
 
         self.direct_route_info = direct_route_info
         self.transit_route_info = transit_route_info
+        self.alternative_routes = list(alternative_routes)
 
         self._init_ui()
 
@@ -35,20 +39,7 @@ class CompassOverlay(QDialog):
 
         # Track route data
         self.route_mapping = {}
-
-        routes = [
-            ("Direct Route", self.direct_route_info[0], self.direct_route_info[1], PySide6.QtGui.QColor("green"), PySide6.QtGui.QColor("white")),
-            ("Transit Route", self.transit_route_info[0], self.transit_route_info[1], PySide6.QtGui.QColor(128, 0, 128), PySide6.QtGui.QColor("white")),  # dark purple
-        ]
-        routes.sort(key=lambda r: r[1])  # sort by AP cost
-
-        for label, cost, desc, bg_color, text_color in routes:
-            item = QListWidgetItem(f"{label} — {cost} AP\n{desc}")
-            item.setBackground(bg_color)
-            item.setForeground(text_color)
-            self.route_list.addItem(item)
-            path = self.direct_route_info[2] if label == "Direct Route" else self.transit_route_info[2]
-            self.route_mapping[label] = (cost, desc, path)
+        self._populate_routes()
 
         self.route_list.itemClicked.connect(self.route_selected)  # ✅ Hook click signal
         layout.addWidget(self.route_list)
@@ -62,33 +53,38 @@ class CompassOverlay(QDialog):
 
         self.setLayout(layout)
 
-    def refresh(self, direct_route_info, transit_route_info):
-        """
-        Update the overlay with new route data.
-        """
-        self.direct_route_info = direct_route_info
-        self.transit_route_info = transit_route_info
-
+    def _populate_routes(self):
+        """Fill the route list, cheapest first, and remember each route's path for selection."""
         self.route_list.clear()
-        self.route_mapping = {}  # ✅ Reset once outside the loop
+        self.route_mapping = {}
+        self.setFixedSize(200, 150 + self.ROW_HEIGHT * len(self.alternative_routes))
 
-        # Unpack only ap + desc, exclude path (3rd element), just like in _init_ui
         routes = [
-            ("Direct Route", self.direct_route_info[0], self.direct_route_info[1], PySide6.QtGui.QColor("green"), PySide6.QtGui.QColor("white")),
-            ("Transit Route", self.transit_route_info[0], self.transit_route_info[1], PySide6.QtGui.QColor(128, 0, 128), PySide6.QtGui.QColor("white")),
+            ("Direct Route", self.direct_route_info, PySide6.QtGui.QColor("green")),
+            ("Transit Route", self.transit_route_info, PySide6.QtGui.QColor(128, 0, 128)),  # dark purple
+        ]
+        routes += [
+            (f"Transit Route {index}", route_info, PySide6.QtGui.QColor(128, 0, 128))
+            for index, route_info in enumerate(self.alternative_routes, start=2)
         ]
-        routes.sort(key=lambda r: r[1])  # Sort by AP
+        routes.sort(key=lambda r: r[1][0])  # sort by AP cost
 
-        for label, cost, desc, bg_color, text_color in routes:
+        for label, (cost, desc, path), bg_color in routes:
             item = QListWidgetItem(f"{label} — {cost} AP\n{desc}")
             item.setBackground(bg_color)
-            item.setForeground(text_color)
+            item.setForeground(PySide6.QtGui.QColor("white"))
             self.route_list.addItem(item)
-
-            # ✅ Preserve path too for selection support
-            path = self.direct_route_info[2] if label == "Direct Route" else self.transit_route_info[2]
             self.route_mapping[label] = (cost, desc, path)
 
+    def refresh(self, direct_route_info, transit_route_info, alternative_routes=()):
+        """
+        Update the overlay with new route data.
+        """
+        self.direct_route_info = direct_route_info
+        self.transit_route_info = transit_route_info
+        self.alternative_routes = list(alternative_routes)
+        self._populate_routes()
+
     def route_selected(self, item):
         label_text = item.text().split("—")[0].strip()
         route_info = self.route_mapping.get(label_text)
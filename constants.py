@@ -1,10 +1,58 @@
-from imports import *
-from splash import *
+from core_imports import *
+
 # -----------------------
 # Global Constants
 # -----------------------
 # Database Path
 DB_PATH = 'sessions/rbc_map_data.db'
+SEED_DB_PATH = 'seed_data.db'  # Optional prebuilt seed data, used instead of seed_data.py when present
+DB_CACHED_STATEMENTS = 256  # Prepared statements kept per connection
+WRITE_BEHIND_FLUSH_INTERVAL = 0.5  # Seconds of queued writes committed together in the background
+WRITE_BEHIND_RETRY_DELAY = 0.5  # Seconds before retrying a batch that failed to commit, doubled on each failure
+WRITE_BEHIND_MAX_RETRY_DELAY = 30.0
+WRITE_BEHIND_CLOSE_ATTEMPTS = 3  # Commits of a batch tried while closing before its writes are given up
+
+# Precomputed nearest bank/tavern/transit tables
+NEAREST_GRID_CACHE_PATH = 'sessions/nearest_grid.cache'
+
+# Scraper
+SCRAPER_TIMEOUTS = {  # Source -> (connect, read) timeout in seconds
+    "AVITD": (5, 20),
+    "Terrible": (5, 10),
+    "Discord": (5, 10),
+}
+SCRAPER_RETRIES = 2  # Extra attempts after a connection error or a 429/5xx response
+SCRAPER_BACKOFF = 0.5  # Seconds before the first retry, doubling for each further retry
+SCRAPER_CANCEL_POLL = 0.1  # Seconds between checks for a cancelled scrape while sources are fetched
+HTTP_CACHE_DIR = 'sessions/http_cache'  # Last response of each source, for conditional requests
+SCRAPE_MIN_INTERVAL = 300  # Seconds; scheduled scrapes never run closer together than this
+SCRAPE_MAX_INTERVAL = 3600  # Seconds; longest wait, so Terrible/Discord reports between moves are picked up
+SCRAPE_JITTER = (15, 90)  # Random extra seconds after the scheduled time, spreading load on the sources
+
+# Transit Routing
+TRANSIT_MATRIX_CACHE_PATH = 'sessions/transit_matrix.cache'  # Stored next to DB_PATH
+TRANSIT_RIDE_AP_COST = 0  # Riding between stations is free; only walking to and from them costs AP
+TRANSIT_ROUTE_ALTERNATIVES = 3  # Transit routes offered in the compass overlay
+
+# Minimap
+MINIMAP_SIZE = 280  # Edge length of the minimap in pixels
+MINIMAP_FRAME_INTERVAL_MS = 16  # Minimum time between minimap frames (about one 60 Hz refresh)
+
+# Startup
+STARTUP_WORKERS = 4  # Threads running the background startup stages
+
+# Minimap icons, loaded off the GUI thread during startup
+MAP_ICON_PATHS = {
+    "bank": "images/bank.png",
+    "tavern": "images/saloon.png",
+    "transit": "images/transit.png",
+    "user_building": "images/castle.png",
+    "guild": "images/guild.png",
+    "shop": "images/shop.png",
+    "graveyard": "images/graveyard.png",
+    "hall_binding": "images/binding.png",
+    "hall_severance": "images/severance.png",
+}
 
 # Logging Configuration
 LOG_DIR = 'logs'
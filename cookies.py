@@ -1,5 +1,6 @@
 from imports import *
 from constants import *
+from db_connection import *
 # -----------------------
 # Webview Cookie Database
 # -----------------------
@@ -15,7 +16,7 @@ def save_cookie_to_db(cookie: QNetworkCookie) -> bool:
         bool: True if the cookie was saved/updated successfully, False otherwise.
     """
     try:
-        with sqlite3.connect(DB_PATH) as conn:
+        with db_writer() as conn:
             cursor = conn.cursor()
             name = cookie.name().data().decode('utf-8', errors='replace')
             domain = cookie.domain()
@@ -32,7 +33,6 @@ def save_cookie_to_db(cookie: QNetworkCookie) -> bool:
                 VALUES (?, ?, ?, ?, ?, ?, ?)
             ''', (name, value, domain, path, expiration, secure, httponly))
 
-            conn.commit()
             logging.debug(f"Saved/updated cookie: {name} for domain {domain}")
             return True
     except sqlite3.Error as e:
@@ -48,7 +48,7 @@ def load_cookies_from_db() -> List[QNetworkCookie]:
     """
     cookies = []
     try:
-        with sqlite3.connect(DB_PATH) as conn:
+        with db_reader() as conn:
             cursor = conn.cursor()
             cursor.execute('SELECT name, value, domain, path, expiration, secure, httponly FROM cookies')
             for name, value, domain, path, expiration, secure, httponly in cursor.fetchall():
@@ -77,10 +77,9 @@ def clear_cookie_db() -> bool:
         bool: True if cookies were cleared successfully, False otherwise.
     """
     try:
-        with sqlite3.connect(DB_PATH) as conn:
+        with db_writer() as conn:
             cursor = conn.cursor()
             cursor.execute('DELETE FROM cookies')
-            conn.commit()
             logging.info("Cleared all cookies from database")
             return True
     except sqlite3.Error as e:
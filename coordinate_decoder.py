@@ -0,0 +1,112 @@
+from core_imports import *
+
+# -----------------------
+# Zoom-Aware Coordinate Decoder
+# -----------------------
+
+# The game names the city corners after the first/last column and row
+CORNER_SIGNATURES = {
+    "Aardvark and 1st": "corner_nw",
+    "Zestless and 1st": "corner_ne",
+    "Aardvark and 100th": "corner_sw",
+    "Zestless and 100th": "corner_se",
+}
+
+# How each coordinate is rebuilt for an edge signature:
+#   "first" -> first input value minus the zoom offset
+#   "low"   -> the lowest start coordinate the minimap can show (the western/northern limit)
+#   "high"  -> the highest start coordinate the minimap can show (the eastern/southern limit)
+EDGE_RULES = {
+    "corner_nw": ("low", "low"),
+    "corner_ne": ("high", "low"),
+    "corner_sw": ("low", "high"),
+    "corner_se": ("high", "high"),
+    "north_at_west_limit": ("first", "low"),  # Aardvark and NCL
+    "west_at_north_limit": ("low", "first"),  # WCL and 1st
+    "on_zestless_1st": ("first", "first"),
+    "north": ("first", "low"),
+    "west": ("low", "first"),
+    "interior": ("first", "first"),
+}
+
+# zoom level -> {signature: (use_first_x, x_offset, use_first_y, y_offset)}
+_decode_tables = {}
+
+
+def _build_zoom_table(zoom_level: int) -> dict:
+    """
+    Precompute the decode table for one odd zoom level.
+
+    Each entry is (use_first_x, x_offset, use_first_y, y_offset), so decoding is
+    x = (first_x if use_first_x else 0) + x_offset.
+    """
+    half = zoom_level // 2
+    offsets = {
+        "first": (True, -(half - 1)),
+        "low": (False, -half),
+        "high": (False, 199 - half),
+    }
+    table = {signature: offsets[x_rule] + offsets[y_rule] for signature, (x_rule, y_rule) in EDGE_RULES.items()}
+    _decode_tables[zoom_level] = table
+    return table
+
+
+def edge_signature(intersect: str, cityblocks: int, first_x: int | None, first_y: int | None,
+                   last_x: int | None, last_y: int | None) -> str | None:
+    """
+    Classify where the game grid sits against the city limits.
+
+    Returns:
+        str | None: An EDGE_RULES key, or None when no city limit cells are visible.
+    """
+    if not cityblocks:
+        return None
+
+    if cityblocks == 5:
+        return CORNER_SIGNATURES.get(intersect, "interior")
+
+    if cityblocks == 3:
+        if first_y == 0:
+            if first_x == 0:
+                return "north_at_west_limit" if last_x == 2 and last_y == 1 else "west_at_north_limit"
+            return "on_zestless_1st" if first_x == 198 else "north"
+        if first_x == 0:
+            return "west"
+
+    return "interior"
+
+
+def decode_coordinates(snapshot, zoom_level: int) -> tuple[int | None, int | None]:
+    """
+    Translate a page snapshot into the character coordinates used to recenter the minimap.
+
+    Works for any odd zoom level. Without visible city limits the first x/y inputs are returned
+    unchanged, as the game grid then needs no edge correction.
+
+    Args:
+        snapshot (PageSnapshot): Analysed game page.
+        zoom_level (int): Number of cells shown along each side of the minimap.
+
+    Returns:
+        tuple: (x, y), or the raw first inputs if there is nothing to correct.
+    """
+    first_x, first_y = snapshot.first_x, snapshot.first_y
+    signature = edge_signature(snapshot.intersect, snapshot.cityblocks, first_x, first_y,
+                               snapshot.last_x, snapshot.last_y)
+    if signature is None:
+        return first_x, first_y
+
+    table = _decode_tables.get(zoom_level)
+    if table is None:
+        if zoom_level % 2 == 0:
+            return first_x, first_y
+        table = _build_zoom_table(zoom_level)
+
+    use_first_x, x_offset, use_first_y, y_offset = table[signature]
+    x = (None if first_x is None else first_x + x_offset) if use_first_x else x_offset
+    y = (None if first_y is None else first_y + y_offset) if use_first_y else y_offset
+    return x, y
+
+
+for _zoom_level in (3, 5, 7, 9, 11):
+    _build_zoom_table(_zoom_level)
@@ -0,0 +1,45 @@
+import logging
+import logging.handlers
+import sys
+
+# -----------------------
+# Core Imports
+# -----------------------
+# Standard library, HTTP/HTML parsing and QtCore: everything needed by modules that do not build
+# widgets. Importing this does not load QtGui, QtWidgets or Qt WebEngine, which keeps the scraper,
+# the database layer and tools cheap to import. imports.py adds the GUI modules on top.
+
+# Built-in / stdlib
+import array
+import concurrent.futures
+import hashlib
+import heapq
+import json
+import math
+import os
+import random
+import re
+import sqlite3
+import threading
+import time
+import webbrowser
+from collections.abc import Callable, KeysView
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+
+# Third-party
+import requests
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# PySide6 Core
+from PySide6.QtCore import (
+    QByteArray, QDateTime, QEasingCurve, QEvent, QMimeData, QObject,
+    QPoint, QPropertyAnimation, QRect, QRunnable, QSize, Qt, QThreadPool, QTimer, QUrl,
+    Signal as pyqtSignal, Slot as pyqtSlot
+)
+
+# Typing
+from typing import TYPE_CHECKING, List, Tuple, Type, TypeVar, cast
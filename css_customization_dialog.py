@@ -1,5 +1,8 @@
 from imports import *
 from constants import *
+from db_connection import *
+from settings_store import *
+from splash import *
 
 class CSSCustomizationDialog(QDialog):
     def __init__(self, parent: QWidget = None, current_profile: str = None, color_mappings: dict | None = None) -> None:
@@ -22,31 +25,13 @@ class CSSCustomizationDialog(QDialog):
 
     def get_current_profile(self) -> str:
         """Retrieve the current CSS profile from settings."""
-        try:
-            with sqlite3.connect(DB_PATH) as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT setting_value FROM settings WHERE setting_name = 'css_profile'")
-                result = cursor.fetchone()
-                return result[0] if result else "Default"
-        except sqlite3.Error as e:
-            logging.error(f"Failed to retrieve current profile: {e}")
-            return "Default"
+        return app_settings().css_profile
 
     def update_current_profile(self, profile: str) -> None:
-        """Update the css_profile setting in the database."""
-        try:
-            with sqlite3.connect(DB_PATH) as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    "INSERT OR REPLACE INTO settings (setting_name, setting_value) VALUES (?, ?)",
-                    ("css_profile", profile)
-                )
-                conn.commit()
-            self.current_profile = profile
-            logging.debug(f"Updated css_profile to: {profile}")
-        except sqlite3.Error as e:
-            logging.error(f"Failed to update css_profile: {e}")
-            QMessageBox.critical(self, "Error", f"Failed to update profile: {e}")
+        """Update the css_profile setting."""
+        app_settings().css_profile = profile
+        self.current_profile = profile
+        logging.debug(f"Updated css_profile to: {profile}")
 
     def setup_ui(self) -> None:
         """Set up the UI for CSS customization."""
@@ -125,7 +110,7 @@ class CSSCustomizationDialog(QDialog):
     def load_profiles(self) -> None:
         """Load available CSS profiles from the database."""
         try:
-            with sqlite3.connect(DB_PATH) as conn:
+            with db_reader() as conn:
                 cursor = conn.cursor()
                 cursor.execute("SELECT profile_name FROM css_profiles")
                 profiles = [row[0] for row in cursor.fetchall()]
@@ -141,10 +126,9 @@ class CSSCustomizationDialog(QDialog):
         profile_name, ok = QInputDialog.getText(self, "New Profile", "Enter profile name:")
         if ok and profile_name:
             try:
-                with sqlite3.connect(DB_PATH) as conn:
+                with db_writer() as conn:
                     cursor = conn.cursor()
                     cursor.execute("INSERT OR IGNORE INTO css_profiles (profile_name) VALUES (?)", (profile_name,))
-                    conn.commit()
                 self.load_profiles()
                 self.profile_dropdown.setCurrentText(profile_name)
                 self.on_profile_change(profile_name)
@@ -164,10 +148,9 @@ class CSSCustomizationDialog(QDialog):
         # noinspection PyUnresolvedReferences
         if reply == QMessageBox.Yes:
             try:
-                with sqlite3.connect(DB_PATH) as conn:
+                with db_writer() as conn:
                     cursor = conn.cursor()
                     cursor.execute("DELETE FROM css_profiles WHERE profile_name = ?", (profile,))
-                    conn.commit()
                 self.load_profiles()
                 self.profile_dropdown.setCurrentText("Default")
                 self.on_profile_change("Default")
@@ -248,13 +231,12 @@ class CSSCustomizationDialog(QDialog):
         if not value.strip():
             return
         try:
-            with sqlite3.connect(DB_PATH) as conn:
+            with db_writer() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     "INSERT OR REPLACE INTO custom_css (profile_name, element, value) VALUES (?, ?, ?)",
                     (self.current_profile, css_item, value)
                 )
-                conn.commit()
         except sqlite3.Error as e:
             logging.error(f"Failed to save CSS for '{css_item}': {e}")
             QMessageBox.critical(self, "Error", f"Failed to save CSS: {e}")
@@ -262,7 +244,7 @@ class CSSCustomizationDialog(QDialog):
     def load_existing_customizations(self) -> None:
         """Load and apply existing CSS customizations for the current profile."""
         try:
-            with sqlite3.connect(DB_PATH) as conn:
+            with db_reader() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     "SELECT element, value FROM custom_css WHERE profile_name = ?",
@@ -296,7 +278,7 @@ class CSSCustomizationDialog(QDialog):
     def generate_custom_css(self) -> str:
         """Generate CSS string from database customizations for the current profile."""
         try:
-            with sqlite3.connect(DB_PATH) as conn:
+            with db_reader() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     "SELECT element, value FROM custom_css WHERE profile_name = ?",
@@ -312,7 +294,7 @@ class CSSCustomizationDialog(QDialog):
         file_path, _ = QFileDialog.getOpenFileName(self, "Select CSS", "", "CSS Files (*.css)")
         if file_path:
             try:
-                with open(file_path, "r") as f, sqlite3.connect(DB_PATH) as conn:
+                with open(file_path, "r") as f, db_writer() as conn:
                     css = f.read()
                     rules = re.findall(r'([^{]+){([^}]+)}', css, re.DOTALL)
                     cursor = conn.cursor()
@@ -320,7 +302,6 @@ class CSSCustomizationDialog(QDialog):
                         "INSERT OR REPLACE INTO custom_css (profile_name, element, value) VALUES (?, ?, ?)",
                         [(self.current_profile, sel.strip(), prop.strip()) for sel, prop in rules]
                     )
-                    conn.commit()
                 self.load_existing_customizations()
                 if self.parent:
                     parent = cast("MainWindowType", self.parent)
@@ -334,13 +315,12 @@ class CSSCustomizationDialog(QDialog):
     def reset_css_item(self, css_item: str, preview: QLabel) -> None:
         """Reset a specific CSS item to default for the current profile."""
         try:
-            with sqlite3.connect(DB_PATH) as conn:
+            with db_writer() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     "DELETE FROM custom_css WHERE profile_name = ? AND element = ?",
                     (self.current_profile, css_item)
                 )
-                conn.commit()
             preview.setStyleSheet("")
             logging.debug(f"Reset CSS for '{css_item}' in profile '{self.current_profile}'")
         except sqlite3.Error as e:
@@ -350,10 +330,9 @@ class CSSCustomizationDialog(QDialog):
     def clear_all_customizations(self) -> None:
         """Clear all CSS customizations for the current profile."""
         try:
-            with sqlite3.connect(DB_PATH) as conn:
+            with db_writer() as conn:
                 cursor = conn.cursor()
                 cursor.execute("DELETE FROM custom_css WHERE profile_name = ?", (self.current_profile,))
-                conn.commit()
             self.load_existing_customizations()
             if self.parent:
                 parent = cast("MainWindowType", self.parent)
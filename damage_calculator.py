@@ -1,5 +1,6 @@
 from imports import *
 from constants import *
+from splash import *
 
 class DamageCalculator(QDialog):
     """Dialog for calculating weapons needed to reduce a target BP."""
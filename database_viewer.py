@@ -1,5 +1,6 @@
 from imports import *
 from constants import *
+from splash import *
 
 class DatabaseViewer(QDialog):
     """
@@ -60,10 +61,10 @@ class DatabaseViewer(QDialog):
         logging.debug(f"Added tab for table '{table_name}' with {len(data)} rows")
 
     def closeEvent(self, event) -> None:
+        # The connection is shared with the rest of the app, so only this viewer's cursor is closed
         try:
             self.cursor.close()
-            self.db_connection.close()
-            logging.debug("Database connection closed")
+            logging.debug("Database viewer cursor closed")
         except sqlite3.Error as e:
-            logging.error(f"Failed to close database connection: {e}")
+            logging.error(f"Failed to close database cursor: {e}")
         event.accept()
\ No newline at end of file
@@ -0,0 +1,179 @@
+from core_imports import *
+from constants import *
+
+# -----------------------
+# Shared SQLite Connections
+# -----------------------
+
+def open_connection(db_path: str = DB_PATH) -> sqlite3.Connection:
+    """
+    Open a SQLite connection configured the way every part of the app uses the database.
+
+    WAL lets readers keep going while a write is in progress, and synchronous=NORMAL only syncs
+    at checkpoints instead of on every commit, which is still safe against corruption in WAL mode.
+
+    Args:
+        db_path (str): Path to the SQLite database file.
+
+    Returns:
+        sqlite3.Connection: Connection usable from any thread. Callers must not share it between
+        threads without their own locking.
+    """
+    conn = sqlite3.connect(db_path, check_same_thread=False, cached_statements=DB_CACHED_STATEMENTS)
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    return conn
+
+
+class ConnectionManager:
+    """
+    Long-lived connections to one database: a single writer shared by all threads and one reader
+    per thread.
+
+    Connections are opened on first use and kept for the life of the app, so queries reuse the
+    parsed schema and the per-connection prepared statement cache instead of paying for a new
+    connection every time. The reader of a Python thread that has finished is closed the next time
+    a reader is opened. Threads Python cannot see finish, such as QThreadPool threads, call
+    release_reader() when their work is done.
+    """
+
+    def __init__(self, db_path: str = DB_PATH) -> None:
+        """
+        Args:
+            db_path (str): Path to the SQLite database file.
+        """
+        self.db_path = db_path
+        self._writer = None
+        self._write_lock = threading.RLock()
+        self._write_depth = 0  # Nested writer() blocks on the thread holding the write lock
+        self._readers = {}  # threading.Thread -> its read connection
+        self._readers_lock = threading.Lock()
+        self._local = threading.local()  # .reader: (connection, generation) of the calling thread
+        self._generation = 0  # Bumped by close(), so every thread opens a new reader afterwards
+
+    def reader(self) -> sqlite3.Connection:
+        """
+        Return the calling thread's read connection.
+
+        It stays in autocommit mode while only SELECTs run on it, so every query sees the latest
+        committed data. Use writer() for anything that changes the database.
+        """
+        cached = getattr(self._local, "reader", None)
+        if cached is not None and cached[1] == self._generation:
+            return cached[0]
+
+        conn = open_connection(self.db_path)
+        thread = threading.current_thread()
+        with self._readers_lock:
+            finished = [self._readers.pop(other) for other in list(self._readers) if not other.is_alive()]
+            self._readers[thread] = conn
+            self._local.reader = (conn, self._generation)
+        for finished_conn in finished:
+            finished_conn.close()
+        logging.debug(f"Opened read connection to {self.db_path} for thread {thread.name}"
+                      f"{f', closed {len(finished)} of finished threads' if finished else ''}")
+        return conn
+
+    def release_reader(self) -> None:
+        """Close the calling thread's read connection, if it has one. The next reader() opens a new one."""
+        with self._readers_lock:
+            conn = self._readers.pop(threading.current_thread(), None)
+            self._local.reader = None
+        if conn is not None:
+            conn.close()
+
+    @contextmanager
+    def writer(self):
+        """
+        Hold the shared write connection for one transaction.
+
+        Writers from other threads wait until the block ends. The transaction is committed when the
+        block exits normally and rolled back if it or the commit raises, so a failed block never
+        leaves statements behind for the next one to commit. Blocks nested on the same thread join
+        the outermost one, which alone commits or rolls back.
+
+        Yields:
+            sqlite3.Connection: The write connection.
+        """
+        with self._write_lock:
+            if self._writer is None:
+                self._writer = open_connection(self.db_path)
+                logging.debug(f"Opened write connection to {self.db_path}")
+            if self._write_depth:
+                self._write_depth += 1
+                try:
+                    yield self._writer
+                finally:
+                    self._write_depth -= 1
+                return
+
+            self._write_depth = 1
+            try:
+                yield self._writer
+                self._writer.commit()
+            except BaseException:
+                self._rollback_writer()
+                raise
+            finally:
+                self._write_depth = 0
+
+    def _rollback_writer(self) -> None:
+        """Roll back the writer's transaction, or discard the connection if even that fails."""
+        try:
+            self._writer.rollback()
+        except sqlite3.Error as e:
+            logging.error(f"Failed to roll back write to {self.db_path}, reopening the connection: {e}")
+            self._writer.close()
+            self._writer = None
+
+    def close(self) -> None:
+        """Close every open connection. Later calls to reader() or writer() open new ones."""
+        with self._write_lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+        with self._readers_lock:
+            readers, self._readers = list(self._readers.values()), {}
+            self._generation += 1
+        for conn in readers:
+            conn.close()
+        logging.debug(f"Closed connections to {self.db_path}")
+
+
+_managers = {}  # db_path -> ConnectionManager
+_managers_lock = threading.Lock()
+
+
+def connection_manager(db_path: str = DB_PATH) -> ConnectionManager:
+    """Return the shared ConnectionManager for a database file, creating it on first use."""
+    with _managers_lock:
+        manager = _managers.get(db_path)
+        if manager is None:
+            manager = _managers[db_path] = ConnectionManager(db_path)
+        return manager
+
+
+def db_reader() -> sqlite3.Connection:
+    """Return the calling thread's read connection to DB_PATH. See ConnectionManager.reader."""
+    return connection_manager().reader()
+
+
+def db_writer():
+    """Context manager holding the shared write connection to DB_PATH. See ConnectionManager.writer."""
+    return connection_manager().writer()
+
+
+def release_db_readers() -> None:
+    """Close the calling thread's read connections, e.g. at the end of work on a QThreadPool thread."""
+    with _managers_lock:
+        managers = list(_managers.values())
+    for manager in managers:
+        manager.release_reader()
+
+
+def close_db_connections() -> None:
+    """Close every shared connection, e.g. when the app shuts down."""
+    with _managers_lock:
+        managers = list(_managers.values())
+    for manager in managers:
+        manager.close()
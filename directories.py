@@ -1,5 +1,5 @@
+from core_imports import *
 from constants import *
-from imports import *
 
 def ensure_directories_exist(directories: list[str] = None) -> bool:
     """
@@ -21,7 +21,3 @@ def ensure_directories_exist(directories: list[str] = None) -> bool:
             logging.error(f"Failed to create directory '{directory}': {e}")
             success = False
     return success
-
-# Example usage at startup (optional, depending on your flow)
-if not ensure_directories_exist():
-    logging.warning("Some directories could not be created. Application may encounter issues.")
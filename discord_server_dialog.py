@@ -1,5 +1,7 @@
 from imports import *
 from constants import *
+from db_connection import *
+from splash import *
 
 class DiscordServerDialog(QDialog):
     def __init__(self, parent=None, color_mappings: dict | None = None):
@@ -12,7 +14,7 @@ class DiscordServerDialog(QDialog):
         self.setLayout(layout)
 
         try:
-            with sqlite3.connect(DB_PATH) as conn:
+            with db_reader() as conn:
                 cursor = conn.cursor()
                 cursor.execute("SELECT name, invite_link FROM discord_servers")
                 servers = cursor.fetchall()
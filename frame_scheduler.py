@@ -0,0 +1,85 @@
+from core_imports import *
+from constants import *
+
+# -----------------------
+# Frame Scheduling
+# -----------------------
+
+class FrameScheduler(QObject):
+    """
+    Coalesces redraw requests into at most one frame per event-loop turn.
+
+    request() only marks the view dirty and records why. The frame is drawn once control returns
+    to the event loop, and no sooner than min_interval_ms after the previous frame, so a burst of
+    state changes (a page load moving the character, replanning the compass route and updating the
+    coins) costs a single paint. Requests made while a frame is drawn schedule the next one.
+    """
+
+    def __init__(self, render: Callable[[list[str]], None], min_interval_ms: int = MINIMAP_FRAME_INTERVAL_MS,
+                 parent: QObject | None = None) -> None:
+        """
+        Args:
+            render (Callable): Draws one frame. Receives the reasons requested since the last frame.
+            min_interval_ms (int): Minimum time between two frames in milliseconds.
+            parent (QObject | None): Qt parent.
+        """
+        super().__init__(parent)
+        self._render = render
+        self.min_interval_ms = min_interval_ms
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.flush)
+        self._reasons = []  # Pending reasons, each once, in request order
+        self._last_frame = None  # time.monotonic() at the end of the last frame
+        self._in_frame = False
+        self.requests = 0
+        self.frames = 0
+        self.last_reasons = []  # Reasons behind the last frame drawn
+
+    @property
+    def dirty(self) -> bool:
+        """True if a frame has been requested but not drawn yet."""
+        return bool(self._reasons)
+
+    def request(self, reason: str = "update") -> None:
+        """
+        Mark the view dirty and schedule a frame, unless one is already pending.
+
+        Args:
+            reason (str): Why the view needs redrawing, recorded with the frame.
+        """
+        self.requests += 1
+        if reason not in self._reasons:
+            self._reasons.append(reason)
+        if not self._in_frame and not self._timer.isActive():
+            self._timer.start(self._delay_ms())
+
+    def flush(self) -> None:
+        """Draw the pending frame now instead of waiting for the event loop."""
+        self._timer.stop()
+        if not self._reasons or self._in_frame:
+            return
+
+        reasons, self._reasons = self._reasons, []
+        self._in_frame = True
+        try:
+            self._render(reasons)
+        except Exception as e:
+            logging.error(f"Failed to draw frame for {', '.join(reasons)}: {e}")
+        finally:
+            self._in_frame = False
+            self._last_frame = time.monotonic()
+            self.frames += 1
+            self.last_reasons = reasons
+        logging.debug(f"Frame {self.frames} drawn for {', '.join(reasons)} "
+                      f"({self.requests} requests so far)")
+
+        if self._reasons:
+            self._timer.start(self._delay_ms())
+
+    def _delay_ms(self) -> int:
+        """Milliseconds until the next frame may be drawn; 0 means the next event-loop turn."""
+        if self._last_frame is None:
+            return 0
+        elapsed_ms = (time.monotonic() - self._last_frame) * 1000
+        return max(0, math.ceil(self.min_interval_ms - elapsed_ms))
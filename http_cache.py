@@ -0,0 +1,141 @@
+from core_imports import *
+from constants import *
+
+# -----------------------
+# Conditional HTTP Cache
+# -----------------------
+
+@dataclass
+class CachedResponse:
+    """
+    Body of a GET answered through HttpCache, with whether it differs from the cached copy.
+
+    Offers the text/json() subset of requests.Response that the scraper parses.
+    """
+
+    url: str
+    content: bytes
+    encoding: str | None
+    status_code: int  # 200, or 304 when the server confirmed the cached copy
+    changed: bool  # False if the body is the same as the last one stored for the URL
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding or "utf-8", errors="replace")
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class HttpCache:
+    """
+    On-disk cache of GET responses keyed by URL, used to make conditional requests.
+
+    For each URL it keeps the ETag and Last-Modified validators, the SHA-256 of the body and the body
+    itself. Requests carry If-None-Match / If-Modified-Since, so an unchanged resource costs a 304
+    without a body. Servers that ignore validators still send the full body, but the hash tells the
+    caller that nothing changed and it can skip parsing and writing the data again.
+    """
+
+    def __init__(self, cache_dir: str = HTTP_CACHE_DIR) -> None:
+        """
+        Args:
+            cache_dir (str): Directory holding the cached entries. Created on first write.
+        """
+        self.cache_dir = cache_dir
+        self._lock = threading.Lock()
+
+    def get(self, session: requests.Session, url: str, **kwargs) -> CachedResponse:
+        """
+        GET a URL, conditionally if a cached copy exists.
+
+        Args:
+            session (requests.Session): Session used for the request.
+            url (str): URL to fetch.
+            **kwargs: Passed on to session.get, e.g. timeout.
+
+        Raises:
+            requests.RequestException: If the request fails or the response is an HTTP error.
+        """
+        entry = self._load(url)
+        headers = dict(kwargs.pop("headers", None) or {})
+        if entry is not None:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = session.get(url, headers=headers, **kwargs)
+        if response.status_code == 304 and entry is not None:
+            logging.debug(f"{url} not modified; using cached copy")
+            return CachedResponse(url, entry["body"], entry.get("encoding"), 304, False)
+        response.raise_for_status()
+
+        content = response.content
+        body_hash = hashlib.sha256(content).hexdigest()
+        changed = entry is None or entry.get("sha256") != body_hash
+        self._store(url, {
+            "url": url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "encoding": response.encoding,
+            "sha256": body_hash,
+        }, content if changed or entry is None else None)
+        if not changed:
+            logging.debug(f"{url} returned the cached body again")
+        return CachedResponse(url, content, response.encoding, response.status_code, changed)
+
+    def invalidate(self, url: str) -> None:
+        """Forget the cached copy of a URL, so the next get() is unconditional and reports a change."""
+        with self._lock:
+            for path in self._paths(url):
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    logging.warning(f"Failed to remove HTTP cache file {path}: {e}")
+
+    # -----------------------
+    # Storage
+    # -----------------------
+
+    def _paths(self, url: str) -> tuple[str, str]:
+        """Return the (metadata, body) file paths of a URL."""
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.json"), os.path.join(self.cache_dir, f"{key}.body")
+
+    def _load(self, url: str) -> dict | None:
+        """Return the cached metadata of a URL plus its body under "body", or None if not usable."""
+        meta_path, body_path = self._paths(url)
+        with self._lock:
+            try:
+                with open(meta_path, "r", encoding="utf-8") as meta_file:
+                    entry = json.load(meta_file)
+                with open(body_path, "rb") as body_file:
+                    entry["body"] = body_file.read()
+            except FileNotFoundError:
+                return None
+            except (OSError, ValueError) as e:
+                logging.warning(f"Ignoring unreadable HTTP cache entry for {url}: {e}")
+                return None
+        if entry.get("url") != url or hashlib.sha256(entry["body"]).hexdigest() != entry.get("sha256"):
+            logging.warning(f"Ignoring inconsistent HTTP cache entry for {url}")
+            return None
+        return entry
+
+    def _store(self, url: str, meta: dict, body: bytes | None) -> None:
+        """Write the metadata of a URL and, if given, its new body. Failures are logged, not raised."""
+        meta_path, body_path = self._paths(url)
+        with self._lock:
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                if body is not None:
+                    with open(body_path + ".tmp", "wb") as body_file:
+                        body_file.write(body)
+                    os.replace(body_path + ".tmp", body_path)
+                with open(meta_path + ".tmp", "w", encoding="utf-8") as meta_file:
+                    json.dump(meta, meta_file)
+                os.replace(meta_path + ".tmp", meta_path)
+            except OSError as e:
+                logging.warning(f"Failed to write HTTP cache entry for {url}: {e}")
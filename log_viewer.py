@@ -1,5 +1,6 @@
 from imports import *
 from constants import *
+from splash import *
 
 class LogViewer(QDialog):
     """A dialog window to view and optionally send application logs."""
@@ -1,7 +1,13 @@
+from dependency_check import ensure_required_modules
+
+# Check before importing the app, which needs the third-party modules
+ensure_required_modules()
+
 from imports import *
 from constants import *
 
-from splash import SplashScreen, splash_message
+from bootstrap import bootstrap
+from splash import SplashScreen
 from rbc_community_map import RBCCommunityMap
 
 def main() -> None:
@@ -17,23 +23,12 @@ def main() -> None:
     splash.show()
     splash.show_message("Starting up...")
 
-    main_window = RBCCommunityMap()
-
-    init_methods = [
-        '_init_scraper',
-        '_init_window_properties',
-        '_init_web_profile',
-        '_init_ui_state',
-        '_init_characters',
-        '_init_ui_components',
-        '_finalize_setup'
-    ]
+    # Directories, logging and the database
+    bootstrap()
 
-    for name in init_methods:
-        method = getattr(main_window, name)
-        setattr(main_window, name, splash_message(splash)(method))
+    # Runs the startup stages, reporting progress and timings on the splash screen
+    main_window = RBCCommunityMap(splash)
 
-    main_window.splash = splash
     main_window.show()
     splash.finish(main_window)
 
@@ -0,0 +1,374 @@
+from core_imports import *
+from constants import *
+import PySide6.QtGui  # QColor for the fallback color mappings
+from database import *
+from street_index import *
+from nearest_grid import *
+from transit_router import *
+from page_extractor import *
+from coordinate_decoder import *
+
+# -----------------------
+# Map Model
+# -----------------------
+
+class MapModel:
+    """
+    Map data and minimap view state, with the queries the minimap, info frame and compass are built from.
+
+    RBCCommunityMap mixes this in and fills the attributes during startup. Tools and benchmarks create
+    one with from_database() instead. Nothing here creates or touches widgets, so it runs without a
+    display.
+
+    Attributes read by the queries:
+        columns, rows, street_index, *_coordinates, color_mappings: Map data, see load_map_data().
+        nearest_grid, transit_router: Lookup structures built from the map data.
+        zoom_level, column_start, row_start, minimap_size: Visible part of the minimap.
+        destination, selected_route_label, selected_route_path: Compass state.
+    """
+
+    @classmethod
+    def from_database(cls, zoom_level: int = 3, minimap_size: int = MINIMAP_SIZE) -> "MapModel":
+        """
+        Load a model from the database with the minimap at the top-left corner and no destination.
+
+        Call bootstrap() first, so the database exists.
+        """
+        model = cls()
+        model.load_map_data()
+        model.minimap_size = minimap_size
+        model.zoom_level = zoom_level
+        model.column_start = model.row_start = 0
+        model.destination = None
+        model.selected_route_label = None
+        model.selected_route_description = None
+        model.selected_route_path = None
+        return model
+
+    def load_map_data(self) -> None:
+        """Load the map data from the database, with empty fallback data if that fails."""
+        try:
+            (
+                self.columns, self.rows, self.street_index, self.banks_coordinates, self.taverns_coordinates,
+                self.transits_coordinates, self.user_buildings_coordinates, self.color_mappings,
+                self.shops_coordinates, self.guilds_coordinates, self.places_of_interest_coordinates,
+                self.keybind_config, self.current_css_profile,
+                self.selected_character, self.destination  # <-- just store, don't update minimap yet
+            ) = load_data()
+
+        except sqlite3.Error as e:
+            logging.critical(f"Failed to load initial data: {e}")
+            # Use fallback data
+            self.columns = self.rows = self.banks_coordinates = self.taverns_coordinates = \
+                self.transits_coordinates = self.user_buildings_coordinates = \
+                self.shops_coordinates = self.guilds_coordinates = self.places_of_interest_coordinates = {}
+            self.street_index = StreetIndex({}, {})
+            self.color_mappings = {'default': PySide6.QtGui.QColor('#000000')}
+            self.keybind_config = 1
+            self.current_css_profile = "Default"
+            self.selected_character = None
+            self.destination = None
+
+        self.nearest_grid = NearestFacilityGrid.from_map_data(
+            self.columns, self.rows, self.banks_coordinates, self.taverns_coordinates, self.transits_coordinates
+        )
+        self.transit_router = TransitRouter.from_map_data(self.columns, self.rows, self.transits_coordinates)
+
+    def current_position(self) -> tuple[int, int]:
+        """Return the (x, y) cell at the centre of the minimap."""
+        return self.column_start + self.zoom_level // 2, self.row_start + self.zoom_level // 2
+
+    # -----------------------
+    # Page Data
+    # -----------------------
+
+    def extract_coordinates(self, snapshot):
+        """
+        Work out the character's coordinates from a page snapshot.
+
+        Args:
+            snapshot (PageSnapshot): Analysed game page.
+
+        Returns:
+            tuple: (x, y) of the character, or (None, None) if the page has no coordinate inputs.
+        """
+        x, y = decode_coordinates(snapshot, self.zoom_level)
+        logging.debug(f"Decoded coordinates x={x}, y={y} from first input x={snapshot.first_x}, "
+                      f"y={snapshot.first_y} with {snapshot.cityblocks} city limit blocks")
+        return x, y
+
+    # -----------------------
+    # Nearest Locations
+    # -----------------------
+
+    def find_nearest_tavern(self, x, y):
+        """
+        Find the nearest tavern to the given coordinates.
+
+        Args:
+            x (int): X coordinate.
+            y (int): Y coordinate.
+
+        Returns:
+            tuple | None: (name, (x, y), ap_cost) of the nearest tavern, or None if there are none.
+        """
+        return self.nearest_grid.nearest("tavern", x, y)
+
+    def find_nearest_bank(self, x, y):
+        """
+        Find the nearest bank to the given coordinates.
+
+        Args:
+            x (int): X coordinate.
+            y (int): Y coordinate.
+
+        Returns:
+            tuple | None: (name, (x, y), ap_cost) of the nearest bank building, or None if there are none.
+        """
+        return self.nearest_grid.nearest("bank", x, y)
+
+    def find_nearest_transit(self, x, y):
+        """
+        Find the nearest transit station to the given coordinates.
+
+        Args:
+            x (int): X coordinate.
+            y (int): Y coordinate.
+
+        Returns:
+            tuple | None: (name, (x, y), ap_cost) of the nearest transit, or None if there are none.
+        """
+        return self.nearest_grid.nearest("transit", x, y)
+
+    def calculate_ap_cost(self, start, end):
+        """
+        Calculate the AP cost of moving from start to end using the Chebyshev distance.
+
+        Args:
+            start (tuple): Starting coordinates (x, y).
+            end (tuple): Ending coordinates (x, y).
+
+        Returns:
+            int: AP cost of moving from start to end.
+        """
+        return max(abs(start[0] - end[0]), abs(start[1] - end[1]))
+
+    def get_intersection_name(self, coords):
+        """
+        Get the intersection name for the given coordinates, including edge cases.
+
+        Args:
+            coords (tuple): Coordinates (x, y).
+
+        Returns:
+            str: Readable intersection like "Nickel & 55th" or fallback "x, y".
+        """
+        x, y = coords
+
+        # Try direct match
+        column_name = self.street_index.column_name(x)
+        row_name = self.street_index.row_name(y)
+
+        # Fallback to offset-based match
+        if not column_name:
+            column_name = self.street_index.column_name(x - 1)
+        if not row_name:
+            row_name = self.street_index.row_name(y - 1)
+
+        if column_name and row_name:
+            return f"{column_name} & {row_name}"
+        elif column_name:
+            return f"{column_name} & Unknown Row"
+        elif row_name:
+            return f"Unknown Column & {row_name}"
+        else:
+            return f"{x}, {y}"  # raw coords as fallback
+
+    # -----------------------
+    # Info Frame
+    # -----------------------
+
+    def info_frame_text(self) -> dict:
+        """
+        Build the text of the info frame labels for the current position.
+
+        Returns:
+            dict: Label name ("bank", "transit", "tavern", "destination", "transit_destination") -> text.
+            A label is missing if there is nothing new to show, e.g. when there are no banks.
+        """
+        current_x, current_y = self.current_position()
+        text = {}
+
+        # Closest Bank
+        nearest_bank = self.find_nearest_bank(current_x, current_y)
+        if nearest_bank:
+            _, bank_coords, bank_ap_cost = nearest_bank
+            bank_intersection = self.get_intersection_name(bank_coords)
+            text["bank"] = f"Bank\n{bank_intersection} - AP: {bank_ap_cost}"
+
+        # Closest Transit
+        nearest_transit = self.find_nearest_transit(current_x, current_y)
+        if nearest_transit:
+            transit_name, transit_coords, transit_ap_cost = nearest_transit
+            transit_intersection = self.get_intersection_name(transit_coords)
+            text["transit"] = f"Transit - {transit_name}\n{transit_intersection} - AP: {transit_ap_cost}"
+
+        # Closest Tavern
+        nearest_tavern = self.find_nearest_tavern(current_x, current_y)
+        if nearest_tavern:
+            tavern_name, tavern_coords, tavern_ap_cost = nearest_tavern
+            tavern_intersection = self.get_intersection_name(tavern_coords)
+            text["tavern"] = f"{tavern_name}\n{tavern_intersection} - AP: {tavern_ap_cost}"
+
+        # Set Destination Info
+        if self.destination:
+            destination_coords = self.destination
+            destination_ap_cost = self.calculate_ap_cost((current_x, current_y), destination_coords)
+            destination_intersection = self.get_intersection_name(destination_coords)
+
+            # Check for a named place at destination
+            place_name = next(
+                (name for name, coords in {
+                    **self.guilds_coordinates,
+                    **self.shops_coordinates,
+                    **self.user_buildings_coordinates,
+                    **self.places_of_interest_coordinates
+                }.items() if coords == destination_coords),
+                None
+            )
+
+            destination_label_text = place_name if place_name else "Set Destination"
+            text["destination"] = f"{destination_label_text}\n{destination_intersection} - AP: {destination_ap_cost}"
+
+            # Transit-Based AP Cost for Set Destination
+            transit_route = self.transit_router.best_transit_route((current_x, current_y), destination_coords)
+
+            if transit_route:
+                total_ap_via_transit, transit_path = transit_route
+                dest_transit_coords = transit_path[-2]
+                char_transit_name = self.transit_router.station_name(transit_path[1])
+                dest_transit_name = self.transit_router.station_name(dest_transit_coords)
+
+                # Update the transit destination label to include destination name
+                destination_name = place_name if place_name else "Set Destination"
+                text["transit_destination"] = (
+                    f"{destination_name} - {char_transit_name} to {dest_transit_name}\n"
+                    f"{self.get_intersection_name(dest_transit_coords)} - Total AP: {total_ap_via_transit}"
+                )
+
+            else:
+                text["transit_destination"] = "Transit Route Info Unavailable"
+
+        else:
+            # Clear labels when no destination is set
+            text["destination"] = "No Destination Set"
+            text["transit_destination"] = "No Destination Set"
+
+        return text
+
+    # -----------------------
+    # Compass Routes
+    # -----------------------
+
+    def get_compass_routes(self):
+        """
+        Build the compass routes from the player's position to the destination.
+
+        Returns:
+            tuple: (direct_route, transit_route, alternative_routes). Each route is (ap_cost, description, path);
+            alternative_routes lists further transit routes in increasing AP cost.
+        """
+        current_x, current_y = self.current_position()
+
+        dest_x, dest_y = self.destination
+
+        # ----------------------------
+        # Direct Route
+        # ----------------------------
+        direct_ap = max(abs(dest_x - current_x), abs(dest_y - current_y))
+        direct_desc = arrow_description((current_x, current_y), (dest_x, dest_y))
+        direct_path = [(current_x, current_y), (dest_x, dest_y)]
+        direct_route = (direct_ap, direct_desc, direct_path)
+
+        # ----------------------------
+        # Transit Routes
+        # ----------------------------
+        # Ask for one extra route since the cheapest may be the direct walk
+        transit_routes = []
+        for ap_cost, path in self.transit_router.routes(
+                (current_x, current_y), (dest_x, dest_y), TRANSIT_ROUTE_ALTERNATIVES + 1):
+            if len(path) <= 2:
+                continue  # Direct walk, covered above
+
+            # Legs alternate walk, ride, walk, ...
+            legs = ["Transit" if index % 2 else arrow_description(path[index], path[index + 1])
+                    for index in range(len(path) - 1)]
+            transit_routes.append((ap_cost, " + ".join(legs), path))
+
+        if transit_routes:
+            transit_route = transit_routes[0]
+            alternative_routes = transit_routes[1:TRANSIT_ROUTE_ALTERNATIVES]
+        else:
+            transit_route = (9999, "Transit route unavailable", [])
+            alternative_routes = []
+
+        return direct_route, transit_route, alternative_routes
+
+    def select_compass_route(self, direct_route, transit_route, alternative_routes):
+        """
+        Pick the route matching the current selection, or the cheapest one if nothing is selected.
+
+        Args:
+            direct_route (tuple): (ap_cost, description, path) of the direct walk.
+            transit_route (tuple): (ap_cost, description, path) of the cheapest transit route.
+            alternative_routes (list): Further transit routes, labelled "Transit Route 2", "Transit Route 3", ...
+
+        Returns:
+            tuple: The selected (ap_cost, description, path).
+        """
+        if self.selected_route_label == "Direct Route":
+            return direct_route
+        if self.selected_route_label == "Transit Route":
+            return transit_route
+        if self.selected_route_label and self.selected_route_label.startswith("Transit Route "):
+            index = int(self.selected_route_label.rsplit(" ", 1)[1]) - 2
+            if 0 <= index < len(alternative_routes):
+                return alternative_routes[index]
+            self.selected_route_label = "Transit Route"  # Alternative no longer offered
+            return transit_route
+
+        selected = direct_route if direct_route[0] <= transit_route[0] else transit_route
+        self.selected_route_label = "Direct Route" if selected == direct_route else "Transit Route"
+        return selected
+
+
+def arrow_description(start, end) -> str:
+    """Describe a walk as diagonal and straight steps, e.g. "3↘ + 2→", or "0⦿" for no move."""
+    dx = end[0] - start[0]
+    dy = end[1] - start[1]
+
+    steps_diagonal = min(abs(dx), abs(dy))
+    steps_straight = abs(abs(dx) - abs(dy))
+
+    diagonal_arrow = ''
+    if dx < 0 and dy < 0:
+        diagonal_arrow = '↖'
+    elif dx > 0 and dy < 0:
+        diagonal_arrow = '↗'
+    elif dx < 0 and dy > 0:
+        diagonal_arrow = '↙'
+    elif dx > 0 and dy > 0:
+        diagonal_arrow = '↘'
+
+    straight_arrow = ''
+    if abs(dx) > abs(dy):
+        straight_arrow = '→' if dx > 0 else '←'
+    elif abs(dy) > abs(dx):
+        straight_arrow = '↓' if dy > 0 else '↑'
+
+    parts = []
+    if steps_diagonal:
+        parts.append(f"{steps_diagonal}{diagonal_arrow}")
+    if steps_straight:
+        parts.append(f"{steps_straight}{straight_arrow}")
+    return " + ".join(parts) if parts else "0⦿"
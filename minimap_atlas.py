@@ -0,0 +1,374 @@
+from core_imports import *
+from constants import *
+import PySide6.QtGui
+
+# -----------------------
+# Minimap Static Layer Cache
+# -----------------------
+
+# drawText flags of the label boxes: wrapped from the top edge at zoom 5 and 7, one centred line at zoom 3
+WRAPPED_LABEL_FLAGS = Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop | Qt.TextFlag.TextWordWrap
+CENTERED_LABEL_FLAGS = Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignVCenter
+
+
+@dataclass(frozen=True)
+class LabelLayout:
+    """Font, box height and text flags of one minimap label box, worked out once and reused."""
+
+    font: PySide6.QtGui.QFont
+    height: int  # Box height; at zoom 5 and 7 the wrapped text height, up to the base height
+    flags: Qt.AlignmentFlag  # WRAPPED_LABEL_FLAGS or CENTERED_LABEL_FLAGS
+
+
+class MinimapAtlas:
+    """
+    Cache of pre-rendered static minimap layers.
+
+    The city grid, street/alley/edge colours, intersection labels and the bank, tavern, transit,
+    user building, shop, guild and place-of-interest boxes never change while the player moves,
+    so they are rendered once into QImage tiles and blitted on every minimap update.
+
+    Tiles are rendered on first use and kept in a bounded LRU cache. Rendering the whole city up
+    front is not practical: at zoom 3 a single cell is 93px wide, which puts the full 202x202 map
+    well above a gigabyte of image memory.
+
+    The cache is keyed by a signature of the zoom level, the street index, the colour theme and the
+    shop/guild coordinates, and is dropped automatically whenever one of those changes. The layout of
+    each label box (its font and wrapped height) is cached separately and survives that, as it only
+    depends on the text, the box size, the zoom level and the font.
+
+    Tiles are QImages, so the atlas can render on any thread, but only one thread may render at a
+    time. invalidate() and invalidate_cells() may be called from any thread: they are queued and
+    applied at the start of the next render.
+    """
+
+    TILE_PIXELS = 512  # Approximate edge length of a single tile in pixels
+    MAX_TILES = 36  # Upper bound on cached tiles across the visible area
+    MAX_LABEL_LAYOUTS = 4096  # Upper bound on cached label layouts, more than MAX_TILES tiles show at any zoom
+
+    def __init__(self, minimap_size: int) -> None:
+        """
+        Args:
+            minimap_size (int): Edge length of the minimap in pixels.
+        """
+        self.minimap_size = minimap_size
+        self._signature = None
+        self._tiles = {}
+        self._labels_by_cell = {}
+        self._label_layouts = {}  # (text, width, base height, zoom level, font key) -> LabelLayout
+        self._invalidations = []  # None drops everything, a set of cells drops their tiles
+        self._invalidations_lock = threading.Lock()
+
+    def invalidate(self) -> None:
+        """Drop every cached tile so the next render rebuilds them."""
+        with self._invalidations_lock:
+            self._invalidations.append(None)
+
+    def invalidate_cells(self, cells) -> None:
+        """
+        Drop only the tiles showing the given cells, e.g. after shops or guilds moved in or out of them.
+
+        The labels are re-indexed from the layer of the next render, so call this after updating the
+        map data the layer is captured from.
+
+        Args:
+            cells: (column, row) positions whose location boxes changed.
+        """
+        with self._invalidations_lock:
+            self._invalidations.append(set(cells))
+
+    def render(self, painter: PySide6.QtGui.QPainter, layer, zoom_level: int, column_start: int, row_start: int,
+               cancelled: Callable[[], bool] | None = None) -> bool:
+        """
+        Blit the static layer for the visible window onto the painter.
+
+        Args:
+            painter (QPainter): Painter targeting the minimap image.
+            layer (MinimapLayer): Map data to draw.
+            zoom_level (int): Number of cells shown along each side of the minimap.
+            column_start (int): Leftmost visible column coordinate.
+            row_start (int): Topmost visible row coordinate.
+            cancelled (Callable | None): Checked before each tile is drawn; returning True stops the render.
+
+        Returns:
+            bool: False if the render was cancelled before every tile was drawn.
+        """
+        self._apply_invalidations(layer)
+
+        signature = self._build_signature(layer, zoom_level)
+        if signature != self._signature:
+            self._drop_all()
+            self._signature = signature
+            self._labels_by_cell = self._index_labels(layer)
+            logging.debug(f"Minimap atlas rebuilt for zoom level {zoom_level}")
+
+        block_size = self.minimap_size // zoom_level
+        tile_cells = self._tile_cells(block_size)
+
+        painter.save()
+        painter.setClipRect(0, 0, block_size * zoom_level, block_size * zoom_level)
+
+        first_tile_col, last_tile_col = column_start // tile_cells, (column_start + zoom_level - 1) // tile_cells
+        first_tile_row, last_tile_row = row_start // tile_cells, (row_start + zoom_level - 1) // tile_cells
+
+        completed = True
+        for tile_row in range(first_tile_row, last_tile_row + 1):
+            for tile_col in range(first_tile_col, last_tile_col + 1):
+                if cancelled is not None and cancelled():
+                    completed = False
+                    break
+                tile = self._get_tile(layer, tile_col, tile_row, tile_cells, zoom_level, block_size)
+                painter.drawImage(
+                    (tile_col * tile_cells - column_start) * block_size,
+                    (tile_row * tile_cells - row_start) * block_size,
+                    tile
+                )
+            if not completed:
+                break
+
+        painter.restore()
+        return completed
+
+    # -----------------------
+    # Cache Bookkeeping
+    # -----------------------
+
+    def _drop_all(self) -> None:
+        self._signature = None
+        self._tiles.clear()
+        self._labels_by_cell.clear()
+
+    def _apply_invalidations(self, layer) -> None:
+        """Apply the invalidations queued since the last render."""
+        with self._invalidations_lock:
+            invalidations, self._invalidations = self._invalidations, []
+
+        for cells in invalidations:
+            if cells is None:
+                self._drop_all()
+            elif self._signature is not None:  # Nothing to drop before the first render
+                zoom_level = self._signature[0]
+                self._signature = self._build_signature(layer, zoom_level)
+                self._labels_by_cell = self._index_labels(layer)
+                tile_cells = self._tile_cells(self.minimap_size // zoom_level)
+                for column_index, row_index in cells:
+                    if column_index is not None and row_index is not None:
+                        self._tiles.pop((column_index // tile_cells, row_index // tile_cells), None)
+
+    @staticmethod
+    def _build_signature(layer, zoom_level: int) -> tuple:
+        """Build the cache key from everything the static layer depends on."""
+        return (
+            zoom_level,
+            layer.street_index,
+            tuple(sorted((key, color.rgba()) for key, color in layer.color_mappings.items())),
+            tuple(sorted(layer.shops_coordinates.items(), key=lambda item: item[0])),
+            tuple(sorted(layer.guilds_coordinates.items(), key=lambda item: item[0])),
+        )
+
+    def _tile_cells(self, block_size: int) -> int:
+        """Number of cells along each side of a tile for the given cell size."""
+        return max(1, self.TILE_PIXELS // max(1, block_size))
+
+    def _get_tile(self, layer, tile_col: int, tile_row: int, tile_cells: int, zoom_level: int,
+                  block_size: int) -> PySide6.QtGui.QImage:
+        """Return a cached tile, rendering it first if needed."""
+        key = (tile_col, tile_row)
+        tile = self._tiles.pop(key, None)
+        if tile is None:
+            tile = self._render_tile(layer, tile_col * tile_cells, tile_row * tile_cells, tile_cells, zoom_level,
+                                     block_size)
+            if len(self._tiles) >= self.MAX_TILES:
+                self._tiles.pop(next(iter(self._tiles)))  # Evict least recently used
+        self._tiles[key] = tile  # Re-insert to mark as most recently used
+        return tile
+
+    @staticmethod
+    def _index_labels(layer) -> dict:
+        """
+        Group every special location box by the cell it is drawn in.
+
+        Args:
+            layer (MinimapLayer): Map data to index.
+
+        Returns:
+            dict: (column, row) -> list of (color, text) in draw order.
+        """
+        labels = {}
+
+        def add(column_index, row_index, color, text):
+            if column_index is not None and row_index is not None:
+                labels.setdefault((column_index, row_index), []).append((color, text))
+
+        # Banks are stored by street name and drawn one cell south-east of the intersection
+        for bank_key in layer.banks_coordinates.keys():
+            if " & " in bank_key:
+                col_name, row_name = bank_key.split(" & ")
+                col = layer.columns.get(col_name, 0)
+                row = layer.rows.get(row_name, 0)
+                add(col + 1, row + 1, layer.color_mappings["bank"], "BANK")
+            else:
+                logging.warning(f"Skipping invalid bank_key format: {bank_key}")
+
+        for name, (column_index, row_index) in layer.taverns_coordinates.items():
+            add(column_index, row_index, layer.color_mappings["tavern"], name)
+
+        for name, (column_index, row_index) in layer.transits_coordinates.items():
+            add(column_index, row_index, layer.color_mappings["transit"], name)
+
+        for name, (column_index, row_index) in layer.user_buildings_coordinates.items():
+            add(column_index, row_index, layer.color_mappings["user_building"], name)
+
+        for name, (column_index, row_index) in layer.shops_coordinates.items():
+            add(column_index, row_index, layer.color_mappings["shop"], name)
+
+        for name, (column_index, row_index) in layer.guilds_coordinates.items():
+            add(column_index, row_index, layer.color_mappings["guild"], name)
+
+        for name, (column_index, row_index) in layer.places_of_interest_coordinates.items():
+            if name.lower() == "graveyard":
+                color = layer.color_mappings.get("graveyard", layer.color_mappings["placesofinterest"])
+            else:
+                color = layer.color_mappings["placesofinterest"]
+            add(column_index, row_index, color, name)
+
+        return labels
+
+    # -----------------------
+    # Tile Rendering
+    # -----------------------
+
+    def _render_tile(self, layer, origin_column: int, origin_row: int, tile_cells: int, zoom_level: int,
+                     block_size: int) -> PySide6.QtGui.QImage:
+        """
+        Render the static layer for a square block of cells.
+
+        Args:
+            layer (MinimapLayer): Map data to draw.
+            origin_column (int): Column coordinate of the tile's top-left cell.
+            origin_row (int): Row coordinate of the tile's top-left cell.
+            tile_cells (int): Number of cells along each side of the tile.
+            zoom_level (int): Zoom level the tile is rendered for.
+            block_size (int): Size of a single cell in pixels.
+        """
+        border_size = 1  # Size of the border around each cell
+
+        tile = PySide6.QtGui.QImage(tile_cells * block_size, tile_cells * block_size,
+                                    PySide6.QtGui.QImage.Format.Format_ARGB32_Premultiplied)
+        tile.fill(PySide6.QtGui.QColor('lightgrey'))
+        painter = PySide6.QtGui.QPainter(tile)
+
+        font = painter.font()
+        font.setPointSize(max(8, block_size // 4))  # Dynamically adjust font size, with a minimum of 8
+        painter.setFont(font)
+        font_key = font.key()
+
+        edge_color = PySide6.QtGui.QColor(layer.color_mappings["edge"])
+        street_color = PySide6.QtGui.QColor(layer.color_mappings["street"])
+        alley_color = PySide6.QtGui.QColor(layer.color_mappings["alley"])
+
+        if zoom_level >= 5:
+            label_font = painter.font()
+            label_font.setPointSize(
+                max(4, min(7, block_size // 5)) if zoom_level == 5 else max(4, min(6, block_size // 6)))
+            line_height = PySide6.QtGui.QFontMetrics(label_font).lineSpacing()
+            location_label_height = min(line_height * 2 + 4, block_size)
+        else:
+            location_label_height = block_size // 3
+
+        for i in range(tile_cells):
+            for j in range(tile_cells):
+                column_index = origin_column + j
+                row_index = origin_row + i
+                x0, y0 = j * block_size, i * block_size
+
+                # Draw the cell background
+                painter.setPen(PySide6.QtGui.QColor('white'))
+                painter.drawRect(x0, y0, block_size - border_size, block_size - border_size)
+
+                # Draw cell background color to match in-game city grid
+                if column_index < 1 or column_index > 200 or row_index < 1 or row_index > 200:
+                    cell_color = edge_color  # Map edges (border)
+                elif column_index % 2 == 0 or row_index % 2 == 0:
+                    cell_color = street_color  # If either coordinate is even → Streets (Gray)
+                else:
+                    cell_color = alley_color  # Both coordinates odd → City Blocks (Black)
+                painter.fillRect(x0 + border_size, y0 + border_size, block_size - 2 * border_size,
+                                 block_size - 2 * border_size, cell_color)
+
+                column_name = layer.street_index.column_name(column_index)
+                row_name = layer.street_index.row_name(row_index)
+                if column_name and row_name:
+                    text = f"{column_name} & {row_name}"
+                    label = self._label_layout(font, font_key, zoom_level, block_size - 4, block_size // 3, text)
+                    self._draw_label_box(painter, label, x0 + 2, y0 + 2, block_size - 4,
+                                         layer.color_mappings["intersect"], text)
+
+                for color, text in self._labels_by_cell.get((column_index, row_index), ()):
+                    label = self._label_layout(font, font_key, zoom_level, block_size, location_label_height, text)
+                    self._draw_label_box(painter, label, x0, y0, block_size, color, text)
+
+        painter.end()
+        return tile
+
+    def _label_layout(self, font: PySide6.QtGui.QFont, font_key: str, zoom_level: int, width: int,
+                      base_height: int, text: str) -> LabelLayout:
+        """
+        Return the cached layout of a label box, working it out first if needed.
+
+        Args:
+            font (QFont): Font of the tile the label is drawn on.
+            font_key (str): font.key(), computed once per tile.
+            zoom_level (int): Zoom level the tile is rendered for.
+            width (int): Width of the box in pixels.
+            base_height (int): Height of the box, and the most it may grow to at zoom 5 and 7.
+            text (str): Label text.
+        """
+        key = (text, width, base_height, zoom_level, font_key)
+        layout = self._label_layouts.get(key)
+        if layout is None:
+            layout = self._layout_label(font, zoom_level, width, base_height, text)
+            if len(self._label_layouts) >= self.MAX_LABEL_LAYOUTS:
+                self._label_layouts.pop(next(iter(self._label_layouts)))  # Evict the oldest
+            self._label_layouts[key] = layout
+        return layout
+
+    @staticmethod
+    def _layout_label(font: PySide6.QtGui.QFont, zoom_level: int, width: int, base_height: int,
+                      text: str) -> LabelLayout:
+        """
+        Work out the font and height of a label box.
+        Allows wrapped text to grow to 2 lines in zoom 5 and 7.
+        """
+        # Set font based on zoom level
+        font = PySide6.QtGui.QFont(font)
+        if zoom_level == 3:
+            font.setPointSize(max(4, min(8, width // 4)))
+        elif zoom_level == 5:
+            font.setPointSize(max(4, min(7, width // 5)))
+        elif zoom_level == 7:
+            font.setPointSize(max(4, min(6, width // 6)))
+
+        # Calculate actual wrapped height using boundingRect
+        if zoom_level >= 5:
+            font_metrics = PySide6.QtGui.QFontMetrics(font)
+            wrapped_rect = font_metrics.boundingRect(QRect(0, 0, width, 1000), WRAPPED_LABEL_FLAGS, text)
+            return LabelLayout(font, min(wrapped_rect.height() + 4, base_height), WRAPPED_LABEL_FLAGS)
+        return LabelLayout(font, base_height, CENTERED_LABEL_FLAGS)
+
+    @staticmethod
+    def _draw_label_box(painter: PySide6.QtGui.QPainter, layout: LabelLayout, x: int, y: int, width: int,
+                        bg_color: PySide6.QtGui.QColor, text: str) -> None:
+        """
+        Draws a text label box with a background color, white border, and properly formatted text.
+        """
+        painter.setFont(layout.font)
+
+        # Draw background and white border
+        text_rect = QRect(x, y, width, layout.height)
+        painter.fillRect(text_rect, bg_color)
+        painter.setPen(PySide6.QtGui.QColor('white'))
+        painter.drawRect(text_rect)
+
+        # Draw text
+        painter.drawText(text_rect, layout.flags, text)
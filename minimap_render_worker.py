@@ -0,0 +1,97 @@
+from core_imports import *
+from constants import *
+from minimap_renderer import *
+
+# -----------------------
+# Background Rasterisation
+# -----------------------
+
+class MinimapRenderWorker(QObject):
+    """
+    Rasterises minimap frames off the GUI thread and reports them through `frame_ready`.
+
+    request() takes a MinimapState captured on the GUI thread. Frames are drawn into a QImage one
+    at a time on the worker's own single-thread pool, which is the only thread the renderer's atlas
+    is used from. Requests made while a frame is drawn wait, and only the newest is drawn next. The
+    frame being drawn is finished and shown unless a request moves the view away from it: then it
+    stops at its next tile and is dropped, so a burst of overlay updates cannot keep every frame
+    from finishing. Signals are delivered on the thread that owns the worker, normally the GUI
+    thread, so slots may touch widgets.
+    """
+
+    frame_ready = pyqtSignal(object, object)  # QImage, the MinimapState it was drawn from
+    _done = pyqtSignal(object, object, int)  # Pool thread -> owner thread: image or None, state, generation
+
+    def __init__(self, renderer: MinimapRenderer, parent: QObject | None = None) -> None:
+        """
+        Args:
+            renderer (MinimapRenderer): Renderer to draw with. Its atlas must not be rendered from elsewhere.
+            parent (QObject | None): Qt parent.
+        """
+        super().__init__(parent)
+        self.renderer = renderer
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        self._done.connect(self._on_done)
+        self._generation = 0  # Bumped to cancel the frame being drawn
+        self._pending = None  # Newest state not handed to the pool yet
+        self._drawing = None  # State of the frame on the pool, if any
+        self._stopped = False
+        self.frames = 0
+        self.dropped = 0
+
+    def request(self, state: MinimapState) -> None:
+        """Draw a frame of the given state, replacing any frame still waiting to be drawn."""
+        self._stopped = False
+        self._pending = state
+        if self._drawing is None:
+            self._start()
+        elif self._drawing.view != state.view:
+            self._generation += 1  # The frame being drawn shows cells that are no longer in view
+
+    def stop(self) -> None:
+        """Drop the waiting frame, cancel the running one and wait for the pool thread to finish."""
+        self._stopped = True
+        self._generation += 1
+        self._pending = None
+        self.pool.waitForDone()
+
+    def _start(self) -> None:
+        self._drawing, self._pending = self._pending, None
+        self.pool.start(_RenderRunnable(self, self._drawing, self._generation))
+
+    def _run(self, state: MinimapState, generation: int) -> None:
+        """Draw a frame on the pool thread and hand it to the owner thread."""
+        image = None
+        try:
+            image = self.renderer.render_image(state, lambda: generation != self._generation)
+        except Exception as e:
+            logging.error(f"Failed to draw minimap frame: {e}")
+        finally:
+            self._done.emit(image, state, generation)
+
+    def _on_done(self, image, state: MinimapState, generation: int) -> None:
+        self._drawing = None
+        if image is None and generation != self._generation:
+            self.dropped += 1
+            logging.debug(f"Dropped stale minimap frame at ({state.column_start}, {state.row_start})")
+        elif image is not None and not self._stopped:
+            # Frames finish in request order, so no newer frame has been shown yet
+            self.frames += 1
+            self.frame_ready.emit(image, state)
+
+        if self._pending is not None:
+            self._start()
+
+
+class _RenderRunnable(QRunnable):
+    """Draws one MinimapRenderWorker frame on its pool thread."""
+
+    def __init__(self, worker: MinimapRenderWorker, state: MinimapState, generation: int) -> None:
+        super().__init__()
+        self.worker = worker
+        self.state = state
+        self.generation = generation
+
+    def run(self) -> None:
+        self.worker._run(self.state, self.generation)
@@ -0,0 +1,208 @@
+from core_imports import *
+from constants import *
+import PySide6.QtGui
+from minimap_atlas import *
+
+# -----------------------
+# Frame State
+# -----------------------
+
+@dataclass(frozen=True)
+class MinimapLayer:
+    """
+    The map data the static minimap layer is drawn from.
+
+    MapModel replaces these dicts whenever it reloads them and never changes them in place, so a
+    layer can share them with the model and still stays the same while a frame is drawn.
+    """
+
+    columns: dict
+    rows: dict
+    street_index: object  # StreetIndex
+    color_mappings: dict
+    banks_coordinates: dict
+    taverns_coordinates: dict
+    transits_coordinates: dict
+    user_buildings_coordinates: dict
+    shops_coordinates: dict
+    guilds_coordinates: dict
+    places_of_interest_coordinates: dict
+
+    @classmethod
+    def from_model(cls, model) -> "MinimapLayer":
+        return cls(**{name: getattr(model, name) for name in cls.__dataclass_fields__})
+
+
+@dataclass(frozen=True)
+class MinimapState:
+    """
+    Everything one minimap frame is drawn from, captured on the GUI thread by MinimapRenderer.snapshot().
+
+    Drawing reads only the state, never the model, so a frame can be rasterised on another thread
+    while the model keeps changing.
+    """
+
+    zoom_level: int
+    column_start: int
+    row_start: int
+    position: tuple  # (x, y) of the cell the overlays start from
+    nearest: tuple  # (color name, (x, y)) of the nearest tavern, bank and transit that were found
+    destination: tuple | None
+    route_label: str | None  # MapModel.selected_route_label
+    route_path: tuple  # MapModel.selected_route_path, empty if there is none
+    layer: MinimapLayer
+
+    @property
+    def view(self) -> tuple:
+        """(zoom level, column start, row start): the cells the frame shows, and with them the player position."""
+        return self.zoom_level, self.column_start, self.row_start
+
+
+# -----------------------
+# Minimap Renderer
+# -----------------------
+
+class MinimapRenderer:
+    """
+    Draws minimap frames for a MapModel.
+
+    A frame is the cached static layer from MinimapAtlas with the overlays that follow the player on
+    top: lines to the nearest tavern, bank and transit, and the selected compass route. snapshot()
+    reads the model on the GUI thread; render_image() draws a snapshot into a QImage on any thread,
+    one thread at a time. The renderer needs no widgets and runs under Qt's offscreen platform.
+    """
+
+    def __init__(self, model, minimap_size: int = MINIMAP_SIZE) -> None:
+        """
+        Args:
+            model (MapModel): Map data, view state and queries; RBCCommunityMap in the app.
+            minimap_size (int): Edge length of the minimap in pixels.
+        """
+        self.model = model
+        self.minimap_size = minimap_size
+        self.atlas = MinimapAtlas(minimap_size)
+
+    def snapshot(self) -> MinimapState:
+        """Capture the view, the overlays and the map data of the next frame from the model."""
+        model = self.model
+        current_x, current_y = model.current_position()
+        nearest = (
+            ('orange', model.find_nearest_tavern(current_x, current_y)),
+            ('blue', model.find_nearest_bank(current_x, current_y)),
+            ('red', model.find_nearest_transit(current_x, current_y)),
+        )
+        return MinimapState(
+            zoom_level=model.zoom_level,
+            column_start=model.column_start,
+            row_start=model.row_start,
+            position=(current_x, current_y),
+            nearest=tuple((color, found[1]) for color, found in nearest if found),
+            destination=model.destination,
+            route_label=model.selected_route_label,
+            route_path=tuple(model.selected_route_path or ()),
+            layer=MinimapLayer.from_model(model),
+        )
+
+    def render(self) -> PySide6.QtGui.QPixmap:
+        """Draw a frame of the model's current state on the calling thread, which must be the GUI thread."""
+        return PySide6.QtGui.QPixmap.fromImage(self.render_image(self.snapshot()))
+
+    def render_image(self, state: MinimapState,
+                     cancelled: Callable[[], bool] | None = None) -> PySide6.QtGui.QImage | None:
+        """
+        Draw one frame by blitting the cached static city layer (grid, streets, labels and special
+        locations) and painting the dynamic overlays, such as lines to nearest locations, on top.
+
+        Args:
+            state (MinimapState): Snapshot to draw.
+            cancelled (Callable | None): Checked while drawing; returning True abandons the frame.
+
+        Returns:
+            QImage | None: The frame, or None if it was cancelled.
+        """
+        image = PySide6.QtGui.QImage(self.minimap_size, self.minimap_size,
+                                     PySide6.QtGui.QImage.Format.Format_ARGB32_Premultiplied)
+        painter = PySide6.QtGui.QPainter(image)
+        painter.fillRect(0, 0, self.minimap_size, self.minimap_size, PySide6.QtGui.QColor('lightgrey'))
+
+        block_size = self.minimap_size // state.zoom_level
+
+        logging.debug(
+            f"Drawing minimap with column_start={state.column_start}, row_start={state.row_start}, "f"zoom_level={state.zoom_level}, block_size={block_size}")
+
+        # Static layer: grid, street colours, intersection labels and special locations
+        completed = self.atlas.render(painter, state.layer, state.zoom_level, state.column_start, state.row_start,
+                                      cancelled)
+
+        # Dynamic layer: nearest location lines and the selected compass route, drawn once per frame
+        if completed:
+            self._draw_overlays(painter, state, block_size)
+
+        painter.end()
+        return image if completed else None
+
+    def _draw_overlays(self, painter: PySide6.QtGui.QPainter, state: MinimapState, block_size: int) -> None:
+        """
+        Render stage for everything on the minimap that depends on the player position: lines to the
+        nearest tavern, bank and transit, and the selected compass route.
+
+        Args:
+            painter (QPainter): Painter targeting the minimap image, with the static layer already drawn.
+            state (MinimapState): Snapshot being drawn.
+            block_size (int): Size of a single cell in pixels.
+        """
+        column_start, row_start = state.column_start, state.row_start
+        current_x, current_y = state.position
+
+        # Draw lines to the nearest tavern (orange), bank (blue) and transit (red)
+        for color, (nearest_x, nearest_y) in state.nearest:
+            painter.setPen(PySide6.QtGui.QPen(PySide6.QtGui.QColor(color), 3))
+            painter.drawLine(
+                (current_x - column_start) * block_size + block_size // 2,
+                (current_y - row_start) * block_size + block_size // 2,
+                (nearest_x - column_start) * block_size + block_size // 2,
+                (nearest_y - row_start) * block_size + block_size // 2
+            )
+
+        # Draw selected compass route (green for direct)
+        if (
+                state.destination is not None and
+                state.route_label == "Direct Route" and
+                len(state.route_path) >= 2
+        ):
+            logging.debug(f"Drawing direct route from {state.route_path[0]} to {state.route_path[-1]}")
+            painter.setPen(PySide6.QtGui.QPen(PySide6.QtGui.QColor("green"), 3))
+            painter.drawLine(
+                (current_x - column_start) * block_size + block_size // 2,
+                (current_y - row_start) * block_size + block_size // 2,
+                (state.destination[0] - column_start) * block_size + block_size // 2,
+                (state.destination[1] - row_start) * block_size + block_size // 2
+            )
+
+        # Draw selected compass route (purple for transit)
+        if (
+                state.destination is not None and
+                (state.route_label or "").startswith("Transit Route") and
+                len(state.route_path) >= 2
+        ):
+            logging.debug(f"Transit route path: {state.route_path}")
+            painter.setPen(PySide6.QtGui.QPen(PySide6.QtGui.QColor(170, 0, 170), 3))
+
+            # Start the first walk from the player's current position in case they moved since the route was planned
+            path = [(current_x, current_y)] + list(state.route_path[1:])
+
+            for index in range(len(path) - 1):
+                if index % 2:
+                    continue  # Odd legs are transit rides, which are not drawn
+
+                (x1, y1), (x2, y2) = path[index], path[index + 1]
+                px1 = (x1 - column_start) * block_size + block_size // 2
+                py1 = (y1 - row_start) * block_size + block_size // 2
+                px2 = (x2 - column_start) * block_size + block_size // 2
+                py2 = (y2 - row_start) * block_size + block_size // 2
+                logging.debug(f"Walk leg {index // 2 + 1} coords: ({px1}, {py1}) to ({px2}, {py2})")
+                if not (px1 < 0 and px2 < 0) and not (px1 > self.minimap_size and px2 > self.minimap_size) and \
+                        not (py1 < 0 and py2 < 0) and not (py1 > self.minimap_size and py2 > self.minimap_size):
+                    painter.drawLine(px1, py1, px2, py2)
+                else:
+                    logging.debug(f"Walk leg {index // 2 + 1} skipped: both endpoints off-screen")
@@ -0,0 +1,186 @@
+from core_imports import *
+from constants import *
+
+# -----------------------
+# Nearest Facility Lookup Grid
+# -----------------------
+
+class NearestFacilityGrid:
+    """
+    Precomputed nearest-facility table for banks, taverns and transits.
+
+    For every cell of the 202x202 city grid the table stores which facility of each kind is closest
+    and its Chebyshev AP cost, so answering "where is the nearest bank?" is a single array lookup
+    instead of measuring and sorting every location on each redraw.
+
+    Ties are broken by the smallest (x, y) coordinate, which is what sorting the distance list used
+    to do. Cells outside the grid fall back to a direct scan with the same rules.
+
+    The tables are written to NEAREST_GRID_CACHE_PATH together with a hash of the facility
+    coordinates, and are only rebuilt when that hash no longer matches.
+    """
+
+    GRID_SIZE = 202  # Coordinates 0..201, city limits included
+    CACHE_VERSION = 1
+    KINDS = ("bank", "tavern", "transit")
+
+    def __init__(self, facilities: dict, cache_path: str = NEAREST_GRID_CACHE_PATH) -> None:
+        """
+        Args:
+            facilities (dict): Kind -> list of (name, (x, y)) for each facility of that kind.
+            cache_path (str): File used to persist the computed tables.
+        """
+        self.cache_path = cache_path
+        self._facilities = {kind: self._dedupe(facilities.get(kind, ())) for kind in self.KINDS}
+        self._signature = self._build_signature()
+        self._indices = {}
+        self._costs = {}
+
+        if not self._load_cache():
+            for kind in self.KINDS:
+                self._indices[kind], self._costs[kind] = self._compute(self._facilities[kind])
+            self._save_cache()
+
+    @classmethod
+    def from_map_data(cls, columns: dict, rows: dict, banks_coordinates: dict, taverns_coordinates: dict,
+                      transits_coordinates: dict, cache_path: str = NEAREST_GRID_CACHE_PATH) -> "NearestFacilityGrid":
+        """
+        Build the grid from the dictionaries returned by load_data().
+
+        Banks are stored by street names and sit one cell south-east of their intersection.
+        """
+        banks = []
+        for bank_key in banks_coordinates.keys():
+            if " & " not in bank_key:
+                continue
+            col_name, row_name = bank_key.split(" & ")
+            col = columns.get(col_name, 0)
+            row = rows.get(row_name, 0)
+            if col and row:
+                banks.append((bank_key, (col + 1, row + 1)))
+
+        return cls({
+            "bank": banks,
+            "tavern": list(taverns_coordinates.items()),
+            "transit": list(transits_coordinates.items()),
+        }, cache_path)
+
+    def nearest(self, kind: str, x: int, y: int) -> tuple[str, tuple[int, int], int] | None:
+        """
+        Find the nearest facility of a kind.
+
+        Args:
+            kind (str): One of "bank", "tavern" or "transit".
+            x (int): X coordinate.
+            y (int): Y coordinate.
+
+        Returns:
+            tuple | None: (name, (x, y), ap_cost) of the nearest facility, or None if there are none.
+        """
+        facilities = self._facilities[kind]
+        if not facilities:
+            return None
+
+        if 0 <= x < self.GRID_SIZE and 0 <= y < self.GRID_SIZE:
+            cell = x * self.GRID_SIZE + y
+            name, coords = facilities[self._indices[kind][cell]]
+            return name, coords, self._costs[kind][cell]
+
+        cost, index = min((max(abs(fx - x), abs(fy - y)), index)
+                          for index, (_, (fx, fy)) in enumerate(facilities))
+        name, coords = facilities[index]
+        return name, coords, cost
+
+    # -----------------------
+    # Table Construction
+    # -----------------------
+
+    @staticmethod
+    def _dedupe(entries) -> list:
+        """Sort facilities by coordinate and keep the first name listed for each coordinate."""
+        by_coords = {}
+        for name, coords in entries:
+            if coords is None or None in coords:
+                continue
+            by_coords.setdefault(tuple(coords), name)
+        return [(name, coords) for coords, name in sorted(by_coords.items())]
+
+    def _compute(self, facilities: list) -> tuple[array.array, array.array]:
+        """
+        Compute the nearest facility index and AP cost for every cell.
+
+        For each column the facilities are ordered by horizontal distance, so the scan for a cell can
+        stop as soon as the horizontal distance alone exceeds the best cost found so far.
+        """
+        size = self.GRID_SIZE
+        indices = array.array('h', [0]) * (size * size)
+        costs = array.array('h', [0]) * (size * size)
+        if not facilities:
+            return indices, costs
+
+        for x in range(size):
+            by_dx = sorted((abs(fx - x), index, fy) for index, (_, (fx, fy)) in enumerate(facilities))
+            base = x * size
+            for y in range(size):
+                best_cost, best_index = None, None
+                for dx, index, fy in by_dx:
+                    if best_cost is not None and dx > best_cost:
+                        break
+                    cost = max(dx, abs(fy - y))
+                    if best_cost is None or cost < best_cost or (cost == best_cost and index < best_index):
+                        best_cost, best_index = cost, index
+                indices[base + y] = best_index
+                costs[base + y] = best_cost
+
+        return indices, costs
+
+    # -----------------------
+    # Disk Cache
+    # -----------------------
+
+    def _build_signature(self) -> str:
+        """Hash everything the tables depend on."""
+        payload = json.dumps({
+            "version": self.CACHE_VERSION,
+            "size": self.GRID_SIZE,
+            "facilities": {kind: [[x, y] for _, (x, y) in entries] for kind, entries in self._facilities.items()},
+        }, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _load_cache(self) -> bool:
+        """Load the tables from disk if the cached signature matches. Returns True on success."""
+        try:
+            with open(self.cache_path, "rb") as cache_file:
+                header = json.loads(cache_file.readline().decode("utf-8"))
+                if header.get("signature") != self._signature:
+                    logging.debug("Nearest facility cache is stale; rebuilding")
+                    return False
+
+                cells = self.GRID_SIZE * self.GRID_SIZE
+                for kind in self.KINDS:
+                    indices, costs = array.array('h'), array.array('h')
+                    indices.fromfile(cache_file, cells)
+                    costs.fromfile(cache_file, cells)
+                    self._indices[kind], self._costs[kind] = indices, costs
+        except FileNotFoundError:
+            return False
+        except (OSError, EOFError, ValueError) as e:
+            logging.warning(f"Failed to read nearest facility cache {self.cache_path}: {e}")
+            self._indices.clear()
+            self._costs.clear()
+            return False
+
+        logging.debug(f"Loaded nearest facility grid from {self.cache_path}")
+        return True
+
+    def _save_cache(self) -> None:
+        """Write the tables and their signature to disk."""
+        try:
+            with open(self.cache_path, "wb") as cache_file:
+                cache_file.write(json.dumps({"signature": self._signature}).encode("utf-8") + b"\n")
+                for kind in self.KINDS:
+                    self._indices[kind].tofile(cache_file)
+                    self._costs[kind].tofile(cache_file)
+            logging.debug(f"Saved nearest facility grid to {self.cache_path}")
+        except OSError as e:
+            logging.warning(f"Failed to write nearest facility cache {self.cache_path}: {e}")
@@ -0,0 +1,297 @@
+from core_imports import *
+
+# -----------------------
+# In-Page Extractor
+# -----------------------
+
+# Runs inside the game page and returns everything the map needs as one JSON string, so a page
+# load no longer copies the whole DOM to Python for BeautifulSoup to parse.
+#
+#   intersect   Text of <span class="intersect">, trimmed ("" if missing)
+#   cityblocks  Number of <td class="cityblock"> city limit cells
+#   first_x/y   Value of the first x/y input (null if missing or not a number)
+#   last_x/y    Largest numeric x/y input value (null if there are none)
+#   coin_text   Lines of the page text that mention coins, in page order. Every coin message the
+#               map tracks fits on one line and contains the word "coins". textContent leaves the
+#               markup out without serialising the page, and unlike innerText it adds no line breaks
+#               for <br> or block boundaries, so messages such as "You drink the hunter's
+#               blood.<br>You also found 42 coins" stay on one line as they do in the markup.
+PAGE_EXTRACTOR_JS = """
+(function () {
+    function firstValue(name) {
+        var input = document.querySelector('input[name="' + name + '"]');
+        return input && /^\\d+$/.test(input.value) ? parseInt(input.value, 10) : null;
+    }
+
+    function maxValue(name) {
+        var best = null;
+        document.querySelectorAll('input[name="' + name + '"]').forEach(function (input) {
+            if (/^\\d+$/.test(input.value)) {
+                var value = parseInt(input.value, 10);
+                if (best === null || value > best) {
+                    best = value;
+                }
+            }
+        });
+        return best;
+    }
+
+    var intersect = document.querySelector('span.intersect');
+    var text = document.body ? document.body.textContent : '';
+
+    return JSON.stringify({
+        intersect: intersect ? intersect.textContent.trim() : '',
+        cityblocks: document.querySelectorAll('td.cityblock').length,
+        first_x: firstValue('x'),
+        first_y: firstValue('y'),
+        last_x: maxValue('x'),
+        last_y: maxValue('y'),
+        coin_text: text.split('\\n').filter(function (line) {
+            return line.indexOf('coins') !== -1;
+        }).join('\\n')
+    });
+})();
+"""
+
+
+def parse_page_extract(result) -> dict | None:
+    """
+    Decode the JSON string returned by PAGE_EXTRACTOR_JS.
+
+    Args:
+        result: Value handed to the runJavaScript callback.
+
+    Returns:
+        dict | None: Extracted page data, or None if the script produced nothing usable.
+    """
+    if not isinstance(result, str) or not result:
+        logging.warning(f"Page extractor returned no data: {result!r}")
+        return None
+
+    try:
+        page = json.loads(result)
+    except ValueError as e:
+        logging.error(f"Failed to decode page extractor result: {e}")
+        return None
+
+    return page if isinstance(page, dict) else None
+
+
+# -----------------------
+# Page Snapshot
+# -----------------------
+
+# Coin messages tracked on the game page, in the order extract_coins applies them. The first group
+# of each pattern is the coin amount unless COIN_AMOUNT_GROUPS says otherwise. The leading \b on
+# the name patterns does not change their first match (which always starts at a word boundary)
+# but saves retrying them from inside every word.
+COIN_PATTERNS = {
+    'bank': r"Welcome to Omnibank. Your account has (\d+) coins in it.",
+    'pocket': r"You have (\d+) coins",
+    'money': r"Money: (\d+) coins",
+    'deposit': r"You deposit (\d+) coins.",
+    'withdraw': r"You withdraw (\d+) coins.",
+    'transit': r"It costs 5 coins to ride. You have (\d+).",
+    'hunter': r'You drink the hunter\'s blood.*You also found (\d+) coins',
+    'paladin': r'You drink the paladin\'s blood.*You also found (\d+) coins',
+    'human': r'You drink the human\'s blood.*You also found (\d+) coins',
+    'bag_of_coins': r'The bag contained (\d+) coins',
+    'robbing': r'You stole (\d+) coins from (\w+)',
+    'silver_suitcase': r'The suitcase contained (\d+) coins',
+    'given_coins': r'\b(\w+) gave you (\d+) coins',
+    'getting_robbed': r'\b(\w+) stole (\d+) coins from you',
+}
+COIN_AMOUNT_GROUPS = {'given_coins': 2, 'getting_robbed': 2}
+
+_COIN_REGEXES = {name: re.compile(pattern) for name, pattern in COIN_PATTERNS.items()}
+
+# One scan finds where any coin pattern starts: every alternative is a zero-width lookahead, so a
+# match never consumes text another pattern might need.
+_COIN_SCANNER = re.compile("|".join(f"(?={pattern})" for pattern in COIN_PATTERNS.values()))
+
+
+@dataclass(frozen=True)
+class PageSnapshot:
+    """
+    Everything the map reads from one game page, analysed in a single pass.
+
+    Coordinate and coin handling both read from the snapshot instead of parsing the page again.
+    """
+
+    intersect: str = ""  # Intersection label, e.g. "Aardvark and 1st"
+    cityblocks: int = 0  # Number of city limit cells on the page
+    first_x: int | None = None  # First x input (centre of the game grid)
+    first_y: int | None = None
+    last_x: int | None = None  # Largest x input
+    last_y: int | None = None
+    coin_matches: dict = field(default_factory=dict)  # COIN_PATTERNS name -> groups of its first match
+
+    @classmethod
+    def from_extract(cls, page: dict) -> "PageSnapshot":
+        """Build a snapshot from the data returned by PAGE_EXTRACTOR_JS."""
+        return cls(
+            intersect=page.get("intersect") or "",
+            cityblocks=int(page.get("cityblocks") or 0),
+            first_x=page.get("first_x"),
+            first_y=page.get("first_y"),
+            last_x=page.get("last_x"),
+            last_y=page.get("last_y"),
+            coin_matches=scan_coin_messages(page.get("coin_text") or ""),
+        )
+
+    @classmethod
+    def from_html(cls, html: str) -> "PageSnapshot":
+        """
+        Build a snapshot from a full page of HTML, with one parse and one walk over the relevant tags.
+        Used when the page is only available as markup, e.g. for saved pages.
+        """
+        soup = BeautifulSoup(html, 'html.parser')
+        intersect = None
+        cityblocks = 0
+        first = {'x': None, 'y': None}
+        seen = {'x': False, 'y': False}
+        largest = {'x': None, 'y': None}
+
+        for tag in soup.find_all(['span', 'td', 'input']):
+            if tag.name == 'span':
+                if intersect is None and 'intersect' in (tag.get('class') or ()):
+                    intersect = tag.text.strip()
+            elif tag.name == 'td':
+                if 'cityblock' in (tag.get('class') or ()):
+                    cityblocks += 1
+            else:
+                name = tag.get('name')
+                if name not in first:
+                    continue
+                value = tag.get('value') or ''
+                number = int(value) if value.isdigit() else None
+                if not seen[name]:
+                    seen[name] = True
+                    first[name] = number
+                if number is not None and (largest[name] is None or number > largest[name]):
+                    largest[name] = number
+
+        return cls(
+            intersect=intersect or "",
+            cityblocks=cityblocks,
+            first_x=first['x'],
+            first_y=first['y'],
+            last_x=largest['x'],
+            last_y=largest['y'],
+            coin_matches=scan_coin_messages(html),
+        )
+
+    def coin_amount(self, name: str) -> int | None:
+        """Coin amount from the first match of a COIN_PATTERNS entry, or None if it did not match."""
+        groups = self.coin_matches.get(name)
+        if groups is None:
+            return None
+        return int(groups[COIN_AMOUNT_GROUPS.get(name, 1) - 1])
+
+
+# Coin messages that change the pocket by their amount, in the order extract_coins checks them.
+# Only the first one on a page is applied. getting_robbed takes coins away, the rest add them.
+COIN_ACTIONS = ['hunter', 'paladin', 'human', 'bag_of_coins', 'robbing', 'silver_suitcase', 'given_coins',
+                'getting_robbed']
+
+
+@dataclass(frozen=True)
+class CoinUpdate:
+    """One change to a character's coins, as read from a game page."""
+
+    column: str  # Column of the coins table: "bank" or "pocket"
+    amount: int  # New balance, or the change when relative (negative for coins lost)
+    relative: bool  # True if amount is added to the balance, False if it replaces it
+    source: str  # COIN_PATTERNS name of the message
+
+
+def coin_updates(snapshot: PageSnapshot) -> list[CoinUpdate]:
+    """
+    Work out the coin changes a page reports: bank balance, pocket balance, deposits, withdrawals,
+    transit fares and the first of the COIN_ACTIONS found.
+
+    Args:
+        snapshot (PageSnapshot): Analysed game page with its coin message matches.
+
+    Returns:
+        list[CoinUpdate]: Updates in the order they have to be applied.
+    """
+    updates = []
+
+    bank_coins = snapshot.coin_amount('bank')
+    if bank_coins is not None:
+        logging.info(f"Bank coins found: {bank_coins}")
+        updates.append(CoinUpdate('bank', bank_coins, False, 'bank'))
+
+    pocket_source = 'pocket' if snapshot.coin_amount('pocket') is not None else 'money'
+    pocket_coins = snapshot.coin_amount(pocket_source)
+    if pocket_coins is not None:
+        logging.info(f"Pocket coins found: {pocket_coins}")
+        updates.append(CoinUpdate('pocket', pocket_coins, False, pocket_source))
+
+    deposit_coins = snapshot.coin_amount('deposit')
+    if deposit_coins is not None:
+        logging.info(f"Deposit found: {deposit_coins} coins")
+        updates.append(CoinUpdate('pocket', -deposit_coins, True, 'deposit'))
+
+    withdraw_coins = snapshot.coin_amount('withdraw')
+    if withdraw_coins is not None:
+        logging.info(f"Withdrawal found: {withdraw_coins} coins")
+        updates.append(CoinUpdate('pocket', withdraw_coins, True, 'withdraw'))
+
+    coins_in_pocket = snapshot.coin_amount('transit')
+    if coins_in_pocket is not None:
+        logging.info(f"Transit found: Pocket coins updated to {coins_in_pocket}")
+        updates.append(CoinUpdate('pocket', coins_in_pocket, False, 'transit'))
+
+    for action in COIN_ACTIONS:
+        coin_count = snapshot.coin_amount(action)
+        if coin_count is not None:
+            if action == 'getting_robbed':
+                vamp_name = snapshot.coin_matches[action][0]
+                updates.append(CoinUpdate('pocket', -coin_count, True, action))
+                logging.info(f"Lost {coin_count} coins to {vamp_name}.")
+            else:
+                updates.append(CoinUpdate('pocket', coin_count, True, action))
+                logging.info(f"Gained {coin_count} coins from {action}.")
+            break
+
+    return updates
+
+
+def _coin_lines(text: str) -> str:
+    """
+    Keep only the lines that mention coins. Every coin pattern contains the word and none spans a
+    line, so the first match of each pattern is unchanged, but the regex scan has far less to read.
+    """
+    lines = []
+    position = text.find("coins")
+    while position != -1:
+        start = text.rfind("\n", 0, position) + 1
+        end = text.find("\n", position)
+        if end == -1:
+            end = len(text)
+        lines.append(text[start:end])
+        position = text.find("coins", end)
+    return "\n".join(lines)
+
+
+def scan_coin_messages(text: str) -> dict:
+    """
+    Find the first match of every coin pattern with one scan of the lines that mention coins.
+
+    Returns:
+        dict: COIN_PATTERNS name -> tuple of groups, for the patterns that matched.
+    """
+    text = _coin_lines(text)
+    matches = {}
+    for hit in _COIN_SCANNER.finditer(text):
+        # Several patterns can start at the same position, so check every pattern still missing
+        for name, regex in _COIN_REGEXES.items():
+            if name not in matches:
+                match = regex.match(text, hit.start())
+                if match:
+                    matches[name] = match.groups()
+        if len(matches) == len(_COIN_REGEXES):
+            break
+    return matches
@@ -1,5 +1,7 @@
 from imports import *
 from constants import *
+from db_connection import *
+from splash import *
 
 class PowersDialog(QDialog):
     """Dialog displaying power information with destination-setting functionality."""
@@ -16,7 +18,7 @@ class PowersDialog(QDialog):
         self.color_mappings = color_mappings or {}
 
         try:
-            self.db_connection = sqlite3.connect(db_path)
+            self.db_connection = connection_manager(db_path).reader()
         except sqlite3.Error as e:
             logging.error(f"Failed to connect to database: {e}")
             self.db_connection = None
@@ -191,16 +193,15 @@ class PowersDialog(QDialog):
 
         character_id = parent.selected_character['id']
         try:
-            with sqlite3.connect(self.DB_PATH) as conn:
+            with connection_manager(self.DB_PATH).writer() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     "INSERT OR REPLACE INTO destinations (character_id, col, row, timestamp) "
                     "VALUES (?, ?, ?, datetime('now'))",
                     (character_id, col, row)
                 )
-                conn.commit()
             parent.destination = (col, row)
-            parent.update_minimap()
+            parent.update_minimap("destination")
             logging.info(f"Destination set for {character_id} to {guild} at ({col}, {row})")
             # noinspection PyUnresolvedReferences
             QMessageBox.information(self, "Success", f"Destination set to {guild} at ({col}, {row})", QMessageBox.Ok)
@@ -208,19 +209,9 @@ class PowersDialog(QDialog):
             logging.error(f"Failed to set destination: {e}")
             QMessageBox.critical(self, "Database Error", "Failed to set destination")
 
-    def closeEvent(self, event) -> None:
-        """Close the database connection on dialog close."""
-        if self.db_connection:
-            try:
-                self.db_connection.close()
-                logging.debug("Database connection closed")
-            except sqlite3.Error as e:
-                logging.error(f"Failed to close database: {e}")
-        event.accept()
-
     def load_guild_move_time(self):
         try:
-            with sqlite3.connect(self.DB_PATH) as conn:
+            with connection_manager(self.DB_PATH).reader() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     "SELECT next_update FROM guilds WHERE next_update IS NOT NULL ORDER BY next_update ASC LIMIT 1"
@@ -4,40 +4,58 @@ from directories  import *
 from logging_setup import *
 from cookies import *
 from database import *
+from db_connection import *
+from write_behind import *
+from settings_store import *
 from scraper import *
+from scrape_worker import *
+from scrape_scheduler import *
 from character_dialog import *
 from compass_overlay import *
 from css_customization_dialog import *
 from damage_calculator import *
 from database_viewer import *
+from frame_scheduler import *
 from discord_server_dialog import *
 from log_viewer import *
+from map_model import *
+from minimap_renderer import *
+from minimap_render_worker import *
+from page_extractor import *
 from powers_dialog import *
 from set_destination_dialog import *
 from shopping_list_tool import *
 from splash import *
+from startup import *
 from theme_customization_dialog import *
 
 
-class RBCCommunityMap(QMainWindow):
+class RBCCommunityMap(QMainWindow, MapModel):
     """
     Main application class for the RBC Community Map.
+
+    The map data and the queries on it come from MapModel; minimap frames are drawn by a MinimapRenderer.
     """
 
-    def __init__(self):
+    def __init__(self, splash: SplashScreen | None = None):
         """
         Initialize the RBCCommunityMap and its components efficiently.
 
-        Sets up the main window, scraper, cookie handling, data loading, and UI components
-        with proper error handling and asynchronous initialization where possible.
+        Startup is split into stages run by a StartupPipeline: database, cookie and icon loading run
+        on worker threads while the window and web view are built, and work that is not visible in
+        the first frame runs after the window has been painted.
+
+        Args:
+            splash (SplashScreen | None): Splash screen showing startup progress.
         """
         super().__init__()
 
         # Core state flags
         self.is_updating_minimap = False
+        self.minimap_frames = FrameScheduler(self._draw_minimap_frame, parent=self)
         self.login_needed = True
         self.webview_loaded = False
-        self.splash = None
+        self.splash = splash
 
         # Compass route state
         self.selected_route_label = None  # "Direct Route" or "Transit Route"
@@ -50,30 +68,82 @@ class RBCCommunityMap(QMainWindow):
         self.selected_character = None
         self.destination = None
 
-        # Initialize essential components early
-        self._init_data()
-        self._init_scraper()
-        self._init_window_properties()
-        self._init_web_profile()
-
-        # UI and character setup
-        self._init_ui_state()
-        self._init_characters()
-        self._init_ui_components()
-
-        # Final setup steps
-        self._finalize_setup()
-
-    @splash_message(None)
-    def _init_scraper(self) -> None:
-        """Initialize the AVITD scraper and start scraping in a separate thread."""
-        self.scraper = Scraper()
-        # Use QThread for non-blocking scraping (assuming scraper supports it)
-        from PySide6.QtCore import QThreadPool
-        QThreadPool.globalInstance().start(lambda: self.scraper.scrape_guilds_and_shops())
-        logging.debug("Started scraper in background thread")
-
-    @splash_message(None)
+        self.scraper = Scraper(self)
+        self.scrape_worker = ScrapeWorker(self.scraper, self)
+        self.scrape_worker.finished.connect(self.refresh_shops_and_guilds)
+        self.scrape_scheduler = ScrapeScheduler(self.scrape_worker, self)
+
+        self.startup = StartupPipeline(self)
+        if splash is not None:
+            self.startup.stage_started.connect(splash.show_message)
+            self.startup.stage_finished.connect(splash.show_stage_timing)
+        self._add_startup_stages()
+        self.startup.run()
+
+        # Zero-delay timers fire once the event loop has shown and painted the window
+        QTimer.singleShot(0, self.startup.run_deferred)
+
+    def _add_startup_stages(self) -> None:
+        """Declare the startup stages and their dependencies."""
+        stages = self.startup
+
+        # Worker threads: nothing here may create or touch widgets
+        stages.add("data", self._init_data, background=True)
+        stages.add("saved_cookies", self._read_saved_cookies, background=True)
+        stages.add("icons", self._load_map_icon_images, background=True)
+
+        # GUI thread, before the window is shown
+        stages.add("web_profile", self._init_web_profile)
+        stages.add("cookies", self._init_cookies, depends_on=("web_profile", "saved_cookies"))
+        stages.add("window", self._init_window_properties, depends_on=("data",))
+        stages.add("ui_state", self._init_ui_state, depends_on=("data", "icons"))
+        stages.add("characters", self._init_characters, depends_on=("ui_state",))
+        stages.add("ui_components", self._init_ui_components, depends_on=("window", "cookies", "characters"))
+        stages.add("show", self._finalize_setup, depends_on=("ui_components",))
+
+        # GUI thread, after the first paint
+        stages.add("last_character", self.load_last_active_character, depends_on=("show",), deferred=True)
+        stages.add("keybindings", self.setup_keybindings, depends_on=("show",), deferred=True)
+        stages.add("custom_css", self._init_custom_css, depends_on=("show",), deferred=True)
+        stages.add("scraper", self.scrape_worker.refresh, depends_on=("show",), deferred=True)
+        stages.add("scrape_scheduler", self.scrape_scheduler.start, depends_on=("show",), deferred=True)
+
+    def closeEvent(self, event) -> None:
+        """Stop scraping and minimap drawing, commit queued database writes and close the shared connections on exit."""
+        self.scrape_scheduler.stop()
+        self.scrape_worker.cancel()
+        self.minimap_render_worker.stop()
+        self.scraper.close()
+        close_write_behind_queues()
+        close_db_connections()
+        super().closeEvent(event)
+
+    def refresh_shops_and_guilds(self, changes: dict | None = None) -> None:
+        """
+        Reload shop and guild locations after a scrape and redraw the minimap with them.
+
+        Args:
+            changes (dict | None): Result of Scraper.scrape(). Only the minimap tiles showing a change
+                are redrawn, and nothing is reloaded if it is empty. None reloads and redraws everything.
+        """
+        if changes is not None and not changes:
+            return
+        try:
+            self.shops_coordinates, self.guilds_coordinates = load_shops_and_guilds(self.columns, self.rows)
+        except sqlite3.Error as e:
+            logging.error(f"Failed to reload shops and guilds: {e}")
+            return
+
+        if changes is None:
+            self.minimap_renderer.atlas.invalidate()
+        else:
+            self.minimap_renderer.atlas.invalidate_cells({
+                resolve_coords(self.columns, self.rows, col, row)
+                for table_changes in changes.values() for col, row in table_changes.locations()
+            })
+        self.update_minimap("shops and guilds")
+        logging.info(f"Reloaded {len(self.shops_coordinates)} shops and {len(self.guilds_coordinates)} guilds.")
+
     def _init_window_properties(self) -> None:
         """Set up main window properties."""
         try:
@@ -87,9 +157,8 @@ class RBCCommunityMap(QMainWindow):
             # Fallback to default icon/title if needed
             self.setWindowTitle('RBC Community Map (Fallback)')
 
-    @splash_message(None)
     def _init_web_profile(self) -> None:
-        """Set up QWebEngineProfile for cookie handling."""
+        """Set up QWebEngineProfile for persistent cookie storage."""
         self.web_profile = QWebEngineProfile.defaultProfile()
         cookie_storage_path = os.path.join(os.getcwd(), 'sessions')
         try:
@@ -97,57 +166,48 @@ class RBCCommunityMap(QMainWindow):
             # noinspection PyUnresolvedReferences
             self.web_profile.setPersistentCookiesPolicy(QWebEngineProfile.ForcePersistentCookies)
             self.web_profile.setPersistentStoragePath(cookie_storage_path)
-            self.setup_cookie_handling()
         except OSError as e:
             logging.error(f"Failed to set up cookie storage at {cookie_storage_path}: {e}")
             # Continue with in-memory cookies if storage fails
 
-    @splash_message(None)
-    def _init_data(self) -> None:
-        """Load initial data from the database with fallback."""
-        try:
-            (
-                self.columns, self.rows, self.banks_coordinates, self.taverns_coordinates,
-                self.transits_coordinates, self.user_buildings_coordinates, self.color_mappings,
-                self.shops_coordinates, self.guilds_coordinates, self.places_of_interest_coordinates,
-                self.keybind_config, self.current_css_profile,
-                self.selected_character, self.destination  # <-- just store, don't update minimap yet
-            ) = load_data()
+    def _read_saved_cookies(self) -> None:
+        """Read the saved cookies from the database. Runs on a startup worker thread."""
+        self._saved_cookies = self.read_saved_cookies()
 
-        except sqlite3.Error as e:
-            logging.critical(f"Failed to load initial data: {e}")
-            # Use fallback data
-            self.columns = self.rows = self.banks_coordinates = self.taverns_coordinates = \
-                self.transits_coordinates = self.user_buildings_coordinates = \
-                self.shops_coordinates = self.guilds_coordinates = self.places_of_interest_coordinates = {}
-            self.color_mappings = {'default': PySide6.QtGui.QColor('#000000')}
-            self.keybind_config = 1
-            self.current_css_profile = "Default"
-            self.selected_character = None
-            self.destination = None
+    def _init_cookies(self) -> None:
+        """Connect the cookie store and inject the cookies read by _read_saved_cookies."""
+        self.setup_cookie_handling(self._saved_cookies)
+        del self._saved_cookies
+
+    def _init_data(self) -> None:
+        """Load initial data from the database with fallback. Runs on a startup worker thread."""
+        self.load_map_data()
 
-    @splash_message(None)
     def _init_ui_state(self) -> None:
         """Initialize UI-related state variables."""
         self.zoom_level = 3
         self.load_zoom_level_from_database()  # May override zoom_level
-        self.minimap_size = 280
+        self.minimap_size = MINIMAP_SIZE
+        self.minimap_renderer = MinimapRenderer(self, self.minimap_size)
+        self.minimap_render_worker = MinimapRenderWorker(self.minimap_renderer, self)
+        self.minimap_render_worker.frame_ready.connect(self._show_minimap_frame)
         self.column_start = 0
         self.row_start = 0
         self.destination = None
         self.map_icons = {
-            "bank": PySide6.QtGui.QPixmap("images/bank.png"),
-            "tavern": PySide6.QtGui.QPixmap("images/saloon.png"),
-            "transit": PySide6.QtGui.QPixmap("images/transit.png"),
-            "user_building": PySide6.QtGui.QPixmap("images/castle.png"),
-            "guild": PySide6.QtGui.QPixmap("images/guild.png"),
-            "shop": PySide6.QtGui.QPixmap("images/shop.png"),
-            "graveyard": PySide6.QtGui.QPixmap("images/graveyard.png"),
-            "hall_binding": PySide6.QtGui.QPixmap("images/binding.png"),
-            "hall_severance": PySide6.QtGui.QPixmap("images/severance.png"),
+            name: PySide6.QtGui.QPixmap.fromImage(image) for name, image in self._map_icon_images.items()
         }
+        del self._map_icon_images
+
+    def _load_map_icon_images(self) -> None:
+        """
+        Decode the minimap icons. Runs on a startup worker thread.
+
+        QPixmap may only be used on the GUI thread, so the icons are decoded into QImages here and
+        converted in _init_ui_state.
+        """
+        self._map_icon_images = {name: PySide6.QtGui.QImage(path) for name, path in MAP_ICON_PATHS.items()}
 
-    @splash_message(None)
     def _init_characters(self) -> None:
         """Initialize character-related data and widgets."""
         self.characters = []
@@ -157,22 +217,18 @@ class RBCCommunityMap(QMainWindow):
         if not self.characters:
             self.firstrun_character_creation()
 
-    @splash_message(None)
     def _init_ui_components(self) -> None:
         """Set up UI components and console logging."""
         self.setup_ui_components()
         self.setup_console_logging()
 
-    @splash_message(None)
     def _finalize_setup(self) -> None:
-        """Complete initialization with UI display and final configurations."""
+        """Show the window. Everything not needed for the first frame runs in the deferred stages."""
         self.show()
 
         if self.selected_character and self.destination:
-            self.update_minimap()
+            self.update_minimap("startup")
 
-        self.load_last_active_character()
-        self.setup_keybindings()
         # noinspection PyUnresolvedReferences
         self.setFocusPolicy(Qt.StrongFocus)
         if hasattr(self, 'website_frame'):
@@ -180,17 +236,18 @@ class RBCCommunityMap(QMainWindow):
             self.website_frame.setFocusPolicy(Qt.StrongFocus)
         else:
             logging.warning("website_frame not initialized before focus setup")
+
+    def _init_custom_css(self) -> None:
+        """Apply the custom CSS of the current profile to the web view."""
         css = self.load_current_css()
         self.apply_custom_css(css)
 
     def load_current_css(self) -> str:
         """Load CSS for the current profile from the database."""
         try:
-            with sqlite3.connect(DB_PATH) as conn:
+            with db_reader() as conn:
                 cursor = conn.cursor()
-                cursor.execute("SELECT setting_value FROM settings WHERE setting_name = 'css_profile'")
-                result = cursor.fetchone()
-                profile = result[0] if result else "Default"
+                profile = app_settings().css_profile
                 cursor.execute("SELECT element, value FROM custom_css WHERE profile_name = ?", (profile,))
                 return "\n".join(f"{elem} {{ {val} }}" for elem, val in cursor.fetchall())
         except sqlite3.Error as e:
@@ -203,20 +260,12 @@ class RBCCommunityMap(QMainWindow):
 
     def load_keybind_config(self) -> int:
         """
-        Load keybind configuration from the database.
+        Load keybind configuration from the settings store.
 
         Returns:
             int: Keybind mode (0=Off, 1=WASD, 2=Arrows), defaults to 1 (WASD) if not found.
         """
-        try:
-            with sqlite3.connect(DB_PATH) as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT setting_value FROM settings WHERE setting_name = 'keybind_config'")
-                result = cursor.fetchone()
-                return int(result[0]) if result else 1  # Default to WASD
-        except sqlite3.Error as e:
-            logging.error(f"Failed to load keybind config: {e}")
-            return 1  # Fallback to WASD on error
+        return app_settings().keybind_config
 
     def setup_keybindings(self) -> None:
         """Set up keybindings for character movement based on current config."""
@@ -303,27 +352,21 @@ class RBCCommunityMap(QMainWindow):
             logging.warning(f"Invalid keybind mode: {mode}; ignoring")
             return
 
-        self.keybind_config = mode
         mode_text = {0: "Off", 1: "WASD", 2: "Arrow Keys"}[mode]
         logging.info(f"Switching to keybind mode {mode} ({mode_text})")
 
-        try:
-            with sqlite3.connect(DB_PATH) as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    "INSERT OR REPLACE INTO settings (setting_name, setting_value) VALUES ('keybind_config', ?)",
-                    (mode,)
-                )
-                conn.commit()
-        except sqlite3.Error as e:
-            logging.error(f"Failed to save keybind config {mode}: {e}")
-            return  # Don’t proceed if database fails
-
-        self.setup_keybindings()
+        # Keybindings follow through on_keybind_config_changed; the menu is refreshed even if the mode is unchanged
+        app_settings().keybind_config = mode
         self.update_keybind_menu()
         # noinspection PyArgumentList
         QMessageBox.information(self, "Keybind Config", f"Switched to {mode_text}")
 
+    def on_keybind_config_changed(self, mode: int) -> None:
+        """Apply a new keybind mode from the settings store."""
+        self.keybind_config = mode
+        self.setup_keybindings()
+        self.update_keybind_menu()
+
     def update_keybind_menu(self) -> None:
         """Update keybinding menu checkmarks based on current config."""
         if not hasattr(self, 'keybind_wasd_action') or not hasattr(self, 'keybind_arrow_action') or \
@@ -358,7 +401,7 @@ class RBCCommunityMap(QMainWindow):
         Load theme colors from the color_mappings table into self.color_mappings.
         """
         try:
-            with sqlite3.connect(DB_PATH) as conn:
+            with db_reader() as conn:
                 cursor = conn.cursor()
                 cursor.execute("SELECT type, color FROM color_mappings")
                 rows = cursor.fetchall()
@@ -375,7 +418,7 @@ class RBCCommunityMap(QMainWindow):
             bool: True if saved successfully, False otherwise.
         """
         try:
-            with sqlite3.connect(DB_PATH) as conn:
+            with db_writer() as conn:
                 cursor = conn.cursor()
                 cursor.executemany(
                     '''
@@ -385,7 +428,6 @@ class RBCCommunityMap(QMainWindow):
                     ''',
                     [(key, color.name()) for key, color in self.color_mappings.items()]
                 )
-                conn.commit()
                 logging.debug("Theme settings saved to color_mappings table.")
                 return True
         except sqlite3.Error as e:
@@ -429,47 +471,66 @@ class RBCCommunityMap(QMainWindow):
     # Cookie Handling
     # -----------------------
 
-    def setup_cookie_handling(self) -> None:
+    def setup_cookie_handling(self, cookies: list | None = None) -> None:
         """
         Set up cookie handling by connecting the QWebEngineProfile's cookie store and loading saved cookies.
+
+        Args:
+            cookies (list | None): Cookies already read by read_saved_cookies(), or None to read them now.
         """
         self.cookie_store = self.web_profile.cookieStore()
         self.cookie_store.cookieAdded.connect(self.on_cookie_added)
-        self.load_cookies()
+        self.load_cookies(cookies)
         logging.debug("Cookie handling initialized")
 
-    def load_cookies(self) -> None:
+    def read_saved_cookies(self) -> list:
         """
-        Load cookies from the 'cookies' table and inject them into the QWebEngineProfile.
+        Read the cookies saved in the 'cookies' table.
+
+        Only builds QNetworkCookie values, so it is safe to call off the GUI thread.
+
+        Returns:
+            list[QNetworkCookie]: The saved cookies, empty if they could not be read.
         """
+        cookies = []
         try:
-            with sqlite3.connect(DB_PATH) as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT name, domain, path, value, expiration, secure, httponly FROM cookies")
-                cookies = cursor.fetchall()
-
-                for name, domain, path, value, expiration, secure, httponly in cookies:
-                    cookie = QNetworkCookie(name.encode('utf-8'), value.encode('utf-8'))
-                    cookie.setDomain(domain)
-                    cookie.setPath(path)
-                    cookie.setSecure(bool(secure))
-                    cookie.setHttpOnly(bool(httponly))
-                    if expiration:
-                        try:
-                            # Handle both string (ISO) and int (epoch) expiration formats
-                            if isinstance(expiration, str):
-                                # noinspection PyUnresolvedReferences
-                                cookie.setExpirationDate(QDateTime.fromString(expiration, Qt.ISODate))
-                            elif isinstance(expiration, int):
-                                cookie.setExpirationDate(QDateTime.fromSecsSinceEpoch(expiration))
-                            else:
-                                logging.warning(f"Invalid expiration type for cookie '{name}': {type(expiration)}")
-                        except ValueError as e:
-                            logging.warning(f"Failed to parse expiration '{expiration}' for cookie '{name}': {e}")
-                    self.cookie_store.setCookie(cookie, QUrl(f"https://{domain}"))
-                logging.debug(f"Loaded {len(cookies)} cookies from database")
+            cursor = db_reader().cursor()
+            cursor.execute("SELECT name, domain, path, value, expiration, secure, httponly FROM cookies")
+            for name, domain, path, value, expiration, secure, httponly in cursor.fetchall():
+                cookie = QNetworkCookie(name.encode('utf-8'), value.encode('utf-8'))
+                cookie.setDomain(domain)
+                cookie.setPath(path)
+                cookie.setSecure(bool(secure))
+                cookie.setHttpOnly(bool(httponly))
+                if expiration:
+                    try:
+                        # Handle both string (ISO) and int (epoch) expiration formats
+                        if isinstance(expiration, str):
+                            # noinspection PyUnresolvedReferences
+                            cookie.setExpirationDate(QDateTime.fromString(expiration, Qt.ISODate))
+                        elif isinstance(expiration, int):
+                            cookie.setExpirationDate(QDateTime.fromSecsSinceEpoch(expiration))
+                        else:
+                            logging.warning(f"Invalid expiration type for cookie '{name}': {type(expiration)}")
+                    except ValueError as e:
+                        logging.warning(f"Failed to parse expiration '{expiration}' for cookie '{name}': {e}")
+                cookies.append(cookie)
         except sqlite3.Error as e:
             logging.error(f"Failed to load cookies: {e}")
+        return cookies
+
+    def load_cookies(self, cookies: list | None = None) -> None:
+        """
+        Inject saved cookies into the QWebEngineProfile.
+
+        Args:
+            cookies (list | None): Cookies already read by read_saved_cookies(), or None to read them now.
+        """
+        if cookies is None:
+            cookies = self.read_saved_cookies()
+        for cookie in cookies:
+            self.cookie_store.setCookie(cookie, QUrl(f"https://{cookie.domain()}"))
+        logging.debug(f"Loaded {len(cookies)} cookies from database")
 
     def on_cookie_added(self, cookie: QNetworkCookie) -> None:
         name = cookie.name().data().decode()
@@ -483,58 +544,54 @@ class RBCCommunityMap(QMainWindow):
         if name == 'stamp':
             return  # skip churn cookie
 
-        try:
-            with sqlite3.connect(DB_PATH) as conn:
-                cursor = conn.cursor()
+        # Read everything from the cookie here; the write runs later on the write-behind thread
+        expiration = cookie.expirationDate().toString(Qt.ISODate) if not cookie.isSessionCookie() else None
+        secure, httponly = int(cookie.isSecure()), int(cookie.isHttpOnly())
 
-                # Check if this exact cookie already exists
-                cursor.execute("""
-                    SELECT id FROM cookies 
-                    WHERE name = ? AND value = ? AND domain = ? AND path = ?
-                """, (name, value, domain, path))
-                existing = cursor.fetchone()
+        def save_cookie(conn: sqlite3.Connection) -> None:
+            cursor = conn.cursor()
 
-                if existing:
-                    logging.debug(f"Duplicate cookie '{name}' for value '{value}' not saved.")
-                    return
+            # Check if this exact cookie already exists
+            cursor.execute("""
+                SELECT id FROM cookies 
+                WHERE name = ? AND value = ? AND domain = ? AND path = ?
+            """, (name, value, domain, path))
+            existing = cursor.fetchone()
 
-                # Insert new cookie
-                cursor.execute("""
-                    INSERT INTO cookies (name, value, domain, path, expiration, secure, httponly)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    name, value, domain, path,
-                    cookie.expirationDate().toString(Qt.ISODate) if not cookie.isSessionCookie() else None,
-                    int(cookie.isSecure()), int(cookie.isHttpOnly())
-                ))
-
-                new_cookie_id = cursor.lastrowid
-                conn.commit()
-                logging.debug(f"Saved new cookie '{name}' (ID {new_cookie_id}) for domain '{domain}'")
-
-                # If it's an ip cookie, consider linking to character
-                if name == 'ip' and '#' in value:
-                    username, password = value.split('#', 1)
-                    is_login = bool(password.strip())
-
-                    logging.debug(
-                        f"Captured IP cookie for user '{username}' — {'login' if is_login else 'logout'} state."
-                    )
-
-                    # Update character only if this is a login cookie
-                    if is_login:
-                        cursor.execute("""
-                            UPDATE characters SET active_cookie = ? WHERE name = ?
-                        """, (new_cookie_id, username))
-                        conn.commit()
-                        logging.debug(f"Set active_cookie for character '{username}' to cookie ID {new_cookie_id}")
+            if existing:
+                logging.debug(f"Duplicate cookie '{name}' for value '{value}' not saved.")
+                return
 
-        except Exception as e:
-            logging.error(f"Error saving cookie '{name}': {e}")
+            # Insert new cookie
+            cursor.execute("""
+                INSERT INTO cookies (name, value, domain, path, expiration, secure, httponly)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, (name, value, domain, path, expiration, secure, httponly))
+
+            new_cookie_id = cursor.lastrowid
+            logging.debug(f"Saved new cookie '{name}' (ID {new_cookie_id}) for domain '{domain}'")
+
+            # If it's an ip cookie, consider linking to character
+            if name == 'ip' and '#' in value:
+                username, password = value.split('#', 1)
+                is_login = bool(password.strip())
+
+                logging.debug(
+                    f"Captured IP cookie for user '{username}' — {'login' if is_login else 'logout'} state."
+                )
+
+                # Update character only if this is a login cookie
+                if is_login:
+                    cursor.execute("""
+                        UPDATE characters SET active_cookie = ? WHERE name = ?
+                    """, (new_cookie_id, username))
+                    logging.debug(f"Set active_cookie for character '{username}' to cookie ID {new_cookie_id}")
+
+        write_behind_queue().submit(save_cookie)
 
     def set_ip_cookie(self, name: str, password: str):
         try:
-            with sqlite3.connect(DB_PATH) as conn:
+            with db_writer() as conn:
                 cursor = conn.cursor()
 
                 value = f"{name}#{password}"
@@ -563,7 +620,6 @@ class RBCCommunityMap(QMainWindow):
                 # Set this cookie as active, clear others
                 cursor.execute("UPDATE characters SET active_cookie = NULL")
                 cursor.execute("UPDATE characters SET active_cookie = ? WHERE name = ?", (cookie_id, name))
-                conn.commit()
                 logging.debug(f"Set active_cookie ID {cookie_id} for {name}")
 
         except sqlite3.Error as e:
@@ -788,11 +844,11 @@ class RBCCommunityMap(QMainWindow):
         self.combo_columns.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
         self.combo_columns.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
         self.combo_columns.addItem("Select Column")  # Placeholder
-        self.combo_columns.addItems(list(columns.keys()))
+        self.combo_columns.addItems(list(self.columns.keys()))
         self.combo_columns.setCurrentIndex(0)
         self.combo_columns.model().item(0).setEnabled(False)  # Disable placeholder
 
-        column_completer = QCompleter(list(columns.keys()))
+        column_completer = QCompleter(list(self.columns.keys()))
         column_completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
         self.combo_columns.setCompleter(column_completer)
 
@@ -806,11 +862,11 @@ class RBCCommunityMap(QMainWindow):
         self.combo_rows.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
         self.combo_rows.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
         self.combo_rows.addItem("Select Row")
-        self.combo_rows.addItems(list(rows.keys()))
+        self.combo_rows.addItems(list(self.rows.keys()))
         self.combo_rows.setCurrentIndex(0)
         self.combo_rows.model().item(0).setEnabled(False)
 
-        row_completer = QCompleter(list(rows.keys()))
+        row_completer = QCompleter(list(self.rows.keys()))
         row_completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
         self.combo_rows.setCompleter(row_completer)
 
@@ -913,10 +969,9 @@ class RBCCommunityMap(QMainWindow):
         # Make sure the webview expands to fill the remaining space
         self.website_frame.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
 
-        # Directly process coins from HTML within `process_html`
+        # Directly process coins from page data within `process_page_data`
         if self.selected_character:
-            connection = sqlite3.connect(DB_PATH)
-            cursor = connection.cursor()
+            cursor = db_reader().cursor()
             try:
                 cursor.execute("SELECT id FROM characters WHERE name = ?", (self.selected_character['name'],))
                 character_row = cursor.fetchone()
@@ -929,10 +984,8 @@ class RBCCommunityMap(QMainWindow):
             except sqlite3.Error as e:
                 logging.error(f"Failed to retrieve character ID: {e}")
             finally:
-                connection.close()
-
                 self.show()
-                self.update_minimap()
+                self.update_minimap("character loaded")
 
     # -----------------------
     # Browser Controls Setup
@@ -1030,6 +1083,9 @@ class RBCCommunityMap(QMainWindow):
 
         self.update_log_level_menu()
 
+        # Apply keybind changes from the settings store, wherever they come from
+        app_settings().keybind_config_changed.connect(self.on_keybind_config_changed)
+
         # Tools menu
         tools_menu = menu_bar.addMenu('Tools')
 
@@ -1196,9 +1252,8 @@ class RBCCommunityMap(QMainWindow):
         """
         Opens the Damage Calculator dialog within RBCCommunityMap.
         """
-        # Initialize the DamageCalculator dialog with the SQLite database connection
-        connection = sqlite3.connect(DB_PATH)
-        damage_calculator = DamageCalculator(connection)
+        # Initialize the DamageCalculator dialog with the shared read connection
+        damage_calculator = DamageCalculator(db_reader())
 
         # Set the default selection in the combobox to 'No Charisma'
         damage_calculator.charisma_dropdown.setCurrentIndex(0)  # Index 0 corresponds to 'No Charisma'
@@ -1206,9 +1261,6 @@ class RBCCommunityMap(QMainWindow):
         # Show the DamageCalculator dialog as a modal
         damage_calculator.exec()
 
-        # Close the database connection after use
-        connection.close()
-
     def display_shopping_list(self, shopping_list):
         """
         Display the shopping list in a dialog.
@@ -1236,7 +1288,7 @@ class RBCCommunityMap(QMainWindow):
 
     def update_log_level_menu(self) -> None:
         """
-        Update the check state of log level actions based on current level from DB.
+        Update the check state of log level actions based on the current level in settings.
         """
         current_level = get_logging_level_from_db()
         for level, action in self.log_level_actions.items():
@@ -1281,10 +1333,8 @@ class RBCCommunityMap(QMainWindow):
     # -----------------------
 
     def load_characters(self):
-        connection = None
         try:
-            connection = sqlite3.connect(DB_PATH)
-            cursor = connection.cursor()
+            cursor = db_reader().cursor()
             cursor.execute("SELECT id, name, password FROM characters")
             character_data = cursor.fetchall()
             self.characters = [
@@ -1308,27 +1358,19 @@ class RBCCommunityMap(QMainWindow):
             QMessageBox.critical(self, "Error", f"Failed to load characters: {e}")
             self.characters = []
             self.selected_character = None
-        finally:
-            if connection:
-                connection.close()
 
     def save_characters(self):
-        connection = None
         try:
-            connection = sqlite3.connect(DB_PATH)
-            cursor = connection.cursor()
-            for character in self.characters:
-                cursor.execute('''
-                    INSERT OR REPLACE INTO characters (id, name, password) VALUES (?, ?, ?)
-                ''', (character.get('id'), character['name'], character['password']))
-            connection.commit()
+            with db_writer() as connection:
+                cursor = connection.cursor()
+                for character in self.characters:
+                    cursor.execute('''
+                        INSERT OR REPLACE INTO characters (id, name, password) VALUES (?, ?, ?)
+                    ''', (character.get('id'), character['name'], character['password']))
             logging.debug("Characters saved successfully to the database in plaintext.")
         except sqlite3.Error as e:
             logging.error(f"Failed to save characters to database: {e}")
             QMessageBox.critical(self, "Error", f"Failed to save characters: {e}")
-        finally:
-            if connection:
-                connection.close()
 
     def on_character_selected(self, item):
         """
@@ -1348,7 +1390,7 @@ class RBCCommunityMap(QMainWindow):
         # Ensure character has ID
         if 'id' not in self.selected_character:
             try:
-                with sqlite3.connect(DB_PATH) as conn:
+                with db_reader() as conn:
                     cursor = conn.cursor()
                     cursor.execute("SELECT id FROM characters WHERE name = ?", (character_name,))
                     row = cursor.fetchone()
@@ -1369,7 +1411,7 @@ class RBCCommunityMap(QMainWindow):
         self.pending_login = True
         self.save_last_active_character(character_id)
         self.load_last_destination_for_character(character_id)
-        self.update_minimap()
+        self.update_minimap("character selected")
 
         # Inject cookie and trigger page reload
         self.switch_to_character(character_name)
@@ -1379,7 +1421,7 @@ class RBCCommunityMap(QMainWindow):
         Switch to the selected character by loading its saved IP cookie into the WebEngine.
         """
         try:
-            with sqlite3.connect(DB_PATH) as conn:
+            with db_reader() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
                     SELECT c.active_cookie, k.value 
@@ -1442,13 +1484,12 @@ class RBCCommunityMap(QMainWindow):
         if dialog.exec():
             name = dialog.name_edit.text()
             password = dialog.password_edit.text()
-            with sqlite3.connect(DB_PATH) as conn:
+            with db_writer() as conn:
                 cursor = conn.cursor()
                 try:
                     cursor.execute('INSERT INTO characters (name, password) VALUES (?, ?)', (name, password))
                     character_id = cursor.lastrowid
                     cursor.execute('INSERT INTO coins (character_id, pocket, bank) VALUES (?, 0, 0)', (character_id,))
-                    conn.commit()
 
                     self.save_last_active_character(character_id)
 
@@ -1485,13 +1526,12 @@ class RBCCommunityMap(QMainWindow):
         name = dialog.name_edit.text().strip()
         password = dialog.password_edit.text().strip()
 
-        with sqlite3.connect(DB_PATH) as conn:
+        with db_writer() as conn:
             cursor = conn.cursor()
             try:
                 cursor.execute('INSERT INTO characters (name, password) VALUES (?, ?)', (name, password))
                 character_id = cursor.lastrowid
                 cursor.execute('INSERT INTO coins (character_id, pocket, bank) VALUES (?, 0, 0)', (character_id,))
-                conn.commit()
 
                 character = {'id': character_id, 'name': name, 'password': password}
                 self.characters.append(character)
@@ -1546,12 +1586,11 @@ class RBCCommunityMap(QMainWindow):
             return  # 🚨 Do not proceed if fields are blank
 
         try:
-            with sqlite3.connect(DB_PATH) as conn:
+            with db_writer() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
                     UPDATE characters SET name = ?, password = ? WHERE id = ?
                 """, (new_name, new_password, character['id']))
-                conn.commit()
 
             # Update in-memory character and UI
             character['name'] = new_name
@@ -1580,10 +1619,9 @@ class RBCCommunityMap(QMainWindow):
 
         # Delete from database first
         try:
-            with sqlite3.connect(DB_PATH) as conn:
+            with db_writer() as conn:
                 cursor = conn.cursor()
                 cursor.execute("DELETE FROM characters WHERE id = ?", (char_id,))
-                conn.commit()
                 logging.debug(f"Character ID {char_id} deleted from database.")
         except sqlite3.Error as e:
             logging.error(f"Failed to delete character ID {char_id} from database: {e}")
@@ -1600,12 +1638,11 @@ class RBCCommunityMap(QMainWindow):
         Save the last active character's ID to the last_active_character table.
         Ensures that only one entry exists, replacing any previous entry.
         """
-        with sqlite3.connect(DB_PATH) as conn:
+        with db_writer() as conn:
             cursor = conn.cursor()
             try:
                 cursor.execute("DELETE FROM last_active_character")
                 cursor.execute('INSERT INTO last_active_character (character_id) VALUES (?)', (character_id,))
-                conn.commit()
                 logging.debug(f"Last active character set to character_id: {character_id}")
             except sqlite3.Error as e:
                 logging.error(f"Failed to save last active character: {e}")
@@ -1616,7 +1653,7 @@ class RBCCommunityMap(QMainWindow):
         inject their cookie, and auto-login them on load.
         """
         try:
-            with sqlite3.connect(DB_PATH) as conn:
+            with db_reader() as conn:
                 cursor = conn.cursor()
                 cursor.execute("SELECT character_id FROM last_active_character")
                 result = cursor.fetchone()
@@ -1635,7 +1672,7 @@ class RBCCommunityMap(QMainWindow):
                         logging.debug(f"Last active character loaded and selected: {self.selected_character['name']}")
 
                         self.load_last_destination_for_character(character_id)
-                        self.update_minimap()
+                        self.update_minimap("last character")
 
                         # ✅ Inject correct cookie for selected character
                         self.switch_to_character(self.selected_character['name'])
@@ -1677,7 +1714,7 @@ class RBCCommunityMap(QMainWindow):
     def load_last_destination_for_character(self, character_id: int) -> None:
         """Load the last destination from the destinations table."""
         try:
-            with sqlite3.connect(DB_PATH) as conn:
+            with db_reader() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     "SELECT col, row FROM destinations WHERE character_id = ? ORDER BY timestamp DESC LIMIT 1",
@@ -1712,7 +1749,7 @@ class RBCCommunityMap(QMainWindow):
         """
         if css is None:
             try:
-                with sqlite3.connect(DB_PATH) as conn:
+                with db_reader() as conn:
                     cursor = conn.cursor()
                     cursor.execute("SELECT element, value FROM custom_css WHERE profile_name = ?",
                                    (self.current_css_profile,))
@@ -1744,7 +1781,7 @@ class RBCCommunityMap(QMainWindow):
             return
 
         logging.info("Webpage loaded successfully.")
-        self.website_frame.page().toHtml(self.process_html)
+        self.extract_page_data()
         css = self.load_current_css()
         self.apply_custom_css(css)
 
@@ -1757,21 +1794,34 @@ class RBCCommunityMap(QMainWindow):
         if self.pending_character_id_for_map:
             logging.debug(f"Loading destination for character {self.pending_character_id_for_map}")
             self.load_destination(self.pending_character_id_for_map)
-            self.update_minimap()
+            self.update_minimap("destination")
             self.pending_character_id_for_map = None
 
-    def process_html(self, html):
+    def extract_page_data(self):
+        """
+        Run the in-page extractor script. The page sends back one compact JSON string, which is handled
+        by process_page_data, instead of serialising the whole DOM for parsing in Python.
+        """
+        self.website_frame.page().runJavaScript(PAGE_EXTRACTOR_JS, self.process_page_data)
+
+    def process_page_data(self, result):
         """
-        Process the HTML content of the webview to extract coordinates and coin information.
+        Process the data extracted from the webview to update coordinates and coin information.
 
         Args:
-            html (str): The HTML content of the page as a string.
+            result (str): JSON string produced by PAGE_EXTRACTOR_JS.
 
-        This method calls both the extract_coordinates_from_html and extract_coins_from_html methods.
+        The page is analysed once into a PageSnapshot, which both extract_coordinates and extract_coins read.
         """
+        page = parse_page_extract(result)
+        if page is None:
+            return
+
         try:
+            snapshot = PageSnapshot.from_extract(page)
+
             # Extract coordinates for the minimap
-            x_coord, y_coord = self.extract_coordinates_from_html(html)
+            x_coord, y_coord = self.extract_coordinates(snapshot)
             if x_coord is not None and y_coord is not None:
                 # Set character coordinates directly
                 self.character_x, self.character_y = x_coord, y_coord
@@ -1784,27 +1834,21 @@ class RBCCommunityMap(QMainWindow):
                 self.recenter_minimap()
 
             # Update coin info
-            self.extract_coins_from_html(html)
-            logging.debug("HTML processed successfully for coordinates and coin count.")
+            self.extract_coins(snapshot)
+            logging.debug("Page data processed successfully for coordinates and coin count.")
 
         except Exception as e:
-            logging.error(f"Unexpected error in process_html: {e}")
+            logging.error(f"Unexpected error in process_page_data: {e}")
 
     def refresh_compass_state(self):
         if not self.destination:
             self.ap_direction_label.setText("Compass: None")
             return
 
-        direct_route, transit_route = self.get_compass_routes()
+        direct_route, transit_route, alternative_routes = self.get_compass_routes()
 
         # Determine selected route (manual or shortest)
-        if self.selected_route_label == "Direct Route":
-            selected = direct_route
-        elif self.selected_route_label == "Transit Route":
-            selected = transit_route
-        else:
-            selected = direct_route if direct_route[0] <= transit_route[0] else transit_route
-            self.selected_route_label = "Direct Route" if selected == direct_route else "Transit Route"
+        selected = self.select_compass_route(direct_route, transit_route, alternative_routes)
 
         self.selected_route_path = selected[2]
         self.selected_route_description = selected[1]
@@ -1812,269 +1856,40 @@ class RBCCommunityMap(QMainWindow):
 
         # Ensure overlay updates
         if hasattr(self, "compass_overlay") and self.compass_overlay.isVisible():
-            self.compass_overlay.refresh(direct_route, transit_route)
+            self.compass_overlay.refresh(direct_route, transit_route, alternative_routes)
 
         # ✅ Force minimap redraw with selected route
-        self.update_minimap()
-
-    def extract_coordinates_from_html(self, html):
-
-        soup = BeautifulSoup(html, 'html.parser')
-        # logging.debug("Extracting coordinates from HTML...")
+        self.update_minimap("compass")
 
-        # Try to extract the intersection label (like "Aardvark and 1st")
-        intersect_span = soup.find('span', class_='intersect')
-        text = intersect_span.text.strip() if intersect_span else ""
-        # logging.debug(f"Intersection label found: {text}")
-
-        # Check for city limits
-        city_limit_cells = soup.find_all('td', class_='cityblock')
-
-        # Extract coordinate inputs
-        inputs = soup.find_all('input')
-        x_vals = [int(inp['value']) for inp in inputs if
-                  inp.get('name') == 'x' and inp.get('value') and inp['value'].isdigit()]
-        y_vals = [int(inp['value']) for inp in inputs if
-                  inp.get('name') == 'y' and inp.get('value') and inp['value'].isdigit()]
-        last_x = max(x_vals) if x_vals else None
-        last_y = max(y_vals) if y_vals else None
-
-        # Get the first x/y (center of grid)
-        first_x_input = soup.find('input', {'name': 'x'})
-        first_y_input = soup.find('input', {'name': 'y'})
-        first_x = int(first_x_input['value']) if first_x_input else None
-        first_y = int(first_y_input['value']) if first_y_input else None
-
-        logging.debug(f"First detected coordinate: x={first_x}, y={first_y}")
-        logging.debug(f"Last detected coordinate: x={last_x}, y={last_y}")
-
-        if city_limit_cells:
-            logging.debug(f"Found {len(city_limit_cells)} city limit blocks.")
-
-            # Check for first available coordinates
-            first_x_input = soup.find('input', {'name': 'x'})
-            first_y_input = soup.find('input', {'name': 'y'})
-
-            first_x = int(first_x_input['value']) if first_x_input else None
-            first_y = int(first_y_input['value']) if first_y_input else None
-
-            logging.debug(f"First detected coordinate: x={first_x}, y={first_y}")
-
-            if self.zoom_level == 3:
-                if text == "Aardvark and 1st" and len(city_limit_cells) == 5:
-                    logging.debug("Top-left corner detected with full border row: Aardvark and 1st")
-                    return -1, -1
-
-                if text == "Zestless and 1st" and len(city_limit_cells) == 5:
-                    logging.debug("Top-right corner detected: Zestless and 1st")
-                    return 198, -1
-
-                if text == "Aardvark and 100th" and len(city_limit_cells) == 5:
-                    logging.debug("Bottom-left corner detected: Aardvark and 100th")
-                    return -1, 198
-
-                if text == "Zestless and 100th" and len(city_limit_cells) == 5:
-                    logging.debug("Bottom-right corner detected: Zestless and 100th")
-                    return 198, 198
-
-                # Adjust for Aardvark and NCL
-                if len(city_limit_cells) == 3 and first_y == 0 and first_x == 0 and last_x == 2 and last_y == 1:
-                    logging.debug(f"Detected Cell 0,1.")
-                    return 0, -1
-
-                # Adjust for WCL and 1st (0,1)
-                if len(city_limit_cells) == 3 and first_y == 0 and first_x == 0:
-                    logging.debug(f"Detected Cell 0,1.")
-                    return -1, 0
-
-                # Adjust for ON Zestless and 1st (198,1)
-                if len(city_limit_cells) == 3 and first_x == 198 and first_y == 0:
-                    logging.debug("Detected special case: on Zestless and 1st")
-                    return first_x, first_y
-
-                # Adjust for Northern Edge (Y=0)
-                if len(city_limit_cells) == 3 and first_y == 0:
-                    logging.debug(f"Detected Northern City Limit at y={first_y}")
-                    return first_x, -1
-
-                # Adjust for Western Edge (X=0)
-                if len(city_limit_cells) == 3 and first_x == 0:
-                    logging.debug(f"Detected Western City Limit at x={first_x}")
-                    return -1, first_y
-
-                # If no adjustments, return detected values
-                return first_x, first_y
-
-            if self.zoom_level == 5:
-                if text == "Aardvark and 1st" and len(city_limit_cells) == 5:
-                    logging.debug("Top-left corner detected with full border row: Aardvark and 1st")
-                    return -2, -2
-
-                if text == "Zestless and 1st" and len(city_limit_cells) == 5:
-                    logging.debug("Top-right corner detected: Zestless and 1st")
-                    return 197, -2
-
-                if text == "Aardvark and 100th" and len(city_limit_cells) == 5:
-                    logging.debug("Bottom-left corner detected: Aardvark and 100th")
-                    return -2, 197
-
-                if text == "Zestless and 100th" and len(city_limit_cells) == 5:
-                    logging.debug("Bottom-right corner detected: Zestless and 100th")
-                    return 197, 197
-
-                # Adjust for Aardvark and NCL (1,0)
-                if len(city_limit_cells) == 3 and first_y == 0 and first_x == 0 and last_x == 2 and last_y == 1:
-                    logging.debug(f"Detected Cell 1,0.")
-                    return -1, -2
-
-                # Adjust for WCL and 1st (0,1)
-                if len(city_limit_cells) == 3 and first_y == 0 and first_x == 0:
-                    logging.debug(f"Detected Cell 0,1.")
-                    return -2, -1
-
-                # Adjust for ON Zestless and 1st (198,1)
-                if len(city_limit_cells) == 3 and first_x == 198 and first_y == 0:
-                    logging.debug("Detected special case: on Zestless and 1st")
-                    return first_x - 1, first_y - 1
-
-                # Adjust for Northern Edge (Y=0)
-                if len(city_limit_cells) == 3 and first_y == 0:
-                    logging.debug(f"Detected Northern City Limit at y={first_y}")
-                    return first_x - 1, -2
-
-                # Adjust for Western Edge (X=0)
-                if len(city_limit_cells) == 3 and first_x == 0:
-                    logging.debug(f"Detected Western City Limit at x={first_x}")
-                    return -2, first_y - 1
-
-                return first_x - 1, first_y - 1
-
-            if self.zoom_level == 7:
-                if text == "Aardvark and 1st" and len(city_limit_cells) == 5:
-                    logging.debug("Top-left corner detected with full border row: Aardvark and 1st")
-                    return -3, -3
-
-                if text == "Zestless and 1st" and len(city_limit_cells) == 5:
-                    logging.debug("Top-right corner detected: Zestless and 1st")
-                    return 196, -3
-
-                if text == "Aardvark and 100th" and len(city_limit_cells) == 5:
-                    logging.debug("Bottom-left corner detected: Aardvark and 100th")
-                    return -3, 196
-
-                if text == "Zestless and 100th" and len(city_limit_cells) == 5:
-                    logging.debug("Bottom-right corner detected: Zestless and 100th")
-                    return 196, 196
-
-                # Adjust for Aardvark and NCL (1,0)
-                if len(city_limit_cells) == 3 and first_y == 0 and first_x == 0 and last_x == 2 and last_y == 1:
-                    logging.debug(f"Detected Cell 1,0.")
-                    return -2, -3
-
-                # Adjust for WCL and 1st (0,1)
-                if len(city_limit_cells) == 3 and first_y == 0 and first_x == 0:
-                    logging.debug(f"Detected Cell 0,1.")
-                    return -3, -2
-
-                # Adjust for ON Zestless and 1st (198,1)
-                if len(city_limit_cells) == 3 and first_x == 198 and first_y == 0:
-                    logging.debug("Detected special case: on Zestless and 1st")
-                    return first_x - 2, first_y - 2
-
-                # Adjust for Northern Edge (Y=0)
-                if len(city_limit_cells) == 3 and first_y == 0:
-                    logging.debug(f"Detected Northern City Limit at y={first_y}")
-                    return first_x - 2, -3
-
-                # Adjust for Western Edge (X=0)
-                if len(city_limit_cells) == 3 and first_x == 0:
-                    logging.debug(f"Detected Western City Limit at x={first_x}")
-                    return -3, first_y - 2
-
-                return first_x - 2, first_y - 2
-
-        logging.debug(f"Safe Fallback: x={first_x}, y={first_y}")
-        return first_x, first_y
-
-    def extract_coins_from_html(self, html):
+    def extract_coins(self, snapshot):
         """
         Extract bank coins, pocket coins, and handle coin-related actions such as deposits,
         withdrawals, transit handling, and coins gained from hunting or stealing.
 
         Args:
-            html (str): The HTML content as a string.
-
-        This method searches for bank balance, deposits, withdrawals, hunting, robbing, receiving,
-        and transit coin actions in the HTML content, updating both bank and pocket coins in the
-        SQLite database based on character_id.
-        """
-        with sqlite3.connect(DB_PATH) as conn:
-            cursor = conn.cursor()
-            character_id = self.selected_character['id']
-            updates = []
-
-            bank_match = re.search(r"Welcome to Omnibank. Your account has (\d+) coins in it.", html)
-            if bank_match:
-                bank_coins = int(bank_match.group(1))
-                logging.info(f"Bank coins found: {bank_coins}")
-                updates.append(("UPDATE coins SET bank = ? WHERE character_id = ?", (bank_coins, character_id)))
-
-            pocket_match = re.search(r"You have (\d+) coins", html) or re.search(r"Money: (\d+) coins", html)
-            if pocket_match:
-                pocket_coins = int(pocket_match.group(1))
-                logging.info(f"Pocket coins found: {pocket_coins}")
-                updates.append(("UPDATE coins SET pocket = ? WHERE character_id = ?", (pocket_coins, character_id)))
-
-            deposit_match = re.search(r"You deposit (\d+) coins.", html)
-            if deposit_match:
-                deposit_coins = int(deposit_match.group(1))
-                logging.info(f"Deposit found: {deposit_coins} coins")
-                updates.append(
-                    ("UPDATE coins SET pocket = pocket - ? WHERE character_id = ?", (deposit_coins, character_id)))
-
-            withdraw_match = re.search(r"You withdraw (\d+) coins.", html)
-            if withdraw_match:
-                withdraw_coins = int(withdraw_match.group(1))
-                logging.info(f"Withdrawal found: {withdraw_coins} coins")
-                updates.append(
-                    ("UPDATE coins SET pocket = pocket + ? WHERE character_id = ?", (withdraw_coins, character_id)))
-
-            transit_match = re.search(r"It costs 5 coins to ride. You have (\d+).", html)
-            if transit_match:
-                coins_in_pocket = int(transit_match.group(1))
-                logging.info(f"Transit found: Pocket coins updated to {coins_in_pocket}")
-                updates.append(("UPDATE coins SET pocket = ? WHERE character_id = ?", (coins_in_pocket, character_id)))
-
-            actions = {
-                'hunter': r'You drink the hunter\'s blood.*You also found (\d+) coins',
-                'paladin': r'You drink the paladin\'s blood.*You also found (\d+) coins',
-                'human': r'You drink the human\'s blood.*You also found (\d+) coins',
-                'bag_of_coins': r'The bag contained (\d+) coins',
-                'robbing': r'You stole (\d+) coins from (\w+)',
-                'silver_suitcase': r'The suitcase contained (\d+) coins',
-                'given_coins': r'(\w+) gave you (\d+) coins',
-                'getting_robbed': r'(\w+) stole (\d+) coins from you'
-            }
-
-            for action, pattern in actions.items():
-                match = re.search(pattern, html)
-                if match:
-                    coin_count = int(match.group(1 if action != 'given_coins' else 2))
-                    if action == 'getting_robbed':
-                        vamp_name = match.group(1)
-                        updates.append(
-                            ("UPDATE coins SET pocket = pocket - ? WHERE character_id = ?", (coin_count, character_id)))
-                        logging.info(f"Lost {coin_count} coins to {vamp_name}.")
-                    else:
-                        updates.append(
-                            ("UPDATE coins SET pocket = pocket + ? WHERE character_id = ?", (coin_count, character_id)))
-                        logging.info(f"Gained {coin_count} coins from {action}.")
-                    break
+            snapshot (PageSnapshot): Analysed game page with its coin message matches.
+
+        This method applies bank balance, deposits, withdrawals, hunting, robbing, receiving,
+        and transit coin actions found on the page, updating both bank and pocket coins in the
+        SQLite database based on character_id. The updates are queued on the write-behind queue.
+        """
+        character_id = self.selected_character['id']
+        # (query, params, coalescing key). Only absolute updates get a key, so a newer balance
+        # replaces an older one that has not been written yet.
+        updates = []
+        for update in coin_updates(snapshot):
+            if update.relative:
+                updates.append((f"UPDATE coins SET {update.column} = {update.column} + ? WHERE character_id = ?",
+                                (update.amount, character_id), None))
+            else:
+                updates.append((f"UPDATE coins SET {update.column} = ? WHERE character_id = ?",
+                                (update.amount, character_id), (f'coins.{update.column}', character_id)))
 
-            for query, params in updates:
-                cursor.execute(query, params)
-            conn.commit()
-            logging.info(f"Updated coins for character ID {character_id}.")
+        write_queue = write_behind_queue()
+        for query, params, key in updates:
+            write_queue.execute(query, params, key)
+        if updates:
+            logging.info(f"Queued {len(updates)} coin updates for character ID {character_id}.")
 
     def switch_css_profile(self, profile_name: str) -> None:
         self.current_css_profile = profile_name
@@ -2087,420 +1902,43 @@ class RBCCommunityMap(QMainWindow):
 
     def draw_minimap(self) -> None:
         """
-        Draws the minimap with various features such as special locations and lines to nearest locations,
-        with cell lines and dynamically scaled text size.
+        Snapshot the minimap state and have the MinimapRenderWorker draw it off the GUI thread.
+        The frame is shown by _show_minimap_frame once it is ready.
         """
-        pixmap = PySide6.QtGui.QPixmap(self.minimap_size, self.minimap_size)
-        painter = PySide6.QtGui.QPainter(pixmap)
-        painter.fillRect(0, 0, self.minimap_size, self.minimap_size, PySide6.QtGui.QColor('lightgrey'))
-
-        block_size = self.minimap_size // self.zoom_level
-        font_size = max(8, block_size // 4)  # Dynamically adjust font size, with a minimum of 5
-        border_size = 1  # Size of the border around each cell
+        self.minimap_render_worker.request(self.minimap_renderer.snapshot())
 
-        font = painter.font()
-        font.setPointSize(font_size)
-        painter.setFont(font)
-
-        font_metrics = PySide6.QtGui.QFontMetrics(font)
-
-        logging.debug(
-            f"Drawing minimap with column_start={self.column_start}, row_start={self.row_start}, "f"zoom_level={self.zoom_level}, block_size={block_size}")
-
-        if self.selected_route_path and len(self.selected_route_path) >= 2:
-            color = PySide6.QtGui.QColor(
-                "green") if self.selected_route_label == "Direct Route" else PySide6.QtGui.QColor(170, 0, 170)
-            pen = PySide6.QtGui.QPen(color, 2)
-            painter.setPen(pen)
-
-            for i in range(len(self.selected_route_path) - 1):
-                x1, y1 = self.selected_route_path[i]
-                x2, y2 = self.selected_route_path[i + 1]
-
-                # Convert map coordinates to screen positions
-                col1 = x1 - self.column_start
-                row1 = y1 - self.row_start
-                col2 = x2 - self.column_start
-                row2 = y2 - self.row_start
-
-                tile_size = self.zoom_level  # size in pixels
-                cx1 = col1 * tile_size + tile_size // 2
-                cy1 = row1 * tile_size + tile_size // 2
-                cx2 = col2 * tile_size + tile_size // 2
-                cy2 = row2 * tile_size + tile_size // 2
-
-                painter.drawLine(cx1, cy1, cx2, cy2)
-
-        def draw_label_box(x, y, width, base_height, bg_color, text):
-            """
-            Draws a text label box with a background color, white border, and properly formatted text.
-            Allows wrapped text to grow to 2 lines in zoom 5 and 7.
-            """
-            # Set font based on zoom level
-            font = painter.font()
-            if self.zoom_level == 3:
-                font.setPointSize(max(4, min(8, width // 4)))
-            elif self.zoom_level == 5:
-                font.setPointSize(max(4, min(7, width // 5)))
-            elif self.zoom_level == 7:
-                font.setPointSize(max(4, min(6, width // 6)))
-            painter.setFont(font)
-
-            # Calculate actual wrapped height using boundingRect
-            font_metrics = PySide6.QtGui.QFontMetrics(font)
-            if self.zoom_level >= 5:
-                # Use a dummy bounding rect to get actual wrapped height
-                wrapped_rect = font_metrics.boundingRect(
-                    QRect(0, 0, width, 1000),
-                    Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop | Qt.TextFlag.TextWordWrap,
-                    text
-                )
-                max_height = base_height
-                label_height = min(wrapped_rect.height() + 4, max_height)
-            else:
-                label_height = base_height
-
-            # Draw background
-            painter.fillRect(QRect(x, y, width, label_height), bg_color)
-
-            # Draw white border
-            painter.setPen(PySide6.QtGui.QColor('white'))
-            painter.drawRect(QRect(x, y, width, label_height))
-
-            # Draw text
-            text_rect = QRect(x, y, width, label_height)
-            painter.setPen(PySide6.QtGui.QColor('white'))
-
-            if self.zoom_level >= 5:
-                painter.drawText(
-                    text_rect,
-                    Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop | Qt.TextFlag.TextWordWrap,
-                    text
-                )
-            else:
-                painter.drawText(
-                    text_rect,
-                    Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignVCenter,
-                    text
-                )
-
-        # Draw the grid
-        for i in range(self.zoom_level):
-            for j in range(self.zoom_level):
-                column_index = self.column_start + j
-                row_index = self.row_start + i
-
-                x0, y0 = j * block_size, i * block_size
-                logging.debug(
-                    f"Drawing grid cell at column_index={column_index}, row_index={row_index}, "f"x0={x0}, y0={y0}")
-
-                # Draw the cell background
-                painter.setPen(PySide6.QtGui.QColor('white'))
-                painter.drawRect(x0, y0, block_size - border_size, block_size - border_size)
-
-                # Special location handling
-                column_name = next((name for name, coord in self.columns.items() if coord == column_index), None)
-                row_name = next((name for name, coord in self.rows.items() if coord == row_index), None)
-
-                # Draw cell background color to match in-game city grid
-                if column_index < 1 or column_index > 200 or row_index < 1 or row_index > 200:
-                    # Map edges (border)
-                    painter.fillRect(x0 + border_size, y0 + border_size, block_size - 2 * border_size,
-                                     block_size - 2 * border_size, PySide6.QtGui.QColor(self.color_mappings["edge"]))
-                elif column_index % 2 == 0 or row_index % 2 == 0:
-                    # If either coordinate is even → Streets (Gray)
-                    painter.fillRect(x0 + border_size, y0 + border_size, block_size - 2 * border_size,
-                                     block_size - 2 * border_size, PySide6.QtGui.QColor(self.color_mappings["street"]))
-                else:
-                    # Both coordinates odd → City Blocks (Black)
-                    painter.fillRect(x0 + border_size, y0 + border_size, block_size - 2 * border_size,
-                                     block_size - 2 * border_size, PySide6.QtGui.QColor(self.color_mappings["alley"]))
-
-                if column_name and row_name:
-                    label_text = f"{column_name} & {row_name}"
-                    label_height = block_size // 3  # Set label height
-                    draw_label_box(x0 + 2, y0 + 2, block_size - 4, label_height, self.color_mappings["intersect"],
-                                   label_text)
-
-        # Draw special locations (banks with correct offsets)
-        for bank_key in self.banks_coordinates.keys():
-            if " & " in bank_key:
-                col_name, row_name = bank_key.split(" & ")
-                col = self.columns.get(col_name, 0)
-                row = self.rows.get(row_name, 0)
-
-                if col is not None and row is not None:
-                    adjusted_column_index = col + 1
-                    adjusted_row_index = row + 1
-
-                    # Dynamically determine label height based on zoom
-                    if self.zoom_level >= 5:
-                        font = painter.font()
-                        font.setPointSize(max(4, min(7, block_size // 5)) if self.zoom_level == 5 else max(4, min(6,
-                                                                                                                  block_size // 6)))
-                        font_metrics = PySide6.QtGui.QFontMetrics(font)
-                        line_height = font_metrics.lineSpacing()
-                        label_height = min(line_height * 2 + 4, block_size)
-                    else:
-                        label_height = block_size // 3
-
-                    draw_label_box(
-                        (adjusted_column_index - self.column_start) * block_size,
-                        (adjusted_row_index - self.row_start) * block_size,
-                        block_size, label_height, self.color_mappings["bank"], "BANK"
-                    )
-                else:
-                    logging.warning(f"Skipping bank at {col_name} & {row_name} due to missing coordinates")
-            else:
-                logging.warning(f"Skipping invalid bank_key format: {bank_key}")
-
-        # Draw other locations without the offset
-        for name, (column_index, row_index) in self.taverns_coordinates.items():
-            if column_index is not None and row_index is not None:
-                if self.zoom_level >= 5:
-                    font = painter.font()
-                    font.setPointSize(
-                        max(4, min(7, block_size // 5)) if self.zoom_level == 5 else max(4, min(6, block_size // 6)))
-                    font_metrics = PySide6.QtGui.QFontMetrics(font)
-                    line_height = font_metrics.lineSpacing()
-                    label_height = min(line_height * 2 + 4, block_size)
-                else:
-                    label_height = block_size // 3
-                draw_label_box(
-                    (column_index - self.column_start) * block_size,
-                    (row_index - self.row_start) * block_size,
-                    block_size, label_height, self.color_mappings["tavern"], name
-                )
-
-        for name, (column_index, row_index) in self.transits_coordinates.items():
-            if column_index is not None and row_index is not None:
-                if self.zoom_level >= 5:
-                    font = painter.font()
-                    font.setPointSize(
-                        max(4, min(7, block_size // 5)) if self.zoom_level == 5 else max(4, min(6, block_size // 6)))
-                    font_metrics = PySide6.QtGui.QFontMetrics(font)
-                    line_height = font_metrics.lineSpacing()
-                    label_height = min(line_height * 2 + 4, block_size)
-                else:
-                    label_height = block_size // 3
-                draw_label_box(
-                    (column_index - self.column_start) * block_size,
-                    (row_index - self.row_start) * block_size,
-                    block_size, label_height, self.color_mappings["transit"], name
-                )
-
-        for name, (column_index, row_index) in self.user_buildings_coordinates.items():
-            if column_index is not None and row_index is not None:
-                if self.zoom_level >= 5:
-                    font = painter.font()
-                    font.setPointSize(
-                        max(4, min(7, block_size // 5)) if self.zoom_level == 5 else max(4, min(6, block_size // 6)))
-                    font_metrics = PySide6.QtGui.QFontMetrics(font)
-                    line_height = font_metrics.lineSpacing()
-                    label_height = min(line_height * 2 + 4, block_size)
-                else:
-                    label_height = block_size // 3
-                draw_label_box(
-                    (column_index - self.column_start) * block_size,
-                    (row_index - self.row_start) * block_size,
-                    block_size, label_height, self.color_mappings["user_building"], name
-                )
-
-        for name, (column_index, row_index) in self.shops_coordinates.items():
-            if column_index is not None and row_index is not None:
-                if self.zoom_level >= 5:
-                    font = painter.font()
-                    font.setPointSize(
-                        max(4, min(7, block_size // 5)) if self.zoom_level == 5 else max(4, min(6, block_size // 6)))
-                    font_metrics = PySide6.QtGui.QFontMetrics(font)
-                    line_height = font_metrics.lineSpacing()
-                    label_height = min(line_height * 2 + 4, block_size)
-                else:
-                    label_height = block_size // 3
-                draw_label_box(
-                    (column_index - self.column_start) * block_size,
-                    (row_index - self.row_start) * block_size,
-                    block_size, label_height, self.color_mappings["shop"], name
-                )
-
-        for name, (column_index, row_index) in self.guilds_coordinates.items():
-            if column_index is not None and row_index is not None:
-                if self.zoom_level >= 5:
-                    font = painter.font()
-                    font.setPointSize(
-                        max(4, min(7, block_size // 5)) if self.zoom_level == 5 else max(4, min(6, block_size // 6)))
-                    font_metrics = PySide6.QtGui.QFontMetrics(font)
-                    line_height = font_metrics.lineSpacing()
-                    label_height = min(line_height * 2 + 4, block_size)
-                else:
-                    label_height = block_size // 3
-                draw_label_box(
-                    (column_index - self.column_start) * block_size,
-                    (row_index - self.row_start) * block_size,
-                    block_size, label_height, self.color_mappings["guild"], name
-                )
-
-        for name, (column_index, row_index) in self.places_of_interest_coordinates.items():
-            if column_index is not None and row_index is not None:
-                if name.lower() == "graveyard":
-                    color = self.color_mappings.get("graveyard", self.color_mappings["placesofinterest"])
-                else:
-                    color = self.color_mappings["placesofinterest"]
-
-                logging.debug(f"Drawing {name} with color {color.name()}")
-
-                if self.zoom_level >= 5:
-                    font = painter.font()
-                    font.setPointSize(
-                        max(4, min(7, block_size // 5)) if self.zoom_level == 5 else max(4, min(6, block_size // 6)))
-                    font_metrics = PySide6.QtGui.QFontMetrics(font)
-                    line_height = font_metrics.lineSpacing()
-                    label_height = min(line_height * 2 + 4, block_size)
-                else:
-                    label_height = block_size // 3
-
-                draw_label_box(
-                    (column_index - self.column_start) * block_size,
-                    (row_index - self.row_start) * block_size,
-                    block_size, label_height, color, name
-                )
-
-            # Get current location
-            current_x, current_y = self.column_start + self.zoom_level // 2, self.row_start + self.zoom_level // 2
-
-            # Find and draw lines to nearest locations
-            nearest_tavern = self.find_nearest_tavern(current_x, current_y)
-            nearest_bank = self.find_nearest_bank(current_x, current_y)
-            nearest_transit = self.find_nearest_transit(current_x, current_y)
-
-            # Draw nearest tavern line
-            if nearest_tavern:
-                nearest_tavern_coords = nearest_tavern[0][1]
-                painter.setPen(PySide6.QtGui.QPen(PySide6.QtGui.QColor('orange'), 3))
-                painter.drawLine(
-                    (current_x - self.column_start) * block_size + block_size // 2,
-                    (current_y - self.row_start) * block_size + block_size // 2,
-                    (nearest_tavern_coords[0] - self.column_start) * block_size + block_size // 2,
-                    (nearest_tavern_coords[1] - self.row_start) * block_size + block_size // 2
-                )
-
-            # Draw nearest bank line
-            if nearest_bank:
-                nearest_bank_coords = nearest_bank  # Already a (col, row) tuple
-                painter.setPen(PySide6.QtGui.QPen(PySide6.QtGui.QColor('blue'), 3))
-                painter.drawLine(
-                    (current_x - self.column_start) * block_size + block_size // 2,
-                    (current_y - self.row_start) * block_size + block_size // 2,
-                    (nearest_bank_coords[0] + 1 - self.column_start) * block_size + block_size // 2,
-                    (nearest_bank_coords[1] + 1 - self.row_start) * block_size + block_size // 2
-                )
-
-            # Draw nearest transit line
-            if nearest_transit:
-                nearest_transit_coords = nearest_transit[0][1]
-                painter.setPen(PySide6.QtGui.QPen(PySide6.QtGui.QColor('red'), 3))
-                painter.drawLine(
-                    (current_x - self.column_start) * block_size + block_size // 2,
-                    (current_y - self.row_start) * block_size + block_size // 2,
-                    (nearest_transit_coords[0] - self.column_start) * block_size + block_size // 2,
-                    (nearest_transit_coords[1] - self.row_start) * block_size + block_size // 2
-                )
-
-            # Draw selected compass route (green for direct)
-            if (
-                    self.destination is not None and
-                    self.selected_route_label == "Direct Route" and
-                    self.selected_route_path and
-                    len(self.selected_route_path) >= 2
-            ):
-                logging.debug(
-                    f"Drawing direct route from {self.selected_route_path[0]} to {self.selected_route_path[-1]}")
-                painter.setPen(PySide6.QtGui.QPen(PySide6.QtGui.QColor("green"), 3))
-                x1, y1 = self.selected_route_path[0]
-                x2, y2 = self.selected_route_path[-1]
-                painter.drawLine(
-                    (current_x - self.column_start) * block_size + block_size // 2,
-                    (current_y - self.row_start) * block_size + block_size // 2,
-                    (self.destination[0] - self.column_start) * block_size + block_size // 2,
-                    (self.destination[1] - self.row_start) * block_size + block_size // 2
-                )
-
-            # Draw selected compass route (purple for transit)
-            if (
-                    self.destination is not None and
-                    self.selected_route_label == "Transit Route" and
-                    self.selected_route_path and
-                    len(self.selected_route_path) >= 2
-            ):
-                logging.debug(f"Transit route path: {self.selected_route_path}")
-                painter.setPen(PySide6.QtGui.QPen(PySide6.QtGui.QColor(170, 0, 170), 3))
-
-                # Current player position
-                current_x, current_y = self.column_start + self.zoom_level // 2, self.row_start + self.zoom_level // 2
-                dest_x, dest_y = self.destination
-                logging.debug(f"Player position: ({current_x}, {current_y})")
-                logging.debug(f"Destination: ({dest_x}, {dest_y})")
-
-                # Find nearest transits
-                nearest_transit_to_player = self.find_nearest_transit(current_x, current_y)
-                nearest_transit_to_dest = self.find_nearest_transit(dest_x, dest_y)
-                logging.debug(f"Nearest transit to player: {nearest_transit_to_player}")
-                logging.debug(f"Nearest transit to destination: {nearest_transit_to_dest}")
-
-                # Check if same transit station
-                same_transit = False
-                if nearest_transit_to_player and nearest_transit_to_dest:
-                    same_transit = nearest_transit_to_player[0][1] == nearest_transit_to_dest[0][1]
-
-                if same_transit:
-                    logging.debug("Player and destination share same transit. Drawing direct purple route.")
-                    px1 = (current_x - self.column_start) * block_size + block_size // 2
-                    py1 = (current_y - self.row_start) * block_size + block_size // 2
-                    px2 = (dest_x - self.column_start) * block_size + block_size // 2
-                    py2 = (dest_y - self.row_start) * block_size + block_size // 2
-                    painter.drawLine(px1, py1, px2, py2)
-
-                else:
-                    # Segment 1: Player to nearest transit
-                    if nearest_transit_to_player:
-                        transit_x, transit_y = nearest_transit_to_player[0][1]
-                        px1 = (current_x - self.column_start) * block_size + block_size // 2
-                        py1 = (current_y - self.row_start) * block_size + block_size // 2
-                        px2 = (transit_x - self.column_start) * block_size + block_size // 2
-                        py2 = (transit_y - self.row_start) * block_size + block_size // 2
-                        logging.debug(f"Segment 1 coords: ({px1}, {py1}) to ({px2}, {py2})")
-                        if not (px1 < 0 and px2 < 0) and not (px1 > self.minimap_size and px2 > self.minimap_size) and \
-                                not (py1 < 0 and py2 < 0) and not (py1 > self.minimap_size and py2 > self.minimap_size):
-                            painter.drawLine(px1, py1, px2, py2)
-                        else:
-                            logging.debug("Segment 1 skipped: both endpoints off-screen")
-
-                    # Segment 2: Transit near destination to destination
-                    if nearest_transit_to_dest and self.destination:
-                        transit_x, transit_y = nearest_transit_to_dest[0][1]
-                        px1 = (transit_x - self.column_start) * block_size + block_size // 2
-                        py1 = (transit_y - self.row_start) * block_size + block_size // 2
-                        px2 = (dest_x - self.column_start) * block_size + block_size // 2
-                        py2 = (dest_y - self.row_start) * block_size + block_size // 2
-                        logging.debug(f"Segment 2 coords: ({px1}, {py1}) to ({px2}, {py2})")
-                        if not (px1 < 0 and px2 < 0) and not (px1 > self.minimap_size and px2 > self.minimap_size) and \
-                                not (py1 < 0 and py2 < 0) and not (py1 > self.minimap_size and py2 > self.minimap_size):
-                            painter.drawLine(px1, py1, px2, py2)
-                        else:
-                            logging.debug("Segment 2 skipped: both endpoints off-screen")
+    def _show_minimap_frame(self, image: PySide6.QtGui.QImage, state: MinimapState) -> None:
+        """
+        Show a frame drawn by the MinimapRenderWorker, unless the minimap has moved or zoomed since
+        it was requested. Moving always requests a new frame, which replaces the current one.
+        """
+        if state.view != (self.zoom_level, self.column_start, self.row_start):
+            logging.debug(f"Skipped minimap frame at ({state.column_start}, {state.row_start}); the view has moved")
+            return
+        self.minimap_label.setPixmap(PySide6.QtGui.QPixmap.fromImage(image))
 
-        painter.end()
-        self.minimap_label.setPixmap(pixmap)
+    def update_minimap(self, reason: str = "update"):
+        """
+        Mark the minimap dirty. The FrameScheduler draws it once control returns to the event loop,
+        so several updates in a row, as on a page load, cost a single frame.
 
-    def update_minimap(self):
+        Args:
+            reason (str): Why the minimap needs redrawing, logged with the frame.
         """
-        Update the minimap.
+        if self.is_updating_minimap:
+            return  # Changes made while a frame is drawn are part of that frame
+        self.minimap_frames.request(reason)
 
-        Calls draw_minimap and then updates the info frame with any relevant information.
+    def _draw_minimap_frame(self, reasons: list[str]) -> None:
         """
-        if not self.is_updating_minimap:
-            self.is_updating_minimap = True
+        Draw one minimap frame for the FrameScheduler, then update the info frame with any relevant
+        information.
 
+        Args:
+            reasons (list[str]): Reasons the frame was requested for.
+        """
+        self.is_updating_minimap = True
+        try:
             # 🔁 Ensure we always have an updated route label/path/description
             if self.destination and (not self.selected_route_label or not self.selected_route_path):
                 self.refresh_compass_state()
@@ -2512,70 +1950,9 @@ class RBCCommunityMap(QMainWindow):
             if hasattr(self, 'compass_overlay') and self.compass_overlay.isVisible():
                 if not self.selected_route_path:  # ⬅ only re-show if no manual route is selected
                     self.show_compass_overlay()
-
+        finally:
             self.is_updating_minimap = False
 
-    def find_nearest_location(self, x, y, locations):
-        """
-        Find the nearest location to the given coordinates.
-
-        Args:
-            x (int): X coordinate.
-            y (int): Y coordinate.
-            locations (list): List of location coordinates.
-
-        Returns:
-            list: List of distances and corresponding coordinates.
-        """
-        distances = [(max(abs(lx - x), abs(ly - y)), (lx, ly)) for lx, ly in locations]
-        distances.sort()
-        return distances
-
-    def find_nearest_tavern(self, x, y):
-        """
-        Find the nearest tavern to the given coordinates.
-
-        Args:
-            x (int): X coordinate.
-            y (int): Y coordinate.
-
-        Returns:
-            list: List of distances and corresponding coordinates.
-        """
-        return self.find_nearest_location(x, y, list(self.taverns_coordinates.values()))
-
-    def find_nearest_bank(self, current_x, current_y):
-        min_distance = float("inf")
-        nearest_bank = None
-
-        for bank_key, (col_name, row_name) in self.banks_coordinates.items():
-            if isinstance(bank_key, str):  # Convert from street name format if necessary
-                col_name, row_name = bank_key.split(" & ")
-
-            col = self.columns.get(col_name, 0)
-            row = self.rows.get(row_name, 0)
-
-            if col and row:
-                distance = abs(col - current_x) + abs(row - current_y)
-                if distance < min_distance:
-                    min_distance = distance
-                    nearest_bank = (col, row)  # Return actual coordinates
-
-        return nearest_bank  # Returns (x, y) tuple
-
-    def find_nearest_transit(self, x, y):
-        """
-        Find the nearest transit station to the given coordinates.
-
-        Args:
-            x (int): X coordinate.
-            y (int): Y coordinate.
-
-        Returns:
-            list: List of distances and corresponding coordinates.
-        """
-        return self.find_nearest_location(x, y, list(self.transits_coordinates.values()))
-
     def set_destination(self):
         """Open the set destination dialog to select a new destination."""
         dialog = SetDestinationDialog(self)
@@ -2583,11 +1960,11 @@ class RBCCommunityMap(QMainWindow):
             # Reload the destination from the DB to ensure it's per-character and persisted
             if self.selected_character:
                 self.load_last_destination_for_character(self.selected_character['id'])
-            self.update_minimap()
+            self.update_minimap("destination")
 
     def get_current_destination(self, character_id: int):
         """Retrieve the latest destination for the selected character."""
-        with sqlite3.connect(DB_PATH) as conn:
+        with db_reader() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT col, row FROM destinations WHERE character_id = ? ORDER BY timestamp DESC LIMIT 1",
                            (character_id,))
@@ -2628,7 +2005,7 @@ class RBCCommunityMap(QMainWindow):
             self.zoom_level -= 2
             self.zoom_level_changed = True
             self.save_zoom_level_to_database()
-            self.website_frame.page().toHtml(self.process_html)
+            self.extract_page_data()
 
     def zoom_out(self):
         """
@@ -2638,38 +2015,20 @@ class RBCCommunityMap(QMainWindow):
             self.zoom_level += 2
             self.zoom_level_changed = True
             self.save_zoom_level_to_database()
-            self.website_frame.page().toHtml(self.process_html)
+            self.extract_page_data()
 
     def save_zoom_level_to_database(self):
-        """Save the current zoom level to the settings table in the database."""
-        try:
-            with sqlite3.connect(DB_PATH) as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    INSERT INTO settings (setting_name, setting_value)
-                    VALUES ('minimap_zoom', ?)
-                    ON CONFLICT(setting_name) DO UPDATE SET setting_value = ?;
-                """, (self.zoom_level, self.zoom_level))
-                conn.commit()
-                logging.debug(f"Zoom level saved to database: {self.zoom_level}")
-        except sqlite3.Error as e:
-            logging.error(f"Failed to save zoom level to database: {e}")
+        """Store the current zoom level in the settings store, which writes it to the database in the background."""
+        app_settings().minimap_zoom = self.zoom_level
+        logging.debug(f"Zoom level saved to settings: {self.zoom_level}")
 
     def load_zoom_level_from_database(self):
         """
         Load the saved zoom level from the settings table in the database.
         If no value is found, set it to the default (3).
         """
-        try:
-            with sqlite3.connect(DB_PATH) as conn:
-                cursor = conn.cursor()
-                result = cursor.execute(
-                    "SELECT setting_value FROM settings WHERE setting_name = 'minimap_zoom'").fetchone()
-                self.zoom_level = int(result[0]) if result else 3
-                logging.debug(f"Zoom level loaded from database: {self.zoom_level}")
-        except sqlite3.Error as e:
-            self.zoom_level = 3  # Fallback default zoom level
-            logging.error(f"Failed to load zoom level from database: {e}")
+        self.zoom_level = app_settings().minimap_zoom
+        logging.debug(f"Zoom level loaded from settings: {self.zoom_level}")
 
     def recenter_minimap(self):
         """
@@ -2682,15 +2041,8 @@ class RBCCommunityMap(QMainWindow):
 
         logging.debug(f"Before recentering: character_x={self.character_x}, character_y={self.character_y}")
 
-        # Calculate zoom offset (-1 for 5x5, -2 for 7x7, etc.)
-        if self.zoom_level == 3:
-            zoom_offset = -1
-        elif self.zoom_level == 5:
-            zoom_offset = 0
-        elif self.zoom_level == 7:
-            zoom_offset = 1
-        else:
-            zoom_offset = -(self.zoom_level // 2)  # Safe fallback
+        # Calculate zoom offset (-1 for 3x3, 0 for 5x5, 1 for 7x7, etc.)
+        zoom_offset = self.zoom_level // 2 - 2
         logging.debug(f"Zoom Level: {self.zoom_level}")
         logging.debug(f"Zoom Offset: {zoom_offset}")
         logging.debug(f"Debug: char_y={self.character_y}, row_start={self.row_start}, zoom_offset={zoom_offset}")
@@ -2701,7 +2053,7 @@ class RBCCommunityMap(QMainWindow):
 
         logging.debug(
             f"Recentered minimap: x={self.character_x}, y={self.character_y}, col_start={self.column_start}, row_start={self.row_start}")
-        self.update_minimap()
+        self.update_minimap("recenter")
 
     def go_to_location(self):
         """
@@ -2724,7 +2076,7 @@ class RBCCommunityMap(QMainWindow):
             logging.error(f"Row '{row_name}' not found in self.rows")
 
         # Update the minimap after setting the new location
-        self.update_minimap()
+        self.update_minimap("go to location")
 
     def mousePressEvent(self, event: PySide6.QtGui.QMouseEvent):
         """Handle mouse clicks on the minimap to recenter it."""
@@ -2747,7 +2099,7 @@ class RBCCommunityMap(QMainWindow):
                 logging.debug(f"New minimap start: column={self.column_start}, row={self.row_start}")
 
                 # Update the minimap display
-                self.update_minimap()
+                self.update_minimap("minimap click")
             else:
                 logging.debug(f"Click ({click_x}, {click_y}) is outside the minimap bounds.")
 
@@ -2773,7 +2125,7 @@ class RBCCommunityMap(QMainWindow):
             self.load_destination()
 
             # Update the minimap with the new destination
-            self.update_minimap()
+            self.update_minimap("destination")
 
     def save_to_recent_destinations(self, character_id: int, col: int, row: int):
         """
@@ -2788,28 +2140,24 @@ class RBCCommunityMap(QMainWindow):
         if character_id is None:
             return
 
-        try:
-            with sqlite3.connect(DB_PATH) as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    INSERT INTO recent_destinations (character_id, col, row, timestamp)
-                    VALUES (?, ?, ?, datetime('now'))
-                """, (character_id, col, row))
-
-                cursor.execute("""
-                    DELETE FROM recent_destinations 
-                    WHERE character_id = ? AND id NOT IN (
-                        SELECT id FROM recent_destinations
-                        WHERE character_id = ?
-                        ORDER BY timestamp DESC LIMIT 10
-                    )
-                """, (character_id, character_id))
-
-                conn.commit()
-                logging.info(f"Destination ({col}, {row}) saved for character ID {character_id}.")
+        def save_destination(conn: sqlite3.Connection) -> None:
+            cursor = conn.cursor()
+            cursor.execute("""
+                INSERT INTO recent_destinations (character_id, col, row, timestamp)
+                VALUES (?, ?, ?, datetime('now'))
+            """, (character_id, col, row))
+
+            cursor.execute("""
+                DELETE FROM recent_destinations 
+                WHERE character_id = ? AND id NOT IN (
+                    SELECT id FROM recent_destinations
+                    WHERE character_id = ?
+                    ORDER BY timestamp DESC LIMIT 10
+                )
+            """, (character_id, character_id))
+            logging.info(f"Destination ({col}, {row}) saved for character ID {character_id}.")
 
-        except sqlite3.Error as e:
-            logging.error(f"Failed to save recent destination: {e}")
+        write_behind_queue().submit(save_destination)
 
     def eventFilter(self, source, event):
         # Only clear on actual user interaction, not initial app load
@@ -2828,139 +2176,22 @@ class RBCCommunityMap(QMainWindow):
     # Infobar Management
     # -----------------------
 
-    def calculate_ap_cost(self, start, end):
-        """
-        Calculate the AP cost of moving from start to end using the Chebyshev distance.
-
-        Args:
-            start (tuple): Starting coordinates (x, y).
-            end (tuple): Ending coordinates (x, y).
-
-        Returns:
-            int: AP cost of moving from start to end.
-        """
-        return max(abs(start[0] - end[0]), abs(start[1] - end[1]))
-
     def update_info_frame(self):
         """
         Update the information frame with the closest locations and AP costs.
         """
-        current_x, current_y = self.column_start + self.zoom_level // 2, self.row_start + self.zoom_level // 2
-
-        # Closest Bank
-        nearest_bank = self.find_nearest_bank(current_x, current_y)
-        if nearest_bank:
-            bank_coords = nearest_bank  # No need for `[0][1]`
-            adjusted_bank_coords = (bank_coords[0] + 1, bank_coords[1] + 1)
-            bank_ap_cost = self.calculate_ap_cost((current_x, current_y), adjusted_bank_coords)
-            bank_intersection = self.get_intersection_name(adjusted_bank_coords)
-            self.bank_label.setText(f"Bank\n{bank_intersection} - AP: {bank_ap_cost}")
-
-        # Closest Transit
-        nearest_transit = self.find_nearest_transit(current_x, current_y)
-        if nearest_transit:
-            transit_coords = nearest_transit[0][1]
-            transit_name = next(name for name, coords in self.transits_coordinates.items() if coords == transit_coords)
-            transit_ap_cost = self.calculate_ap_cost((current_x, current_y), transit_coords)
-            transit_intersection = self.get_intersection_name(transit_coords)
-            self.transit_label.setText(f"Transit - {transit_name}\n{transit_intersection} - AP: {transit_ap_cost}")
-
-        # Closest Tavern
-        nearest_tavern = self.find_nearest_tavern(current_x, current_y)
-        if nearest_tavern:
-            tavern_coords = nearest_tavern[0][1]
-            tavern_name = next(name for name, coords in self.taverns_coordinates.items() if coords == tavern_coords)
-            tavern_ap_cost = self.calculate_ap_cost((current_x, current_y), tavern_coords)
-            tavern_intersection = self.get_intersection_name(tavern_coords)
-            self.tavern_label.setText(f"{tavern_name}\n{tavern_intersection} - AP: {tavern_ap_cost}")
-
-        # Set Destination Info
-        if self.destination:
-            destination_coords = self.destination
-            destination_ap_cost = self.calculate_ap_cost((current_x, current_y), destination_coords)
-            destination_intersection = self.get_intersection_name(destination_coords)
-
-            # Check for a named place at destination
-            place_name = next(
-                (name for name, coords in {
-                    **self.guilds_coordinates,
-                    **self.shops_coordinates,
-                    **self.user_buildings_coordinates,
-                    **self.places_of_interest_coordinates
-                }.items() if coords == destination_coords),
-                None
-            )
-
-            destination_label_text = place_name if place_name else "Set Destination"
-            self.destination_label.setText(
-                f"{destination_label_text}\n{destination_intersection} - AP: {destination_ap_cost}"
-            )
-
-            # Transit-Based AP Cost for Set Destination
-            nearest_transit_to_character = self.find_nearest_transit(current_x, current_y)
-            nearest_transit_to_destination = self.find_nearest_transit(destination_coords[0], destination_coords[1])
-
-            if nearest_transit_to_character and nearest_transit_to_destination:
-                char_transit_coords = nearest_transit_to_character[0][1]
-                dest_transit_coords = nearest_transit_to_destination[0][1]
-                char_to_transit_ap = self.calculate_ap_cost((current_x, current_y), char_transit_coords)
-                dest_to_transit_ap = self.calculate_ap_cost(destination_coords, dest_transit_coords)
-                total_ap_via_transit = char_to_transit_ap + dest_to_transit_ap
-
-                # Get transit names
-                char_transit_name = next(
-                    name for name, coords in self.transits_coordinates.items() if coords == char_transit_coords)
-                dest_transit_name = next(
-                    name for name, coords in self.transits_coordinates.items() if coords == dest_transit_coords)
-
-                # Update the transit destination label to include destination name
-                destination_name = place_name if place_name else "Set Destination"
-                self.transit_destination_label.setText(
-                    f"{destination_name} - {char_transit_name} to {dest_transit_name}\n"
-                    f"{self.get_intersection_name(dest_transit_coords)} - Total AP: {total_ap_via_transit}"
-                )
-
-            else:
-                self.transit_destination_label.setText("Transit Route Info Unavailable")
-
-        else:
-            # Clear labels when no destination is set
-            self.destination_label.setText("No Destination Set")
-            self.transit_destination_label.setText("No Destination Set")
+        labels = {
+            "bank": self.bank_label,
+            "transit": self.transit_label,
+            "tavern": self.tavern_label,
+            "destination": self.destination_label,
+            "transit_destination": self.transit_destination_label,
+        }
+        for name, text in self.info_frame_text().items():
+            labels[name].setText(text)
 
         self.update_ap_direction_label()
 
-    def get_intersection_name(self, coords):
-        """
-        Get the intersection name for the given coordinates, including edge cases.
-
-        Args:
-            coords (tuple): Coordinates (x, y).
-
-        Returns:
-            str: Readable intersection like "Nickel & 55th" or fallback "x, y".
-        """
-        x, y = coords
-
-        # Try direct match
-        column_name = next((name for name, coord in self.columns.items() if coord == x), None)
-        row_name = next((name for name, coord in self.rows.items() if coord == y), None)
-
-        # Fallback to offset-based match
-        if not column_name:
-            column_name = next((name for name, coord in self.columns.items() if coord == x - 1), None)
-        if not row_name:
-            row_name = next((name for name, coord in self.rows.items() if coord == y - 1), None)
-
-        if column_name and row_name:
-            return f"{column_name} & {row_name}"
-        elif column_name:
-            return f"{column_name} & Unknown Row"
-        elif row_name:
-            return f"Unknown Column & {row_name}"
-        else:
-            return f"{x}, {y}"  # raw coords as fallback
-
     def update_ap_direction_label(self):
         """
         Update the compass label at the top of the screen.
@@ -2971,16 +2202,10 @@ class RBCCommunityMap(QMainWindow):
             self.selected_route_path = None
             return
 
-        direct_route, transit_route = self.get_compass_routes()
+        direct_route, transit_route, alternative_routes = self.get_compass_routes()
 
         # Select route: previously chosen, or fallback to shortest
-        if self.selected_route_label == "Direct Route":
-            selected = direct_route
-        elif self.selected_route_label == "Transit Route":
-            selected = transit_route
-        else:
-            selected = direct_route if direct_route[0] <= transit_route[0] else transit_route
-            self.selected_route_label = "Direct Route" if selected == direct_route else "Transit Route"
+        selected = self.select_compass_route(direct_route, transit_route, alternative_routes)
 
         self.selected_route_description = selected[1]
         self.selected_route_path = selected[2]
@@ -3068,11 +2293,8 @@ class RBCCommunityMap(QMainWindow):
         Open the database viewer to browse and inspect data from the RBC City Map database.
         """
         try:
-            # Create a new SQLite database connection every time the viewer is opened
-            database_connection = sqlite3.connect(DB_PATH)
-
-            # Show the database viewer, passing the new connection
-            self.database_viewer = DatabaseViewer(database_connection)
+            # Show the database viewer on the shared read connection
+            self.database_viewer = DatabaseViewer(db_reader())
             self.database_viewer.show()
         except Exception as e:
             logging.error(f"Error opening Database Viewer: {e}")
@@ -3104,83 +2326,14 @@ class RBCCommunityMap(QMainWindow):
             QMessageBox.information(self, "No Destination", "Please set a destination first.")
             return
 
-        direct_route, transit_route = self.get_compass_routes()
+        direct_route, transit_route, alternative_routes = self.get_compass_routes()
 
         if hasattr(self, 'compass_overlay') and self.compass_overlay.isVisible():
-            self.compass_overlay.refresh(direct_route, transit_route)
+            self.compass_overlay.refresh(direct_route, transit_route, alternative_routes)
         else:
-            self.compass_overlay = CompassOverlay(direct_route, transit_route, self)
+            self.compass_overlay = CompassOverlay(direct_route, transit_route, self, alternative_routes)
             self.compass_overlay.show()
 
-    def get_compass_routes(self):
-        def get_arrow_description(start, end):
-            dx = end[0] - start[0]
-            dy = end[1] - start[1]
-
-            steps_diagonal = min(abs(dx), abs(dy))
-            steps_straight = abs(abs(dx) - abs(dy))
-
-            diagonal_arrow = ''
-            if dx < 0 and dy < 0:
-                diagonal_arrow = '↖'
-            elif dx > 0 and dy < 0:
-                diagonal_arrow = '↗'
-            elif dx < 0 and dy > 0:
-                diagonal_arrow = '↙'
-            elif dx > 0 and dy > 0:
-                diagonal_arrow = '↘'
-
-            straight_arrow = ''
-            if abs(dx) > abs(dy):
-                straight_arrow = '→' if dx > 0 else '←'
-            elif abs(dy) > abs(dx):
-                straight_arrow = '↓' if dy > 0 else '↑'
-
-            parts = []
-            if steps_diagonal:
-                parts.append(f"{steps_diagonal}{diagonal_arrow}")
-            if steps_straight:
-                parts.append(f"{steps_straight}{straight_arrow}")
-            return " + ".join(parts) if parts else "0⦿"
-
-        current_x = self.column_start + self.zoom_level // 2
-        current_y = self.row_start + self.zoom_level // 2
-
-        dest_x, dest_y = self.destination
-
-        # ----------------------------
-        # Direct Route
-        # ----------------------------
-        direct_ap = max(abs(dest_x - current_x), abs(dest_y - current_y))
-        direct_desc = get_arrow_description((current_x, current_y), (dest_x, dest_y))
-        direct_path = [(current_x, current_y), (dest_x, dest_y)]
-        direct_route = (direct_ap, direct_desc, direct_path)
-
-        # ----------------------------
-        # Transit Route
-        # ----------------------------
-        nearest_transit_to_character = self.find_nearest_transit(current_x, current_y)
-        nearest_transit_to_destination = self.find_nearest_transit(dest_x, dest_y)
-
-        if nearest_transit_to_character and nearest_transit_to_destination:
-            char_transit_coords = nearest_transit_to_character[0][1]
-            dest_transit_coords = nearest_transit_to_destination[0][1]
-
-            char_to_transit_ap = self.calculate_ap_cost((current_x, current_y), char_transit_coords)
-            dest_to_transit_ap = self.calculate_ap_cost((dest_x, dest_y), dest_transit_coords)
-            total_ap_transit = char_to_transit_ap + dest_to_transit_ap
-
-            dir1 = get_arrow_description((current_x, current_y), char_transit_coords)
-            dir2 = get_arrow_description(dest_transit_coords, (dest_x, dest_y))
-
-            transit_desc = f"{dir1} + Transit + {dir2}"
-            transit_path = [(current_x, current_y), char_transit_coords, dest_transit_coords, (dest_x, dest_y)]
-            transit_route = (total_ap_transit, transit_desc, transit_path)
-        else:
-            transit_route = (9999, "Transit route unavailable", [])
-
-        return direct_route, transit_route
-
     def set_compass_display_from_overlay(self, label, route_info):
         """
         Called when user clicks a route in CompassOverlay.
@@ -3196,4 +2349,4 @@ class RBCCommunityMap(QMainWindow):
         if hasattr(self, 'compass_overlay'):
             self.compass_overlay.close()
 
-        self.update_minimap()
\ No newline at end of file
+        self.update_minimap("compass route selected")
\ No newline at end of file
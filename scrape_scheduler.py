@@ -0,0 +1,75 @@
+from core_imports import *
+from constants import *
+from database import *
+from scrape_worker import *
+
+# -----------------------
+# Scheduled Scraping
+# -----------------------
+
+class ScrapeScheduler(QObject):
+    """
+    Re-scrapes guild and shop locations when they are due to move.
+
+    AVITD reports when guilds and shops next move, and the scraper stores that as next_update. The
+    scheduler sleeps until the earliest of those times plus a random jitter, then refreshes through
+    the ScrapeWorker, whose `finished` signal tells the map what moved. Every scrape the worker
+    finishes, scheduled or not, restarts the wait.
+
+    Scrapes are at least SCRAPE_MIN_INTERVAL apart, so a next_update that is unknown or already
+    past does not make the scheduler hammer the sources, and at most SCRAPE_MAX_INTERVAL apart, so
+    locations reported to Terrible or Discord between moves still show up.
+    """
+
+    def __init__(self, worker: ScrapeWorker, parent: QObject | None = None) -> None:
+        """
+        Args:
+            worker (ScrapeWorker): Worker running the scrapes.
+            parent (QObject | None): Qt parent.
+        """
+        super().__init__(parent)
+        self.worker = worker
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.worker.refresh)
+        self.worker.finished.connect(self._on_scrape_done)
+        self._stopped = True
+        self._last_scrape = time.monotonic()
+
+    def start(self) -> None:
+        """
+        Schedule the first scrape.
+
+        Counts as a scrape for SCRAPE_MIN_INTERVAL, since the app already scrapes once on startup.
+        """
+        self._stopped = False
+        self._last_scrape = time.monotonic()
+        self.schedule()
+
+    def stop(self) -> None:
+        """Cancel the pending scrape. A scrape already running finishes but schedules no other."""
+        self._stopped = True
+        self.timer.stop()
+
+    def next_delay(self) -> float:
+        """Seconds to wait before the next scrape, jitter included."""
+        due = next_scheduled_update()
+        if due is None:
+            delay = SCRAPE_MAX_INTERVAL
+        else:
+            delay = (due - datetime.now(timezone.utc)).total_seconds()
+        since_last = time.monotonic() - self._last_scrape
+        delay = min(max(delay, SCRAPE_MIN_INTERVAL - since_last, 0), SCRAPE_MAX_INTERVAL)
+        return delay + random.uniform(*SCRAPE_JITTER)
+
+    def schedule(self) -> None:
+        """(Re)start the timer for the next scrape."""
+        delay = self.next_delay()
+        self.timer.start(int(delay * 1000))
+        due = datetime.now() + timedelta(seconds=delay)
+        logging.info(f"Next guild and shop scrape at {due.strftime('%H:%M:%S')} (in {delay / 60:.1f} min)")
+
+    def _on_scrape_done(self, changes: dict) -> None:
+        self._last_scrape = time.monotonic()
+        if not self._stopped:
+            self.schedule()
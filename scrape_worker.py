@@ -0,0 +1,93 @@
+from core_imports import *
+from constants import *
+from scraper import *
+
+# -----------------------
+# Background Scraping
+# -----------------------
+
+class ScrapeWorker(QObject):
+    """
+    Runs Scraper.scrape() on the global QThreadPool and reports back through signals.
+
+    Only one scrape runs at a time. refresh() while a scrape is running joins it instead of starting
+    another, so startup, scheduled and manual refreshes never overlap and all of them are answered
+    by the same `finished`. Signals are delivered on the thread that owns the worker, normally the
+    GUI thread, so slots may touch widgets.
+    """
+
+    started = pyqtSignal()
+    progress = pyqtSignal(str, int, int)  # source that finished, sources done, sources total
+    finished = pyqtSignal(object)  # Scraper.scrape() result; empty if nothing changed or cancelled
+    _done = pyqtSignal(object)  # Pool thread -> owner thread
+
+    def __init__(self, scraper: Scraper, parent: QObject | None = None) -> None:
+        """
+        Args:
+            scraper (Scraper): Scraper to run.
+            parent (QObject | None): Qt parent.
+        """
+        super().__init__(parent)
+        self.scraper = scraper
+        self.scraper.progress.connect(self.progress)
+        self._done.connect(self._on_done)
+        self._running = False
+        self._cancelled = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def refresh(self) -> bool:
+        """
+        Start a scrape in the background, or join the one already running.
+
+        Returns:
+            bool: True if a new scrape was started, False if the running one was joined.
+        """
+        if self._running:
+            logging.info("Scrape already running; joining it.")
+            return False
+        self._running = True
+        self._cancelled.clear()
+        self.started.emit()
+        QThreadPool.globalInstance().start(_ScrapeRunnable(self))
+        return True
+
+    def cancel(self) -> None:
+        """
+        Ask the running scrape to stop.
+
+        The scrape stops waiting for its sources within SCRAPER_CANCEL_POLL seconds, writes nothing to
+        the database and `finished` reports no changes. Requests already sent are left to finish or
+        time out in the background.
+        """
+        if self._running:
+            logging.info("Cancelling the running scrape.")
+            self._cancelled.set()
+
+    def _run(self) -> None:
+        """Scrape on a pool thread and hand the result to the owner thread."""
+        changes = {}
+        try:
+            changes = self.scraper.scrape(self._cancelled)
+        except Exception as e:
+            logging.error(f"Scrape failed: {e}")
+        finally:
+            release_db_readers()  # Pool threads are reused and retired without Python noticing
+            self._done.emit(changes)
+
+    def _on_done(self, changes: dict) -> None:
+        self._running = False
+        self.finished.emit(changes)
+
+
+class _ScrapeRunnable(QRunnable):
+    """Runs one ScrapeWorker scrape on a QThreadPool thread."""
+
+    def __init__(self, worker: ScrapeWorker) -> None:
+        super().__init__()
+        self.worker = worker
+
+    def run(self) -> None:
+        self.worker._run()
@@ -1,21 +1,218 @@
-from imports import *
+from core_imports import *
 from constants import *
-
-class Scraper:
-    def __init__(self):
+from db_connection import *
+from http_cache import *
+
+# -----------------------
+# Location Change Sets
+# -----------------------
+
+@dataclass
+class LocationChanges:
+    """Guilds or shops that appeared, moved or disappeared in one scrape, by street names."""
+
+    table: str
+    added: dict = field(default_factory=dict)  # Name -> (column, row)
+    moved: dict = field(default_factory=dict)  # Name -> ((old column, old row), (new column, new row))
+    removed: dict = field(default_factory=dict)  # Name -> (column, row) it was last seen at
+
+    @classmethod
+    def between(cls, table: str, current: dict, located: dict) -> "LocationChanges":
+        """
+        Diff the locations stored in a table against freshly scraped ones.
+
+        Args:
+            table (str): "guilds" or "shops".
+            current (dict): Name -> (column, row) as stored; unknown locations are ('NA', 'NA').
+            located (dict): Name -> (column, row) of every entry the scrape located.
+        """
+        changes = cls(table)
+        for name, location in located.items():
+            old = current.get(name)
+            if old is None or old == ("NA", "NA"):
+                changes.added[name] = location
+            elif old != location:
+                changes.moved[name] = (old, location)
+        for name, old in current.items():
+            if name not in located and old != ("NA", "NA"):
+                changes.removed[name] = old
+        return changes
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.moved or self.removed)
+
+    def writes(self) -> list:
+        """Return the (name, (column, row)) rows to write, with removed entries set to 'NA'."""
+        rows = list(self.added.items())
+        rows += [(name, new) for name, (_, new) in self.moved.items()]
+        rows += [(name, ("NA", "NA")) for name in self.removed]
+        return rows
+
+    def locations(self) -> set:
+        """Return every (column, row) an entry appeared at, moved from or to, or disappeared from."""
+        touched = set(self.added.values()) | set(self.removed.values())
+        for old, new in self.moved.values():
+            touched.update((old, new))
+        return touched
+
+    def summary(self) -> str:
+        """Count the changes, e.g. "Guilds: 2 moved, 1 added, 0 removed"."""
+        return f"{self.table.capitalize()}: {len(self.moved)} moved, {len(self.added)} added, {len(self.removed)} removed"
+
+    def details(self) -> list:
+        """Describe each change in a line, e.g. "Allurists Guild 1 moved to Aardvark & 1st"."""
+        lines = [f"{name} moved to {col} & {row}" for name, (_, (col, row)) in sorted(self.moved.items())]
+        lines += [f"{name} appeared at {col} & {row}" for name, (col, row) in sorted(self.added.items())]
+        lines += [f"{name} is no longer listed" for name in sorted(self.removed)]
+        return lines
+
+
+# -----------------------
+# Scraper
+# -----------------------
+
+class Scraper(QObject):
+    """
+    Collects guild and shop locations from AVITD, the Terrible API and the Discord bot.
+
+    All sources are fetched at the same time through one pooled HTTP session, so a refresh takes
+    as long as the slowest source instead of the sum of all three. Each source has its own
+    timeout, and connection errors and 429/5xx responses are retried with exponential backoff.
+
+    Responses go through an on-disk HttpCache, so unchanged sources answer 304 or return a body
+    with the same hash. Their previous parse is reused, and when no source changed the database
+    is left alone.
+    """
+
+    progress = pyqtSignal(str, int, int)  # source that finished, sources done, sources total
+
+    # Fixed locations, not reported by any source
+    PEACEKEEPERS_MISSIONS = {
+        "Peacekeepers Mission 1": ("Emerald", "67th"),
+        "Peacekeepers Mission 2": ("Unicorn", "33rd"),
+        "Peacekeepers Mission 3": ("Emerald", "33rd"),
+    }
+
+    def __init__(self, parent: QObject | None = None):
+        super().__init__(parent)
         self.avitd_url = "https://aviewinthedark.net/"
         self.terrible_url = "https://vampires.terrible.engineering/api/locations"
         self.discord_bot_url = "https://lollis-home.ddns.net/api/locations.json"
-        self.connection = sqlite3.connect(DB_PATH)
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
         }
+        self.session = self.create_session()
+        self.http_cache = HttpCache()
+        self.parsed = {}  # Source -> result of its last parse, reused while the source is unchanged
+        self.changed = {}  # Source -> whether it changed in the current scrape
+        self._abandoned = []  # Futures of a cancelled scrape that were still fetching
         logging.info("Scraper initialized.")
 
-    def scrape(self):
-        avitd_data, guilds_next, shops_next = self.scrape_avitd()
-        terrible_data = self.scrape_terrible()
-        discord_data = self.scrape_discord_bot()
+    def create_session(self) -> requests.Session:
+        """Create the keep-alive session shared by all sources, with retries and backoff."""
+        retry = Retry(
+            total=SCRAPER_RETRIES,
+            backoff_factor=SCRAPER_BACKOFF,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({"GET"}),
+        )
+        adapter = HTTPAdapter(pool_connections=len(SCRAPER_TIMEOUTS), pool_maxsize=len(SCRAPER_TIMEOUTS), max_retries=retry)
+        session = requests.Session()
+        session.headers.update(self.headers)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def fetch(self, source: str, url: str) -> CachedResponse:
+        """
+        GET a source conditionally through the shared session, using the source's timeout.
+
+        Records in self.changed whether the source differs from its cached copy.
+
+        Raises:
+            requests.RequestException: If the request still fails after the retries, or the
+                response is an HTTP error.
+        """
+        started = time.perf_counter()
+        response = self.http_cache.get(self.session, url, timeout=SCRAPER_TIMEOUTS[source])
+        self.changed[source] = response.changed
+        logging.debug(f"{source} responded {response.status_code} in {time.perf_counter() - started:.2f}s"
+                      f"{'' if response.changed else ' (unchanged)'}")
+        return response
+
+    def cached_parse(self, source: str, response: CachedResponse):
+        """Return the previous parse of a source if its response is unchanged, else None."""
+        if not response.changed and source in self.parsed:
+            logging.info(f"{source} unchanged since the last scrape.")
+            return self.parsed[source]
+        return None
+
+    def forget_responses(self) -> None:
+        """Make the next scrape fetch, parse and write every source again instead of trusting the cache."""
+        for url in (self.avitd_url, self.terrible_url, self.discord_bot_url):
+            self.http_cache.invalidate(url)
+        self.parsed.clear()
+
+    def close(self) -> None:
+        """Close the pooled connections."""
+        self.session.close()
+
+    def scrape(self, cancelled: threading.Event | None = None) -> dict:
+        """
+        Fetch every source concurrently, merge them and write guilds and shops to the database.
+
+        Args:
+            cancelled (threading.Event | None): Once set, the scrape returns {} within
+                SCRAPER_CANCEL_POLL seconds and writes nothing. Requests in flight are abandoned;
+                the next scrape waits for them before it starts.
+
+        Returns:
+            dict: "guilds" and/or "shops" -> LocationChanges, for the tables where something changed.
+        """
+        sources = {
+            "AVITD": self.scrape_avitd,
+            "Terrible": self.scrape_terrible,
+            "Discord": self.scrape_discord_bot,
+        }
+        results = {}
+        if self._abandoned:
+            # Requests of a cancelled scrape must not record their changes into this one, nor leave
+            # responses in the cache that were never written
+            concurrent.futures.wait(self._abandoned)
+            self._abandoned = []
+            self.forget_responses()
+        self.changed = {source: True for source in sources}  # A failed source counts as changed
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=len(sources), thread_name_prefix="Scraper")
+        try:
+            futures = {executor.submit(scrape_source): source for source, scrape_source in sources.items()}
+            pending = set(futures)
+            while pending:
+                if cancelled is not None and cancelled.is_set():
+                    self._abandoned = list(pending)
+                    self.forget_responses()
+                    logging.info(f"Scrape cancelled with {len(pending)} sources still fetching; database left as is.")
+                    return {}
+                finished, pending = concurrent.futures.wait(pending, timeout=SCRAPER_CANCEL_POLL,
+                                                            return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in finished:
+                    source = futures[future]
+                    results[source] = future.result()
+                    self.progress.emit(source, len(results), len(sources))
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        if cancelled is not None and cancelled.is_set():
+            self.forget_responses()
+            logging.info("Scrape cancelled; database left as is.")
+            return {}
+
+        if not any(self.changed.values()):
+            logging.info("No source changed since the last scrape; database left as is.")
+            return {}
+
+        avitd_data, guilds_next, shops_next = results["AVITD"]
+        terrible_data = results["Terrible"]
+        discord_data = results["Discord"]
 
         # Chain merge Discord → Terrible → AVITD for both guilds and shops
         combined_guilds = self.merge_data(terrible_data["guilds"], discord_data["guilds"], source_a="Terrible", source_b="Discord")
@@ -24,12 +221,20 @@ class Scraper:
         combined_shops = self.merge_data(terrible_data["shops"], discord_data["shops"], source_a="Terrible", source_b="Discord")
         final_shops = self.merge_data(avitd_data["shops"], combined_shops, source_a="AVITD", source_b="Terrible/Discord")
 
-        self.update_database(final_guilds, "guilds", guilds_next)
-        self.update_database(final_shops, "shops", shops_next)
+        changes = {
+            "guilds": self.update_database(final_guilds, "guilds", guilds_next),
+            "shops": self.update_database(final_shops, "shops", shops_next),
+        }
+        if None in changes.values():
+            self.forget_responses()
+        return {table: table_changes for table, table_changes in changes.items() if table_changes}
 
     def scrape_avitd(self):
         try:
-            response = requests.get(self.avitd_url, headers=self.headers)
+            response = self.fetch("AVITD", self.avitd_url)
+            cached = self.cached_parse("AVITD", response)
+            if cached is not None:
+                return cached
             soup = BeautifulSoup(response.text, 'html.parser')
         except Exception as e:
             logging.error(f"AVITD fetch failed: {e}")
@@ -41,10 +246,11 @@ class Scraper:
         shops_next = self.extract_next_update_time(soup, 'Shops')
 
         logging.info(f"AVITD provided {len(guilds)} guilds and {len(shops)} shops.")
-        return {
+        self.parsed["AVITD"] = {
             'guilds': {self.normalize_name(name): (col, row) for name, col, row in guilds},
             'shops': {self.normalize_name(name): (col, row) for name, col, row in shops}
         }, guilds_next, shops_next
+        return self.parsed["AVITD"]
 
     def scrape_section(self, soup, alt_text):
         section = soup.find('img', alt=alt_text)
@@ -77,7 +283,10 @@ class Scraper:
 
     def scrape_terrible(self):
         try:
-            response = requests.get(self.terrible_url, timeout=10)
+            response = self.fetch("Terrible", self.terrible_url)
+            cached = self.cached_parse("Terrible", response)
+            if cached is not None:
+                return cached
             data = response.json()
         except Exception as e:
             logging.error(f"Terrible API fetch failed: {e}")
@@ -107,11 +316,15 @@ class Scraper:
                 shops[self.normalize_name(base_name)] = (column, row)
 
         logging.info(f"Terrible API provided {len(guilds)} guilds and {len(shops)} shops.")
-        return {'guilds': guilds, 'shops': shops}
+        self.parsed["Terrible"] = {'guilds': guilds, 'shops': shops}
+        return self.parsed["Terrible"]
 
     def scrape_discord_bot(self):
         try:
-            response = requests.get(self.discord_bot_url, timeout=10)
+            response = self.fetch("Discord", self.discord_bot_url)
+            cached = self.cached_parse("Discord", response)
+            if cached is not None:
+                return cached
             data = response.json()
         except Exception as e:
             logging.error(f"Discord bot API fetch failed: {e}")
@@ -128,7 +341,8 @@ class Scraper:
             shops[norm_name] = (coord["column"], coord["row"])
 
         logging.info(f"Discord bot provided {len(guilds)} guilds and {len(shops)} shops.")
-        return {'guilds': guilds, 'shops': shops}
+        self.parsed["Discord"] = {'guilds': guilds, 'shops': shops}
+        return self.parsed["Discord"]
 
     def normalize_name(self, name):
         """Standardizes building names by fixing known typos and stripping formatting."""
@@ -155,66 +369,49 @@ class Scraper:
                 logging.debug(f"Using {source_b} data for {key}: {b_dict[key]}")
         return merged
 
-    def update_database(self, merged_dict, table, next_update):
+    def update_database(self, merged_dict, table, next_update) -> LocationChanges | None:
+        """
+        Write the merged locations of a table, touching only the entries whose location changed.
+
+        Compares the merged locations with the table and applies the added, moved and removed
+        entries (removed ones are set to 'NA') with a single executemany. next_update and
+        last_scraped are then set for the whole table, all in one transaction.
+
+        Returns:
+            LocationChanges | None: What changed, or None if the write failed.
+        """
         scrape_time = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+
+        located = {}
+        for name, (col, row) in merged_dict.items():
+            if table == "shops" and "Peacekeepers Mission" in name:
+                logging.warning(f"Skipping {name} as it belongs in guilds, not shops.")
+                continue
+            located[self.normalize_name(name)] = (col, row)
+        if table == "guilds":
+            located.update(self.PEACEKEEPERS_MISSIONS)  # Never reported by the sources
+
         try:
-            with sqlite3.connect(DB_PATH) as conn:
-                cursor = conn.cursor()
-
-                # Reset existing entries
-                if table == "guilds":
-                    cursor.execute(f"""
-                        UPDATE {table}
-                        SET `Column`='NA', `Row`='NA', `next_update`=?, `last_scraped`=?
-                        WHERE Name NOT LIKE 'Peacekeepers Mission%'
-                    """, (next_update, scrape_time))
-                else:
-                    cursor.execute(f"""
-                        UPDATE {table}
-                        SET `Column`='NA', `Row`='NA', `next_update`=?, `last_scraped`=?
-                    """, (next_update, scrape_time))
-
-                # Insert or update entries in sorted order
-                for name in sorted(merged_dict):
-                    if table == "shops" and "Peacekeepers Mission" in name:
-                        logging.warning(f"Skipping {name} as it belongs in guilds, not shops.")
-                        continue
-
-                    col, row = merged_dict[name]
-                    norm_name = self.normalize_name(name)
-                    cursor.execute(f"""
-                        INSERT INTO {table} (Name, `Column`, `Row`, `next_update`, `last_scraped`)
-                        VALUES (?, ?, ?, ?, ?)
-                        ON CONFLICT(Name) DO UPDATE SET
-                            `Column`=excluded.`Column`,
-                            `Row`=excluded.`Row`,
-                            `next_update`=excluded.`next_update`,
-                            `last_scraped`=excluded.`last_scraped`
-                    """, (norm_name, col, row, next_update, scrape_time))
-
-                # Manually insert Peacekeepers if in guilds
-                if table == "guilds":
-                    cursor.executemany(f"""
-                        INSERT INTO {table} (Name, `Column`, `Row`, `next_update`, `last_scraped`)
-                        VALUES (?, ?, ?, ?, ?)
-                        ON CONFLICT(Name) DO UPDATE SET
-                            `Column`=excluded.`Column`,
-                            `Row`=excluded.`Row`,
-                            `next_update`=excluded.`next_update`,
-                            `last_scraped`=excluded.`last_scraped`
-                    """, [
-                        ("Peacekeepers Mission 1", "Emerald", "67th", next_update, scrape_time),
-                        ("Peacekeepers Mission 2", "Unicorn", "33rd", next_update, scrape_time),
-                        ("Peacekeepers Mission 3", "Emerald", "33rd", next_update, scrape_time),
-                    ])
-
-                conn.commit()
-                logging.info(f"{table.capitalize()} table updated with {len(merged_dict)} entries.")
+            with db_writer() as conn:
+                current = {
+                    name: (col, row)
+                    for name, col, row in conn.execute(f"SELECT Name, `Column`, `Row` FROM {table}")
+                }
+                changes = LocationChanges.between(table, current, located)
+                conn.executemany(f"""
+                    INSERT INTO {table} (Name, `Column`, `Row`, `next_update`, `last_scraped`)
+                    VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT(Name) DO UPDATE SET
+                        `Column`=excluded.`Column`,
+                        `Row`=excluded.`Row`
+                """, [(name, col, row, next_update, scrape_time) for name, (col, row) in changes.writes()])
+                conn.execute(f"UPDATE {table} SET `next_update`=?, `last_scraped`=?", (next_update, scrape_time))
 
         except sqlite3.Error as e:
             logging.error(f"Failed to update database: {e}")
+            return None
 
-    def close_connection(self):
-        if self.connection:
-            self.connection.close()
-            logging.info("Database connection closed.")
\ No newline at end of file
+        logging.info(f"{table.capitalize()} table updated. {changes.summary()}")
+        for line in changes.details():
+            logging.debug(line)
+        return changes
@@ -1,5 +1,8 @@
 from imports import *
 from constants import *
+from db_connection import *
+from write_behind import *
+from splash import *
 
 class SetDestinationDialog(QDialog):
     """Dialog for setting a destination on the map."""
@@ -98,7 +101,7 @@ class SetDestinationDialog(QDialog):
         button_layout = QGridLayout()
         set_btn = QPushButton("Set")
         clear_btn = QPushButton("Clear")
-        update_btn = QPushButton("Update Data")
+        self.update_btn = update_btn = QPushButton("Update Data")
         cancel_btn = QPushButton("Cancel")
         button_layout.addWidget(set_btn, 0, 0)
         button_layout.addWidget(clear_btn, 0, 1)
@@ -132,6 +135,17 @@ class SetDestinationDialog(QDialog):
         self.countdown_timer.timeout.connect(self.update_countdown_labels)
         self.countdown_timer.start(1000)
 
+        # Refreshes run in the background; follow them so the dropdowns stay current
+        self._notify_scrape_result = False
+        if self.parent:
+            worker = cast("MainWindowType", self.parent).scrape_worker
+            worker.started.connect(self._on_scrape_started)
+            worker.progress.connect(self._on_scrape_progress)
+            worker.finished.connect(self._on_scrape_finished)
+            self.finished.connect(self._stop_following_scrapes)
+            if worker.running:
+                self._on_scrape_started()
+
     def _populate_initial_dropdowns(self) -> None:
         """Populate predefined destination dropdowns with initial data."""
         if not self.parent:
@@ -166,26 +180,23 @@ class SetDestinationDialog(QDialog):
             return
 
         character_id = parent.selected_character.get('id')
+        write_behind_queue().flush()  # Include destinations that are still queued
 
         try:
-            with sqlite3.connect(DB_PATH) as conn:
+            with db_reader() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     "SELECT col, row FROM recent_destinations WHERE character_id = ? ORDER BY timestamp DESC LIMIT 10",
                     (character_id,)
                 )
 
-                # Create inverse mappings (coord → name)
-                inverse_columns = {v: k for k, v in parent.columns.items()}
-                inverse_rows = {v: k for k, v in parent.rows.items()}
-
                 for col, row in cursor.fetchall():
                     # Round down to nearest even coordinate for label mapping
                     even_col = col - (col % 2)
                     even_row = row - (row % 2)
 
-                    col_name = inverse_columns.get(even_col, f"Column {even_col}")
-                    row_name = inverse_rows.get(even_row, f"Row {even_row}")
+                    col_name = parent.street_index.column_name(even_col) or f"Column {even_col}"
+                    row_name = parent.street_index.row_name(even_row) or f"Row {even_row}"
                     building_name = self._get_building_name(cursor, col_name, row_name)
 
                     display = f"{col_name} & {row_name}" + (f" - {building_name}" if building_name else "")
@@ -212,65 +223,52 @@ class SetDestinationDialog(QDialog):
         dropdown.addItems([str(item) for item in items])
         logging.debug(f"Populated dropdown with {len(items)} items")
 
-    def update_combo_boxes(self):
+    def update_combo_boxes(self) -> None:
+        """Start refreshing shop and guild data. The dropdowns are repopulated when it finishes."""
+        if not self.parent:
+            logging.warning("No parent found; cannot update combo boxes.")
+            return
+
         logging.info("Updating combo boxes.")
-        self.show_notification("Updating Shop and Guild Data. Please wait...")
+        self._notify_scrape_result = True
+        cast("MainWindowType", self.parent).scrape_worker.refresh()
+
+    def _stop_following_scrapes(self) -> None:
+        """Disconnect from the scrape worker once the dialog is closed; the window keeps the dialog alive."""
+        worker = cast("MainWindowType", self.parent).scrape_worker
+        worker.started.disconnect(self._on_scrape_started)
+        worker.progress.disconnect(self._on_scrape_progress)
+        worker.finished.disconnect(self._on_scrape_finished)
+
+    def _on_scrape_started(self) -> None:
+        self.update_btn.setEnabled(False)
+        self.update_btn.setText("Updating...")
+
+    def _on_scrape_progress(self, source: str, done: int, total: int) -> None:
+        self.update_btn.setText(f"Updating... {done}/{total}")
+
+    def _on_scrape_finished(self, changes: dict) -> None:
+        """Repopulate the dropdowns after a refresh. The main window has already reloaded the data."""
+        self.update_btn.setEnabled(True)
+        self.update_btn.setText("Update Data")
+        parent = cast("MainWindowType", self.parent)
 
         try:
-            if not self.parent:
-                logging.warning("No parent found; cannot update combo boxes.")
-                return
-
-            parent = cast("MainWindowType", self.parent)
-
-            # Run scraper to update shops and guilds
-            parent.scraper.scrape()
             self.load_next_move_times()
-
-            # Update only shops and guilds coordinates from database
-            with sqlite3.connect(DB_PATH) as conn:
-                cursor = conn.cursor()
-
-                # Fetch columns and rows for coordinate conversion
-                cursor.execute("SELECT `Name`, `Coordinate` FROM `columns`")
-                columns = {row[0]: row[1] for row in cursor.fetchall()}
-                cursor.execute("SELECT `Name`, `Coordinate` FROM `rows`")
-                rows = {row[0]: row[1] for row in cursor.fetchall()}
-
-                def to_coords(col_name: str, row_name: str) -> tuple[int, int]:
-                    return (columns.get(col_name, 0) + 1, rows.get(row_name, 0) + 1)
-
-                # Update shops_coordinates
-                cursor.execute("SELECT Name, `Column`, `Row` FROM shops")
-                parent.shops_coordinates = {
-                    name: to_coords(col, row)
-                    for name, col, row in cursor.fetchall()
-                    if col != "NA" and row != "NA"
-                }
-
-                # Update guilds_coordinates
-                cursor.execute("SELECT Name, `Column`, `Row` FROM guilds")
-                parent.guilds_coordinates = {
-                    name: to_coords(col, row)
-                    for name, col, row in cursor.fetchall()
-                    if col != "NA" and row != "NA"
-                }
-
-            # Populate dropdowns
-            self.populate_dropdown(self.tavern_dropdown, parent.taverns_coordinates.keys())
-            self.populate_dropdown(self.bank_dropdown, parent.banks_coordinates.keys())
-            self.populate_dropdown(self.transit_dropdown, parent.transits_coordinates.keys())
-            self.populate_dropdown(self.shop_dropdown, parent.shops_coordinates.keys())
-            self.populate_dropdown(self.guild_dropdown, parent.guilds_coordinates.keys())
-            self.populate_dropdown(self.poi_dropdown, parent.places_of_interest_coordinates.keys())
-            self.populate_dropdown(self.user_building_dropdown, parent.user_buildings_coordinates.keys())
-
-            parent.update_minimap()
+            if changes:
+                self.populate_dropdown(self.shop_dropdown, parent.shops_coordinates.keys())
+                self.populate_dropdown(self.guild_dropdown, parent.guilds_coordinates.keys())
             logging.info("Combo boxes updated successfully.")
-
         except Exception as e:
             logging.error(f"Failed to update Combo boxes: {e}")
             self.show_error_dialog("Update Failed", str(e))
+            return
+
+        if self._notify_scrape_result:
+            self._notify_scrape_result = False
+            self.show_notification("\n".join(
+                table_changes.summary() for table_changes in changes.values()
+            ) or "No shops or guilds have moved.")
 
     def show_notification(self, message: str) -> None:
         """Show a temporary notification."""
@@ -300,13 +298,12 @@ class SetDestinationDialog(QDialog):
         character_id = parent.selected_character['id']
 
         try:
-            with sqlite3.connect(DB_PATH) as conn:
+            with db_writer() as conn:
                 cursor = conn.cursor()
                 cursor.execute("DELETE FROM destinations WHERE character_id = ?", (character_id,))
-                conn.commit()
 
             parent.destination = None
-            parent.update_minimap()
+            parent.update_minimap("destination")
             logging.info(f"Cleared destination for character {character_id}")
             self.accept()
 
@@ -334,21 +331,20 @@ class SetDestinationDialog(QDialog):
         character_id = parent.selected_character['id']
 
         try:
-            with sqlite3.connect(DB_PATH) as conn:
+            with db_writer() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
                     INSERT OR REPLACE INTO destinations (character_id, col, row, timestamp)
                     VALUES (?, ?, ?, datetime('now'))
                 """, (character_id, coords[0], coords[1]))
 
-                conn.commit()
 
             # ✅ Save to recent using centralized logic
             parent.save_to_recent_destinations(character_id, coords[0], coords[1])
 
             # ✅ Reload destination from DB to sync to current character context
             parent.load_last_destination_for_character(character_id)
-            parent.update_minimap()
+            parent.update_minimap("destination")
             logging.info(f"Set destination for character {character_id} to {coords}")
             self.accept()
 
@@ -437,7 +433,7 @@ class SetDestinationDialog(QDialog):
 
     def load_next_move_times(self):
         try:
-            with sqlite3.connect(DB_PATH) as conn:
+            with db_reader() as conn:
                 cursor = conn.cursor()
 
                 cursor.execute(
@@ -0,0 +1,156 @@
+from core_imports import *
+from constants import *
+from db_connection import *
+from write_behind import *
+
+# -----------------------
+# Settings Store
+# -----------------------
+
+class Settings(QObject):
+    """
+    In-memory copy of the settings table with typed access and change notifications.
+
+    The whole table is read once, on first use, and every read after that is served from memory.
+    Changes are applied in memory straight away, written to the database through the write-behind
+    queue and announced with the changed signal plus the setting's own <name>_changed signal, so
+    windows and dialogs can react without querying the database again.
+    """
+
+    # Known settings: name -> (type, default)
+    SCHEMA = {
+        'keybind_config': (int, 1),  # 0=Off, 1=WASD, 2=Arrow keys
+        'css_profile': (str, 'Default'),
+        'minimap_zoom': (int, 3),
+        'log_level': (int, DEFAULT_LOG_LEVEL),
+    }
+
+    changed = pyqtSignal(str, object)  # setting name, new value
+    keybind_config_changed = pyqtSignal(int)
+    css_profile_changed = pyqtSignal(str)
+    minimap_zoom_changed = pyqtSignal(int)
+    log_level_changed = pyqtSignal(int)
+
+    def __init__(self, manager: ConnectionManager, write_queue: WriteBehindQueue, parent: QObject | None = None) -> None:
+        """
+        Args:
+            manager (ConnectionManager): Connections used to load the settings table.
+            write_queue (WriteBehindQueue): Queue that persists changes.
+            parent (QObject | None): Qt parent.
+        """
+        super().__init__(parent)
+        self.manager = manager
+        self.write_queue = write_queue
+        self._values = {}
+        self._loaded = False
+
+    def load(self) -> bool:
+        """
+        (Re)load the whole settings table into memory.
+
+        Returns:
+            bool: True on success. On failure reads fall back to defaults and the next read retries.
+        """
+        try:
+            rows = self.manager.reader().execute("SELECT setting_name, setting_value FROM settings").fetchall()
+        except sqlite3.Error as e:
+            logging.error(f"Failed to load settings: {e}")
+            return False
+
+        self._values = {name: self._coerce(name, value) for name, value in rows}
+        self._loaded = True
+        logging.debug(f"Loaded {len(self._values)} settings")
+        return True
+
+    def get(self, name: str, default=None):
+        """
+        Return a setting, converted to its SCHEMA type.
+
+        Args:
+            name (str): Setting name.
+            default: Returned if the setting is not stored. Defaults to the SCHEMA default.
+        """
+        if not self._loaded:
+            self.load()
+        if name in self._values:
+            return self._values[name]
+        if default is None and name in self.SCHEMA:
+            return self.SCHEMA[name][1]
+        return default
+
+    def set(self, name: str, value) -> None:
+        """Change a setting in memory, queue the database write and emit the change signals if it changed."""
+        value = self._coerce(name, value)
+        if self.get(name) == value and name in self._values:
+            return
+
+        self._values[name] = value
+        self.write_queue.execute("""
+            INSERT INTO settings (setting_name, setting_value)
+            VALUES (?, ?)
+            ON CONFLICT(setting_name) DO UPDATE SET setting_value = excluded.setting_value
+        """, (name, value if isinstance(value, (int, float, bytes)) else str(value)), key=('settings', name))
+        logging.debug(f"Setting '{name}' changed to {value!r}")
+
+        self.changed.emit(name, value)
+        signal = getattr(self, f"{name}_changed", None)
+        if signal is not None:
+            signal.emit(value)
+
+    def _coerce(self, name: str, value):
+        """Convert a stored or assigned value to the SCHEMA type of the setting, if it has one."""
+        if name not in self.SCHEMA or value is None:
+            return value
+        kind, default = self.SCHEMA[name]
+        try:
+            return kind(value.decode('utf-8') if isinstance(value, bytes) else value)
+        except (TypeError, ValueError):
+            logging.warning(f"Invalid value {value!r} for setting '{name}'; using {default!r}")
+            return default
+
+    # -----------------------
+    # Typed Accessors
+    # -----------------------
+
+    @property
+    def keybind_config(self) -> int:
+        return self.get('keybind_config')
+
+    @keybind_config.setter
+    def keybind_config(self, mode: int) -> None:
+        self.set('keybind_config', mode)
+
+    @property
+    def css_profile(self) -> str:
+        return self.get('css_profile')
+
+    @css_profile.setter
+    def css_profile(self, profile: str) -> None:
+        self.set('css_profile', profile)
+
+    @property
+    def minimap_zoom(self) -> int:
+        return self.get('minimap_zoom')
+
+    @minimap_zoom.setter
+    def minimap_zoom(self, zoom_level: int) -> None:
+        self.set('minimap_zoom', zoom_level)
+
+    @property
+    def log_level(self) -> int:
+        return self.get('log_level')
+
+    @log_level.setter
+    def log_level(self, level: int) -> None:
+        self.set('log_level', level)
+
+
+_settings = None
+
+
+def app_settings() -> Settings:
+    """Return the shared Settings store for DB_PATH, creating it on first use."""
+    global _settings
+    if _settings is None:
+        _settings = Settings(connection_manager(), write_behind_queue())
+    return _settings
@@ -1,5 +1,8 @@
 from imports import *
 from constants import *
+from db_connection import *
+from write_behind import *
+from splash import *
 
 class ShoppingListTool(QDialog):
     """Tool for managing a character’s shopping list with SQLite-backed shop data."""
@@ -14,8 +17,10 @@ class ShoppingListTool(QDialog):
         self.list_total = 0
         self.next_shop_update = None
 
+        write_behind_queue(self.DB_PATH).flush()  # Coin balances may still be queued
+
         try:
-            self.sqlite_connection = sqlite3.connect(self.DB_PATH)
+            self.sqlite_connection = connection_manager(self.DB_PATH).reader()
             self.sqlite_cursor = self.sqlite_connection.cursor()
         except sqlite3.Error as e:
             logging.error(f"Failed to connect to database: {e}")
@@ -236,7 +241,7 @@ class ShoppingListTool(QDialog):
 
     def load_shop_move_time(self):
         try:
-            with sqlite3.connect(self.DB_PATH) as conn:
+            with connection_manager(self.DB_PATH).reader() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     "SELECT next_update FROM shops WHERE next_update IS NOT NULL ORDER BY next_update ASC LIMIT 1"
@@ -264,10 +269,11 @@ class ShoppingListTool(QDialog):
         self.shop_countdown_label.setText(text)
 
     def closeEvent(self, event) -> None:
-        if self.sqlite_connection:
+        # The connection is shared with the rest of the app, so only this tool's cursor is closed
+        if self.sqlite_cursor:
             try:
-                self.sqlite_connection.close()
-                logging.debug("SQLite connection closed")
+                self.sqlite_cursor.close()
+                logging.debug("SQLite cursor closed")
             except sqlite3.Error as e:
-                logging.error(f"Failed to close connection: {e}")
+                logging.error(f"Failed to close cursor: {e}")
         event.accept()
\ No newline at end of file
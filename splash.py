@@ -7,7 +7,14 @@ from imports import *
 if TYPE_CHECKING:
     class AVITDScraper:
         def scrape_guilds_and_shops(self) -> None: ...
-        def close_connection(self) -> None: ...
+
+
+    class ScrapeWorker(QObject):
+        started: pyqtSignal
+        progress: pyqtSignal
+        finished: pyqtSignal
+        running: bool
+        def refresh(self) -> bool: ...
 
 
     class MainWindowType(QWidget):
@@ -16,8 +23,10 @@ if TYPE_CHECKING:
         destination: tuple[int, int] | None
         website_frame: QWebEngineView
         AVITD_scraper: AVITDScraper
+        scrape_worker: ScrapeWorker
         def apply_custom_css(self, css: str) -> None: ...
-        def update_minimap(self) -> None: ...
+        def update_minimap(self, reason: str = "update") -> None: ...
+        def refresh_shops_and_guilds(self, changes: dict | None = None) -> None: ...
 
         columns: dict[str, int]
         rows: dict[str, int]
@@ -130,16 +139,7 @@ class SplashScreen(QSplashScreen):
         self.showMessage(f"Startup script: {message} loading...", Qt.AlignBottom | Qt.AlignHCenter, Qt.white)
         QApplication.processEvents()
 
-# -----------------------
-# Splash Messages Decorator
-# -----------------------
-
-def splash_message(splash):
-    def decorator(func):
-        def wrapper(self, *args, **kwargs):
-            if splash and not splash.isHidden():
-                splash.show_message(func.__name__)  # Show the original method name
-            return func(self, *args, **kwargs)
-        wrapper.__name__ = func.__name__  # Preserve the original method name
-        return wrapper
-    return decorator
\ No newline at end of file
+    def show_stage_timing(self, stage, duration_ms):
+        # noinspection PyUnresolvedReferences
+        self.showMessage(f"Startup script: {stage} done in {duration_ms:.0f} ms", Qt.AlignBottom | Qt.AlignHCenter, Qt.white)
+        QApplication.processEvents()
@@ -0,0 +1,206 @@
+from imports import *
+from constants import *
+
+# -----------------------
+# Startup Pipeline
+# -----------------------
+
+@dataclass
+class StartupStage:
+    """One step of application startup and its timing."""
+
+    name: str
+    run: object  # Callable taking no arguments
+    depends_on: tuple = ()
+    background: bool = False  # Run on a worker thread; must not create or touch widgets
+    deferred: bool = False  # Run after the main window has been painted for the first time
+    blocking: bool = True  # Background only: False lets startup finish without waiting for it
+    started: float | None = None  # perf_counter() when the stage started
+    finished: float | None = None  # perf_counter() when the stage finished
+    thread: str = ""
+
+    @property
+    def duration_ms(self) -> float:
+        if self.started is None or self.finished is None:
+            return 0.0
+        return (self.finished - self.started) * 1000
+
+
+class StartupPipeline(QObject):
+    """
+    Runs startup stages in dependency order, overlapping background stages with GUI work.
+
+    Stages are split into two phases. run() executes every stage that is not deferred and returns
+    once they are done, so the window can be shown; run_deferred() then executes the deferred
+    stages, typically from a zero-delay timer after the first paint.
+
+    GUI stages run on the calling thread in the order they were added, as soon as their
+    dependencies are met. Background stages are handed to a thread pool the moment their
+    dependencies are met, so loading data, cookies and images overlaps with building widgets.
+    While the GUI thread waits for a background stage it keeps processing events so the splash
+    screen stays responsive.
+    """
+
+    stage_started = pyqtSignal(str)  # stage name
+    stage_finished = pyqtSignal(str, float)  # stage name, duration in milliseconds
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self.stages = {}  # name -> StartupStage, in the order they were added
+        self.created = time.perf_counter()
+
+    def add(self, name: str, run, depends_on: tuple = (), background: bool = False,
+            deferred: bool = False, blocking: bool = True) -> None:
+        """
+        Register a stage.
+
+        Args:
+            name (str): Unique stage name, shown on the splash screen and in the timing report.
+            run (callable): Called without arguments to perform the stage.
+            depends_on (tuple): Names of stages that must finish first. Deferred stages may depend
+                on any stage; other stages may only depend on stages that are not deferred.
+            background (bool): Run on a worker thread.
+            deferred (bool): Run in run_deferred() instead of run().
+            blocking (bool): For background stages, whether the phase waits for the stage to finish.
+                Nothing may depend on a non-blocking stage.
+        """
+        if name in self.stages:
+            raise ValueError(f"Duplicate startup stage '{name}'")
+        self.stages[name] = StartupStage(name, run, tuple(depends_on), background, deferred, blocking)
+
+    def run(self) -> None:
+        """Run every stage that is not deferred, returning once all blocking stages have finished."""
+        self._run_phase([stage for stage in self.stages.values() if not stage.deferred])
+
+    def run_deferred(self) -> None:
+        """Run the deferred stages. Call after run(), once the window has been painted."""
+        self._run_phase([stage for stage in self.stages.values() if stage.deferred])
+
+    # -----------------------
+    # Scheduling
+    # -----------------------
+
+    def _validate(self, phase: list) -> None:
+        """Reject unknown, non-blocking, later-phase and circular dependencies before anything runs."""
+        names = {stage.name for stage in phase}
+        for stage in phase:
+            for dependency in stage.depends_on:
+                required = self.stages.get(dependency)
+                if required is None:
+                    raise ValueError(f"Startup stage '{stage.name}' depends on unknown stage '{dependency}'")
+                if not required.blocking:
+                    raise ValueError(f"Startup stage '{stage.name}' depends on non-blocking stage '{dependency}'")
+                if required.deferred and not stage.deferred:
+                    raise ValueError(f"Startup stage '{stage.name}' depends on deferred stage '{dependency}'")
+
+        # Kahn's algorithm over the stages of this phase
+        remaining = {stage.name: {dep for dep in stage.depends_on if dep in names} for stage in phase}
+        while remaining:
+            ready = [name for name, deps in remaining.items() if not deps]
+            if not ready:
+                raise ValueError(f"Circular startup dependencies between: {', '.join(sorted(remaining))}")
+            for name in ready:
+                del remaining[name]
+            for deps in remaining.values():
+                deps.difference_update(ready)
+
+    def _run_phase(self, phase: list) -> None:
+        """Run one phase to completion. A stage that raises stops the phase and the error propagates."""
+        if not phase:
+            return
+        self._validate(phase)
+
+        pending = list(phase)
+        running = {}  # future -> StartupStage
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=STARTUP_WORKERS,
+                                                         thread_name_prefix="Startup")
+        try:
+            while pending or any(running[f].blocking for f in running):
+                # Hand every background stage whose dependencies are met to the pool
+                for stage in [s for s in pending if s.background and self._is_ready(s)]:
+                    pending.remove(stage)
+                    self._mark_started(stage)
+                    running[executor.submit(self._run_background, stage)] = stage
+
+                # Run the first GUI stage whose dependencies are met
+                stage = next((s for s in pending if not s.background and self._is_ready(s)), None)
+                if stage is not None:
+                    pending.remove(stage)
+                    self._mark_started(stage)
+                    stage.thread = threading.current_thread().name
+                    stage.run()
+                    self._mark_finished(stage)
+                elif running:
+                    # Nothing can run here until a background stage finishes
+                    concurrent.futures.wait(running, timeout=0.05, return_when=concurrent.futures.FIRST_COMPLETED)
+                    QApplication.processEvents()
+                elif pending:
+                    raise RuntimeError(f"Startup stages cannot run: {', '.join(s.name for s in pending)}")
+
+                for future in [f for f in running if f.done()]:
+                    stage = running.pop(future)
+                    self._mark_finished(stage, future.result())  # Re-raises the stage's exception here
+
+            # Non-blocking stages keep running; report them when they finish
+            for future, stage in running.items():
+                future.add_done_callback(lambda f, s=stage: self._log_detached(f, s))
+        finally:
+            executor.shutdown(wait=False)
+
+        self.log_report(phase)
+
+    def _is_ready(self, stage: StartupStage) -> bool:
+        return all(self.stages[name].finished is not None for name in stage.depends_on)
+
+    def _run_background(self, stage: StartupStage) -> float:
+        """Worker-thread body of a background stage. Returns its end time, recorded once harvested."""
+        stage.thread = threading.current_thread().name
+        try:
+            stage.run()
+        except Exception:
+            logging.exception(f"Startup stage '{stage.name}' failed")
+            raise
+        return time.perf_counter()
+
+    def _mark_started(self, stage: StartupStage) -> None:
+        stage.started = time.perf_counter()
+        logging.debug(f"Startup stage '{stage.name}' started")
+        self.stage_started.emit(stage.name)
+
+    def _mark_finished(self, stage: StartupStage, finished: float | None = None) -> None:
+        stage.finished = finished if finished is not None else time.perf_counter()
+        logging.debug(f"Startup stage '{stage.name}' finished in {stage.duration_ms:.1f} ms")
+        self.stage_finished.emit(stage.name, stage.duration_ms)
+
+    def _log_detached(self, future: concurrent.futures.Future, stage: StartupStage) -> None:
+        """Log the timing of a non-blocking stage that outlived its phase. Runs on the worker thread."""
+        if future.exception() is None:
+            stage.finished = future.result()
+            logging.info(f"Startup stage '{stage.name}' finished in the background after {stage.duration_ms:.1f} ms")
+
+    # -----------------------
+    # Timing Report
+    # -----------------------
+
+    def report(self, phase: list | None = None) -> str:
+        """
+        Format the timing of the finished stages as a table.
+
+        Offsets are milliseconds since the pipeline was created, so overlapping stages are visible.
+        """
+        stages = [s for s in (phase if phase is not None else self.stages.values()) if s.started is not None]
+        lines = [f"{'Stage':<20} {'Start':>9} {'Duration':>10}  Thread"]
+        for stage in sorted(stages, key=lambda s: s.started):
+            offset = (stage.started - self.created) * 1000
+            duration = f"{stage.duration_ms:.1f}" if stage.finished is not None else "running"
+            lines.append(f"{stage.name:<20} {offset:>9.1f} {duration:>10}  {stage.thread}")
+        return "\n".join(lines)
+
+    def elapsed_ms(self) -> float:
+        """Milliseconds from creating the pipeline to the end of the last finished stage."""
+        finished = [s.finished for s in self.stages.values() if s.finished is not None]
+        return (max(finished) - self.created) * 1000 if finished else 0.0
+
+    def log_report(self, phase: list | None = None) -> None:
+        """Write the timing report to the log."""
+        logging.info(f"Startup timing ({self.elapsed_ms():.1f} ms since start):\n{self.report(phase)}")
@@ -0,0 +1,51 @@
+from core_imports import *
+
+# -----------------------
+# Street Name Reverse Index
+# -----------------------
+
+class StreetIndex:
+    """
+    Reverse lookup from grid coordinates to street names.
+
+    The `columns` and `rows` tables map street names to coordinates. Drawing the minimap and
+    naming intersections needs the opposite direction for every cell, so the names are stored in
+    lists indexed by coordinate and each lookup is a single list access.
+
+    When several names share a coordinate (e.g. "WCL" and "Western City Limits") the first one
+    loaded wins, matching the order of the source tables.
+    """
+
+    def __init__(self, columns: dict, rows: dict) -> None:
+        """
+        Args:
+            columns (dict): Column street name -> column coordinate.
+            rows (dict): Row street name -> row coordinate.
+        """
+        self._column_names = self._build(columns)
+        self._row_names = self._build(rows)
+
+    @staticmethod
+    def _build(mapping: dict) -> list:
+        """Turn a name -> coordinate mapping into a list of names indexed by coordinate."""
+        coordinates = [coord for coord in mapping.values() if isinstance(coord, int) and coord >= 0]
+        names = [None] * (max(coordinates, default=-1) + 1)
+        for name, coord in mapping.items():
+            if isinstance(coord, int) and coord >= 0 and names[coord] is None:
+                names[coord] = name
+        return names
+
+    @staticmethod
+    def _lookup(names: list, coord: int) -> str | None:
+        """Return the name stored at a coordinate, or None when out of range."""
+        if 0 <= coord < len(names):
+            return names[coord]
+        return None
+
+    def column_name(self, x: int) -> str | None:
+        """Return the column street name at coordinate x, if any."""
+        return self._lookup(self._column_names, x)
+
+    def row_name(self, y: int) -> str | None:
+        """Return the row street name at coordinate y, if any."""
+        return self._lookup(self._row_names, y)
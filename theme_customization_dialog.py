@@ -1,5 +1,6 @@
 from imports import *
 from constants import *
+from splash import *
 
 # -----------------------
 # Theme Application
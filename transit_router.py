@@ -0,0 +1,270 @@
+from core_imports import *
+from constants import *
+
+# -----------------------
+# Transit Routing Engine
+# -----------------------
+
+class TransitRouter:
+    """
+    Minimum-AP route finder over the transit network plus walking.
+
+    The graph has a start node, an end node and, for every station, a "board" node and an "alight"
+    node. Walking edges (Chebyshev AP cost) join start to every board node, every alight node to
+    the end, alight nodes to other stations' board nodes (transfers) and start directly to end.
+    Riding edges join each board node to every other station's alight node at TRANSIT_RIDE_AP_COST.
+
+    Splitting each station into board/alight nodes keeps every route an alternation of walk and
+    ride legs, so in a returned path the legs at odd indices (path[1]->path[2], path[3]->path[4],
+    ...) are rides and all others are walks.
+
+    Routes are found with a k-visit Dijkstra: each node may be settled up to k times, which yields
+    the k cheapest routes in order. Paths never revisit a station.
+    """
+
+    START = 0
+    END = 1
+
+    def __init__(self, transits_coordinates: dict, ride_ap_cost: int = TRANSIT_RIDE_AP_COST,
+                 matrix: "TransitCostMatrix | None" = None) -> None:
+        """
+        Args:
+            transits_coordinates (dict): Station name -> (x, y).
+            ride_ap_cost (int): AP cost of a single ride between two stations.
+            matrix (TransitCostMatrix | None): Precomputed walking costs. Costs are computed on the fly without one.
+        """
+        self.ride_ap_cost = ride_ap_cost
+        self.stations = [(name, tuple(coords)) for name, coords in transits_coordinates.items()
+                         if coords is not None and None not in coords]
+        self.matrix = matrix
+
+    @classmethod
+    def from_map_data(cls, columns: dict, rows: dict, transits_coordinates: dict,
+                      cache_path: str = TRANSIT_MATRIX_CACHE_PATH) -> "TransitRouter":
+        """Build a router backed by a TransitCostMatrix, loading the matrix from disk when it is still valid."""
+        router = cls(transits_coordinates)
+        router.matrix = TransitCostMatrix(router.stations, columns, rows, cache_path)
+        return router
+
+    @staticmethod
+    def walk_cost(start: tuple[int, int], end: tuple[int, int]) -> int:
+        """Chebyshev AP cost of walking between two cells."""
+        return max(abs(start[0] - end[0]), abs(start[1] - end[1]))
+
+    def station_name(self, coords: tuple[int, int]) -> str | None:
+        """Return the name of the station at the given coordinates, if any."""
+        return next((name for name, station_coords in self.stations if station_coords == tuple(coords)), None)
+
+    def routes(self, start: tuple[int, int], end: tuple[int, int], k: int = 3) -> list[tuple[int, list]]:
+        """
+        Find the k cheapest routes between two cells, cheapest first.
+
+        The direct walk is one of the candidates, so the first route is the true minimum-AP route
+        whether or not it uses transit.
+
+        Args:
+            start (tuple): Starting (x, y).
+            end (tuple): Destination (x, y).
+            k (int): Maximum number of routes to return.
+
+        Returns:
+            list: (ap_cost, path) tuples, where path is a list of (x, y) waypoints from start to end.
+        """
+        start, end = tuple(start), tuple(end)
+        station_count = len(self.stations)
+        visits = [0] * (2 + 2 * station_count)
+        start_costs, end_costs = self._station_costs(start), self._station_costs(end)
+        routes = []
+
+        # (cost, tie-breaker, node, path of graph nodes, stations already used)
+        heap = [(0, 0, self.START, (self.START,), frozenset())]
+        pushed = 1
+
+        while heap and len(routes) < k:
+            cost, _, node, path, used = heapq.heappop(heap)
+            if visits[node] >= k:
+                continue
+            visits[node] += 1
+
+            if node == self.END:
+                routes.append((cost, self._path_coordinates(path, start, end)))
+                continue
+
+            for next_node, edge_cost, station in self._edges(node, start, end, start_costs, end_costs, used):
+                next_used = used | {station} if station is not None else used
+                heapq.heappush(heap, (cost + edge_cost, pushed, next_node, path + (next_node,), next_used))
+                pushed += 1
+
+        return routes
+
+    def best_transit_route(self, start: tuple[int, int], end: tuple[int, int]) -> tuple[int, list] | None:
+        """
+        Return the cheapest (ap_cost, path) that rides at least once, or None without a usable network.
+
+        Only the direct walk avoids transit, so the answer is always among the two cheapest routes.
+        """
+        return next(((cost, path) for cost, path in self.routes(start, end, 2) if len(path) > 2), None)
+
+    # -----------------------
+    # Graph Helpers
+    # -----------------------
+
+    @staticmethod
+    def _board(index: int) -> int:
+        return 2 + 2 * index
+
+    @staticmethod
+    def _alight(index: int) -> int:
+        return 3 + 2 * index
+
+    def _station_coords(self, node: int) -> tuple[int, int]:
+        return self.stations[(node - 2) // 2][1]
+
+    def _station_costs(self, cell: tuple[int, int]) -> list[int]:
+        """Walking cost from a cell to every station, from the matrix when the cell is on the grid."""
+        if self.matrix is not None:
+            costs = self.matrix.cell_to_stations(cell)
+            if costs is not None:
+                return costs
+        return [self.walk_cost(cell, coords) for _, coords in self.stations]
+
+    def _between(self, first: int, second: int) -> int:
+        """Walking cost between two stations."""
+        if self.matrix is not None:
+            return self.matrix.station_to_station(first, second)
+        return self.walk_cost(self.stations[first][1], self.stations[second][1])
+
+    def _edges(self, node: int, start: tuple, end: tuple, start_costs: list, end_costs: list, used: frozenset):
+        """Yield (next_node, ap_cost, station_index) for every edge leaving a node."""
+        if node == self.START:
+            yield self.END, self.walk_cost(start, end), None
+            for index, cost in enumerate(start_costs):
+                yield self._board(index), cost, index
+            return
+
+        station = (node - 2) // 2
+        if node == self._board(station):
+            for index in range(len(self.stations)):
+                if index not in used:
+                    yield self._alight(index), self.ride_ap_cost, index
+        else:
+            yield self.END, end_costs[station], None
+            for index in range(len(self.stations)):
+                if index not in used:
+                    yield self._board(index), self._between(station, index), index
+
+    def _path_coordinates(self, path: tuple, start: tuple, end: tuple) -> list:
+        """Translate a path of graph nodes into (x, y) waypoints."""
+        coordinates = [start]
+        for node in path[1:-1]:
+            coordinates.append(self._station_coords(node))
+        coordinates.append(end)
+        return coordinates
+
+
+# -----------------------
+# Transit Walking Cost Matrix
+# -----------------------
+
+class TransitCostMatrix:
+    """
+    Precomputed walking AP costs between transit stations and from every city cell to every station.
+
+    These costs only depend on the station and street tables, so they are stored as compact int16
+    arrays in TRANSIT_MATRIX_CACHE_PATH, next to the database, and reloaded on later starts. The
+    file carries a hash of the transit and street tables and is rebuilt when the hash changes.
+    """
+
+    GRID_SIZE = 202  # Coordinates 0..201, city limits included
+    CACHE_VERSION = 1
+
+    def __init__(self, stations: list, columns: dict, rows: dict, cache_path: str = TRANSIT_MATRIX_CACHE_PATH) -> None:
+        """
+        Args:
+            stations (list): (name, (x, y)) for every station, in router index order.
+            columns (dict): Column street name -> coordinate.
+            rows (dict): Row street name -> coordinate.
+            cache_path (str): File used to persist the matrices.
+        """
+        self.cache_path = cache_path
+        self.stations = list(stations)
+        self._signature = self._build_signature(columns, rows)
+        self._station_costs = array.array('h')
+        self._cell_costs = array.array('h')
+
+        if not self._load_cache():
+            self._compute()
+            self._save_cache()
+
+    def station_to_station(self, first: int, second: int) -> int:
+        """Walking AP cost between two stations, by router index."""
+        return self._station_costs[first * len(self.stations) + second]
+
+    def cell_to_stations(self, cell: tuple[int, int]) -> list[int] | None:
+        """Walking AP cost from a cell to every station, or None if the cell is off the grid."""
+        x, y = cell
+        if not (0 <= x < self.GRID_SIZE and 0 <= y < self.GRID_SIZE):
+            return None
+        count = len(self.stations)
+        offset = (x * self.GRID_SIZE + y) * count
+        return self._cell_costs[offset:offset + count].tolist()
+
+    # -----------------------
+    # Construction and Disk Cache
+    # -----------------------
+
+    def _compute(self) -> None:
+        """Fill both matrices from the station coordinates."""
+        coords = [station_coords for _, station_coords in self.stations]
+        self._station_costs = array.array('h', (
+            TransitRouter.walk_cost(first, second) for first in coords for second in coords
+        ))
+        self._cell_costs = array.array('h', (
+            max(abs(sx - x), abs(sy - y))
+            for x in range(self.GRID_SIZE) for y in range(self.GRID_SIZE) for sx, sy in coords
+        ))
+
+    def _build_signature(self, columns: dict, rows: dict) -> str:
+        """Hash the transit and street tables the matrices are derived from."""
+        payload = json.dumps({
+            "version": self.CACHE_VERSION,
+            "size": self.GRID_SIZE,
+            "stations": [[name, list(coords)] for name, coords in self.stations],
+            "columns": sorted(columns.items()),
+            "rows": sorted(rows.items()),
+        }, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _load_cache(self) -> bool:
+        """Load the matrices from disk if the cached signature matches. Returns True on success."""
+        count = len(self.stations)
+        try:
+            with open(self.cache_path, "rb") as cache_file:
+                header = json.loads(cache_file.readline().decode("utf-8"))
+                if header.get("signature") != self._signature:
+                    logging.debug("Transit cost matrix cache is stale; rebuilding")
+                    return False
+
+                station_costs, cell_costs = array.array('h'), array.array('h')
+                station_costs.fromfile(cache_file, count * count)
+                cell_costs.fromfile(cache_file, self.GRID_SIZE * self.GRID_SIZE * count)
+        except FileNotFoundError:
+            return False
+        except (OSError, EOFError, ValueError) as e:
+            logging.warning(f"Failed to read transit cost matrix cache {self.cache_path}: {e}")
+            return False
+
+        self._station_costs, self._cell_costs = station_costs, cell_costs
+        logging.debug(f"Loaded transit cost matrix from {self.cache_path}")
+        return True
+
+    def _save_cache(self) -> None:
+        """Write the matrices and their signature to disk."""
+        try:
+            with open(self.cache_path, "wb") as cache_file:
+                cache_file.write(json.dumps({"signature": self._signature}).encode("utf-8") + b"\n")
+                self._station_costs.tofile(cache_file)
+                self._cell_costs.tofile(cache_file)
+            logging.debug(f"Saved transit cost matrix to {self.cache_path}")
+        except OSError as e:
+            logging.warning(f"Failed to write transit cost matrix cache {self.cache_path}: {e}")
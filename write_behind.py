@@ -0,0 +1,232 @@
+from core_imports import *
+from constants import *
+from db_connection import *
+
+# -----------------------
+# Write-Behind Persistence Queue
+# -----------------------
+
+class WriteBehindQueue:
+    """
+    Background writer that takes database writes off the calling thread.
+
+    Writes are queued and a worker thread applies everything queued within WRITE_BEHIND_FLUSH_INTERVAL
+    in one transaction, so a page load that records coins, cookies and a destination pays for one
+    commit on a background thread instead of several on the GUI thread.
+
+    A write queued with a key replaces any pending write with the same key and moves to the end of
+    the queue. Only use keys for writes that set an absolute value (e.g. "pocket = ?"), so dropping
+    the older write cannot change the result.
+
+    Each write runs inside its own savepoint: a write that fails because of its own data or SQL,
+    e.g. a constraint violation, is rolled back and logged without losing the rest of the batch.
+    A batch that fails for any other reason, e.g. while another process holds the database lock
+    past the busy timeout, is rolled back as a whole, goes back to the front of the queue and is
+    retried with a growing delay.
+    While closing, it is given up after WRITE_BEHIND_CLOSE_ATTEMPTS tries. flush() and close()
+    report False whenever a write was rolled back or given up since the last of them returned.
+    """
+
+    def __init__(self, manager: ConnectionManager, flush_interval: float = WRITE_BEHIND_FLUSH_INTERVAL) -> None:
+        """
+        Args:
+            manager (ConnectionManager): Connections to the database being written.
+            flush_interval (float): Seconds to collect writes before committing them.
+        """
+        self.manager = manager
+        self.flush_interval = flush_interval
+        self._condition = threading.Condition()
+        self._pending = {}  # queue key -> (sequence, operation), in queue order
+        self._submitted = 0  # sequence number of the last queued write
+        self._completed = 0  # every write up to this sequence number has been committed or given up
+        self._failures = 0  # writes rolled back or given up since flush() or close() last returned
+        self._flush_requested = False
+        self._closing = False
+        self._worker = None
+
+    def submit(self, operation, key=None) -> None:
+        """
+        Queue a write.
+
+        Args:
+            operation (callable): Called with the write connection on the worker thread. It must
+                not commit; the queue commits the whole batch.
+            key (hashable | None): Coalescing key, see the class docstring.
+        """
+        with self._condition:
+            self._submitted += 1
+            queue_key = ("key", key) if key is not None else ("seq", self._submitted)
+            self._pending.pop(queue_key, None)
+            self._pending[queue_key] = (self._submitted, operation)
+            self._ensure_worker()
+            self._condition.notify_all()
+
+    def execute(self, sql: str, params: tuple = (), key=None) -> None:
+        """Queue a single SQL statement. See submit()."""
+        self.submit(lambda conn: conn.execute(sql, params), key)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Write everything queued so far now and wait until it is committed.
+
+        Args:
+            timeout (float | None): Maximum seconds to wait, or None to wait as long as it takes.
+
+        Returns:
+            bool: True if every queued write was applied in time.
+        """
+        with self._condition:
+            target = self._submitted
+            if self._completed < target:
+                self._flush_requested = True
+                self._condition.notify_all()
+                if not self._condition.wait_for(lambda: self._completed >= target, timeout):
+                    return False
+            return self._take_failures() == 0
+
+    def close(self, timeout: float | None = None) -> bool:
+        """
+        Flush every queued write and stop the worker thread. Writes queued later start a new worker.
+
+        Returns:
+            bool: True if every queued write was applied in time.
+        """
+        with self._condition:
+            worker = self._worker
+            if worker is None:
+                return self._take_failures() == 0
+            self._closing = True
+            self._condition.notify_all()
+        worker.join(timeout)
+        with self._condition:
+            done = self._completed >= self._submitted
+            failures = self._take_failures() if done else 0
+            if not worker.is_alive():
+                self._worker = None
+                self._closing = False
+        if not done:
+            logging.error("Write-behind queue did not finish writing before the timeout")
+        elif failures:
+            logging.error(f"Write-behind queue stopped; {failures} queued database writes were not applied")
+        else:
+            logging.debug("Write-behind queue flushed and stopped")
+        return done and not failures
+
+    def _take_failures(self) -> int:
+        """Return and reset the number of writes lost since the last call. Called with the condition held."""
+        failures, self._failures = self._failures, 0
+        return failures
+
+    # -----------------------
+    # Worker Thread
+    # -----------------------
+
+    def _ensure_worker(self) -> None:
+        """Start the worker thread if it is not running. Called with the condition held."""
+        if self._worker is None or not self._worker.is_alive():
+            self._closing = False
+            self._worker = threading.Thread(target=self._run, name="WriteBehindQueue", daemon=True)
+            self._worker.start()
+
+    def _run(self) -> None:
+        """Collect writes for up to flush_interval, then commit them as one batch, until closed."""
+        attempts = 0  # Failed commits of the batch at the front of the queue
+        while True:
+            if attempts:
+                time.sleep(min(WRITE_BEHIND_RETRY_DELAY * 2 ** (attempts - 1), WRITE_BEHIND_MAX_RETRY_DELAY))
+
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending or self._closing)
+                if not attempts:
+                    self._condition.wait_for(lambda: self._flush_requested or self._closing, self.flush_interval)
+                batch, self._pending = list(self._pending.items()), {}
+                self._flush_requested = False
+                closing = self._closing
+
+            failed = self._write_batch(batch) if batch else 0
+
+            with self._condition:
+                if failed is None and not (closing and attempts + 1 >= WRITE_BEHIND_CLOSE_ATTEMPTS):
+                    # Retry the batch ahead of newer writes; a key queued again since then keeps its newer write
+                    attempts += 1
+                    restored = {queue_key: write for queue_key, write in batch if queue_key not in self._pending}
+                    restored.update(self._pending)
+                    self._pending = restored
+                    continue
+
+                if failed is None:
+                    logging.error(f"Gave up {len(batch)} queued database writes after {attempts + 1} attempts")
+                    failed = len(batch)
+                attempts = 0
+                self._failures += failed
+                if batch:
+                    self._completed = max(self._completed, batch[-1][1][0])
+                self._condition.notify_all()
+                if closing and not self._pending:
+                    return
+
+    def _write_batch(self, batch: list) -> int | None:
+        """
+        Apply a batch of writes in one transaction, isolating each write in a savepoint.
+
+        Args:
+            batch (list): (queue key, (sequence, operation)) for every write, in queue order.
+
+        Returns:
+            int | None: Number of writes rolled back, or None if the batch was not committed.
+        """
+        failed = 0
+        try:
+            with self.manager.writer() as conn:
+                conn.execute("BEGIN")
+                for _, (_, operation) in batch:
+                    conn.execute("SAVEPOINT write_behind")
+                    try:
+                        operation(conn)
+                    except Exception as e:
+                        if _is_batch_failure(e):
+                            raise  # Not the write's fault; roll back the batch and retry it
+                        failed += 1
+                        conn.execute("ROLLBACK TO write_behind")
+                        logging.error(f"Queued database write failed: {e}")
+                    conn.execute("RELEASE write_behind")
+        except sqlite3.Error as e:
+            logging.error(f"Failed to commit {len(batch)} queued database writes: {e}")
+            return None
+        logging.debug(f"Committed {len(batch) - failed} queued database writes")
+        return failed
+
+
+# SQLite primary result codes that say nothing about the write that raised them: BUSY, LOCKED,
+# NOMEM, READONLY, IOERR, FULL, CANTOPEN and PROTOCOL. The same write can succeed on a retry.
+_BATCH_FAILURE_CODES = {5, 6, 7, 8, 10, 13, 14, 15}
+
+
+def _is_batch_failure(error: Exception) -> bool:
+    """Whether a write failed because of the database rather than its own data or SQL."""
+    if not isinstance(error, sqlite3.OperationalError):
+        return False
+    code = getattr(error, "sqlite_errorcode", None)  # Python 3.11+
+    if code is None:
+        return "locked" in str(error) or "busy" in str(error)
+    return (code & 0xFF) in _BATCH_FAILURE_CODES
+
+
+_queues = {}  # db_path -> WriteBehindQueue
+_queues_lock = threading.Lock()
+
+
+def write_behind_queue(db_path: str = DB_PATH) -> WriteBehindQueue:
+    """Return the shared WriteBehindQueue for a database file, creating it on first use."""
+    with _queues_lock:
+        queue = _queues.get(db_path)
+        if queue is None:
+            queue = _queues[db_path] = WriteBehindQueue(connection_manager(db_path))
+        return queue
+
+
+def close_write_behind_queues(timeout: float | None = None) -> bool:
+    """Flush and stop every write-behind queue, e.g. before the app closes its connections."""
+    with _queues_lock:
+        queues = list(_queues.values())
+    return all([queue.close(timeout) for queue in queues])